@@ -16,10 +16,14 @@ if __name__ == '__main__':
     parser = get_parser()
     args = parser.parse_args()
     try:
-        validate_args(args.input, args.output)
+        validate_args(args.input, args.output, args.jobs)
     except ValueError as exp:
         logger.error(f'Validation error: {exp}')
         sys.exit(1)
     logger.info('Starting processing...')
-    process(args.commands, args.input, args.output)
+    records = process(args.commands, args.input, args.output, args.jobs, not args.no_cache)
+    failed: int = sum(record['status'] != 'OK' for record in records)
+    if failed:
+        logger.error(f'Processing failed for {failed} of {len(records)} files.')
+        sys.exit(1)
     logger.info('Processing completed.')
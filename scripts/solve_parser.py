@@ -80,17 +80,37 @@ def validate_input_path(input_path: Path) -> None:
         raise ValueError(f'Input path {input_path!s} is neither a file nor a directory.')
 
 
-def validate_args(input_path: Path, output_path: Path) -> None:
+def validate_jobs(jobs: int) -> None:
+    """Validate the number of worker processes.
+
+    Args:
+        jobs (int): The number of worker processes.
+
+    Raises:
+        ValueError: If there is not at least one worker process.
+
+    Logs:
+        Logs an error if the number is invalid.
+    """
+    if jobs < 1:
+        logger.error(f'Jobs {jobs} must be at least 1.')
+        raise ValueError(f'Jobs {jobs} must be at least 1.')
+
+
+def validate_args(input_path: Path, output_path: Path, jobs: int = 1) -> None:
     """Validate the input and output arguments.
 
     Args:
         input_path (Path): The input file or directory path.
         output_path (Path): The output directory path.
+        jobs (int): The number of worker processes.
 
     Logs:
         Logs errors if any validation fails.
     """
-    logger.info(f'Validating arguments: input={input_path!s}, output={output_path!s}')
+    logger.info(f'Validating arguments: input={input_path!s}, output={output_path!s}, jobs={jobs}')
+
+    validate_jobs(jobs)
 
     # Validate the output directory
     validate_output_directory(output_path)
@@ -111,7 +131,7 @@ def get_parser() -> argparse.ArgumentParser:
     Returns:
         argparse.ArgumentParser: The configured argument parser.
     """
-    commands = ('schema', 'solve', 'validate', 'problem', 'lp', 'rules')
+    commands = ('schema', 'solve', 'validate', 'verify', 'warm', 'memory', 'problem', 'lp', 'rules')
 
     argument_parser = argparse.ArgumentParser(description='Process some commands.')
 
@@ -127,6 +147,17 @@ def get_parser() -> argparse.ArgumentParser:
         required=True,
         help='The output directory.',
     )
+    argument_parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='The number of worker processes. Each process handles one file at a time.',
+    )
+    argument_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always solve, without reading or writing the solve cache.',
+    )
     argument_parser.add_argument(
         'commands',
         nargs='+',
@@ -1,8 +1,12 @@
 """Process for the solve command."""
-import itertools
 import logging
+import time
+import tracemalloc
+from concurrent.futures import as_completed, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+from src.commands.check_solution_command import CheckSolutionCommand
 from src.commands.command import Command
 from src.commands.extract_answer_command import ExtractAnswerCommand
 from src.commands.file_writer_command import LPFileWriterCommand
@@ -10,7 +14,16 @@ from src.commands.file_writer_command import RuleWriterCommand
 from src.commands.file_writer_command import SVGProblemWriterCommand
 from src.commands.problem import Problem
 from src.commands.validate_config_command import ValidateConfigCommand
+from src.commands.verify_unique_command import VerifyUniqueCommand
+from src.commands.warm_start_command import WarmStartCommand
+from src.solvers.solve_cache import SolveCache
 from src.utils.config import Config
+from src.utils.load_modules import load_modules
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
 
 config: Config = Config()
 logging.config.dictConfig(config.logging)
@@ -34,23 +47,84 @@ def process_schema(problem: Problem) -> None:
     logger.info(f'Schema validation OK for file: {problem.problem_file_name}')
 
 
-def process_solve(problem: Problem) -> None:
+def process_solve(problem: Problem, cache: bool = True) -> None:
     """Process the solve command for the given problem.
 
     Args:
         problem (Problem): The problem instance to process.
+        cache (bool): Answer from, and store into, the solve cache.
     """
-    command: Command = ExtractAnswerCommand()
-    command.execute(problem=problem)
+    if not cache:
+        ExtractAnswerCommand().execute(problem=problem)
+        return
+    with SolveCache() as solve_cache:
+        command: Command = ExtractAnswerCommand(solve_cache)
+        command.execute(problem=problem)
 
 
 def process_validate(problem: Problem) -> None:
-    """Process the validate command for the given problem.
+    """Check the solution of the given problem against its constraints, without a solver.
 
     Args:
         problem (Problem): The problem instance to process.
+
+    Raises:
+        ValueError: If the solution breaks a constraint.
     """
     logger.info(f'Processing validate for file: {problem.problem_file_name} with output: {problem.output_directory}')
+    command: Command = CheckSolutionCommand()
+    command.execute(problem=problem)
+    if problem.violations:
+        raise ValueError(f'{len(problem.violations)} violations, first: {problem.violations[0]}')
+
+
+def process_verify(problem: Problem) -> None:
+    """Count the answers of the given problem, up to the configured limit.
+
+    Args:
+        problem (Problem): The problem instance to process.
+    """
+    command: Command = VerifyUniqueCommand()
+    command.execute(problem=problem)
+    count: int = len(problem.solutions or [])
+    times: str = ', '.join(f'{seconds:.3f}s' for seconds in problem.solve_times or [])
+    logger.info(f'Verify: {count} answers for file: {problem.problem_file_name}, re-solves [{times}]')
+
+
+def process_warm(problem: Problem) -> None:
+    """Solve the given problem cold and from a MIP start, and report the nodes the start saved.
+
+    Args:
+        problem (Problem): The problem instance to process.
+    """
+    command: Command = WarmStartCommand()
+    command.execute(problem=problem)
+    accepted: bool | None = problem.solver.start_accepted if problem.solver is not None else None
+    saved: int | None = problem.nodes_saved
+    logger.info(f'Warm: start accepted {accepted}, {saved} nodes saved for file: {problem.problem_file_name}')
+
+
+def process_memory(problem: Problem) -> None:
+    """Build and render the given problem, and report the memory it took.
+
+    The peak of the memory traced while building and rendering is reported for the problem, and the
+    peak resident set size for the process so far, so running over a directory reports the peak for
+    the whole set. Run it as the first command, so the build is part of the measurement.
+
+    Args:
+        problem (Problem): The problem instance to process.
+    """
+    command: Command = SVGProblemWriterCommand()
+    tracemalloc.start()
+    try:
+        command.execute(problem=problem)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    rss: str = 'unknown'
+    if resource is not None:
+        rss = f'{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB'  # Kilobytes on Linux
+    logger.info(f'Memory: traced peak {peak / 1048576:.1f} MiB, peak RSS {rss} for file: {problem.problem_file_name}')
 
 
 def process_problem(problem: Problem) -> None:
@@ -88,26 +162,31 @@ def process_rules(problem: Problem) -> None:
     logger.info(f'Processing rules complete for file: {problem.problem_file_name}')
 
 
-def process_command(command: str, input_file: Path, output_path: Path) -> None:
+def process_command(command: str, problem: Problem, cache: bool = True) -> None:
     """Dispatch the command to the appropriate handler.
 
     Args:
         command (str): The command to process.
-        input_file (Path): The input file path.
-        output_path (Path): The output directory path.
+        problem (Problem): The problem instance to process.
+        cache (bool): Use the solve cache for the solve command.
 
     Logs:
         Logs error if the command is unknown.
     """
-    logging.info(f'Processing command: {command} for file: {input_file}')
-    problem: Problem = Problem(input_file, output_path)
+    logging.info(f'Processing command: {command} for file: {problem.problem_file_name}')
     match command:
         case 'schema':
             process_schema(problem)
         case 'solve':
-            process_solve(problem)
+            process_solve(problem, cache)
         case 'validate':
             process_validate(problem)
+        case 'verify':
+            process_verify(problem)
+        case 'warm':
+            process_warm(problem)
+        case 'memory':
+            process_memory(problem)
         case 'problem':
             process_problem(problem)
         case 'lp':
@@ -118,6 +197,57 @@ def process_command(command: str, input_file: Path, output_path: Path) -> None:
             logger.error(f'Unknown command: {command}')
 
 
+def process_file(
+    commands: list[str],
+    input_file: Path,
+    output_path: Path,
+    cache: bool = True,
+    reraise: bool = False,
+) -> dict[str, Any]:
+    """Run all the commands against a single problem built from one file.
+
+    The commands share one Problem, so work done by one command (loading, building the board,
+    building the model) is reused by the others. A command that fails stops the file, and is
+    recorded in the result record.
+
+    Args:
+        commands (list[str]): List of commands to process.
+        input_file (Path): The input file path.
+        output_path (Path): The output directory for this file.
+        cache (bool): Use the solve cache for the solve command.
+        reraise (bool): Raise the error of a failed command again, once it is recorded.
+
+    Returns:
+        dict[str, Any]: A result record with the file, status, error, per-command timings and output paths.
+    """
+    if not output_path.exists():
+        logger.info(f'Creating output directory: {output_path}')
+        output_path.mkdir(parents=True, exist_ok=True)
+    record: dict[str, Any] = {
+        'file': str(input_file),
+        'status': 'OK',
+        'error': None,
+        'timings': {},
+        'outputs': [],
+    }
+    problem: Problem = Problem(input_file, output_path)
+    for command in commands:
+        start: float = time.perf_counter()
+        try:
+            process_command(command, problem, cache)
+        except Exception as exp:  # pylint: disable=broad-exception-caught
+            logger.error(f'Command {command} failed for file: {input_file}: {exp}')
+            record['status'] = 'Error'
+            record['error'] = f'{command}: {exp}'
+            if reraise:
+                raise
+            break
+        finally:
+            record['timings'][command] = time.perf_counter() - start
+    record['outputs'] = sorted(str(path) for path in output_path.iterdir())
+    return record
+
+
 def get_yaml_files(files_path: Path) -> list[Path]:
     """Retrieve a sorted list of YAML files from the given path.
 
@@ -135,22 +265,59 @@ def get_yaml_files(files_path: Path) -> list[Path]:
     return files
 
 
-def process(commands: list[str], files_path: Path, output_path: Path) -> None:
-    """Process all combinations of commands and files.
+def log_record(record: dict[str, Any]) -> None:
+    """Log a result record returned for one file.
+
+    Args:
+        record (dict[str, Any]): The result record.
+    """
+    timings: str = ', '.join(f'{command}={seconds:.3f}s' for command, seconds in record['timings'].items())
+    logger.info(f'{record["status"]} {record["file"]} [{timings}] outputs={len(record["outputs"])}')
+
+
+def initialise_worker() -> None:
+    """Load the item classes in a worker process so constraints can be created."""
+    load_modules('src', 'items')
+
+
+def process(
+    commands: list[str],
+    files_path: Path,
+    output_path: Path,
+    jobs: int = 1,
+    cache: bool = True,
+) -> list[dict[str, Any]]:
+    """Process all the files, running every command against each file.
+
+    With one job, files are processed in this process and the first failed command raises its error.
+    With more than one job, files are processed in a pool of worker processes, one file per task,
+    and the result records are streamed back as each file completes, failed or not.
 
     Args:
         commands (list[str]): List of commands to process.
         files_path (Path): Input file or directory path.
         output_path (Path): The output directory path.
+        jobs (int): Number of worker processes. Defaults to 1, which processes files in this process.
+        cache (bool): Use the solve cache for the solve command.
 
-    Logs:
-        Logs creation of output directories if necessary.
+    Returns:
+        list[dict[str, Any]]: The result records, in completion order.
     """
     files: list[Path] = get_yaml_files(files_path)
-    for file_name, command in itertools.product(files, commands):
-        file_stem: Path = Path(file_name.name.removesuffix('.yaml'))
-        specific_output_path: Path = output_path / file_stem
-        if not specific_output_path.exists():
-            logger.info(f'Creating output directory: {specific_output_path}')
-            specific_output_path.mkdir(parents=True)
-        process_command(command, file_name, specific_output_path)
+    records: list[dict[str, Any]] = []
+    if jobs == 1:
+        for file_name in files:
+            record: dict[str, Any] = process_file(commands, file_name, output_path / file_name.stem, cache, True)
+            log_record(record)
+            records.append(record)
+        return records
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initialise_worker) as executor:
+        futures = [
+            executor.submit(process_file, commands, file_name, output_path / file_name.stem, cache)
+            for file_name in files
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            log_record(record)
+            records.append(record)
+    return records
@@ -1,19 +1,27 @@
 """Board."""
 import re
+from collections.abc import Callable
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import oyaml as yaml
 from strictyaml import Map, Optional, Str, Validator
 
+from src.board.candidates import Candidates
 from src.board.digits import Digits
+from src.board.geometry import Geometry
 from src.parsers.board_digits_parser import BoardDigitsParser
 from src.parsers.size_parser import SizeParser
 from src.utils.coord import Coord
 from src.utils.cyclic import Cyclic
+from src.utils.name_allocator import NameAllocator
 from src.utils.side import Side
 from src.utils.sudoku_exception import SudokuError
 from src.utils.tags import Tags
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.items.cell import Cell
+
 
 class BoardType(Enum):
     """Types of boards.
@@ -63,23 +71,26 @@ class Board:
             tags (Tags): Dictionary containing optional metadata like 'reference', 'video', 'title', 'author'.
         """
         self.size: Coord = size
-        self.row_range = list(range(1, self.size.row + 1))
-        self.column_range = list(range(1, self.size.column + 1))
-        self.side_bounds: dict[Side, tuple[int, int]] = {
-            Side.top: (1, self.size.column),
-            Side.bottom: (1, self.size.column),
-            Side.left: (1, self.size.row),
-            Side.right: (1, self.size.row),
-        }
+        # Lookup tables shared by every board of this size
+        self.geometry: Geometry = Geometry.shared(size)
+        self.row_range: list[int] = self.geometry.row_range
+        self.column_range: list[int] = self.geometry.column_range
+        self.side_bounds: dict[Side, tuple[int, int]] = self.geometry.side_bounds
 
         self.digits: Digits = digits
+        self.candidates: Candidates = Candidates(self)
 
         # Metadata
         self.tags: Tags = tags
 
+        # Identities of the items built on this board
+        self.names: NameAllocator = NameAllocator()
+        # Cells of the board in reading order, made by Cell.make_board
+        self.cells: list[Cell] = []
+
         # Cyclic Map
 
-        self.side_cyclic_map: dict[tuple[Side, Cyclic, int], Coord] = self.generate_cyclic_map()
+        self.side_cyclic_map: dict[tuple[Side, Cyclic, int], Coord] = self.geometry.side_cyclic_map
 
     def generate_cyclic_map(self) -> dict[tuple[Side, Cyclic, int], Coord]:
         """Generate a cyclic map for a board with cyclic connections along each side.
@@ -94,27 +105,7 @@ class Board:
             dict: A dictionary where the keys are tuples of (Side, Cyclic, integer). The cell_values are Coord objects
             representing the corresponding board coordinates.
         """
-        scm: dict[tuple[Side, Cyclic, int], Coord] = {}
-
-        # Top and bottom row connections (left-right)
-        for row in range(self.size.row):
-            # Left side (clockwise and anticlockwise)
-            scm[(Side.left, Cyclic.clockwise, row)] = Coord(row - 1, 1)
-            scm[(Side.left, Cyclic.anticlockwise, row)] = Coord(row + 1, 1)
-            # Right side (clockwise and anticlockwise)
-            scm[(Side.right, Cyclic.clockwise, row)] = Coord(row + 1, self.size.column)
-            scm[(Side.right, Cyclic.anticlockwise, row)] = Coord(row - 1, self.size.column)
-
-        # Top and bottom column connections (top-bottom)
-        for column in range(self.size.column):
-            # Top side (clockwise and anticlockwise)
-            scm[(Side.top, Cyclic.clockwise, column)] = Coord(1, column + 1)
-            scm[(Side.top, Cyclic.anticlockwise, column)] = Coord(1, column - 1)
-            # Bottom side (clockwise and anticlockwise)
-            scm[(Side.bottom, Cyclic.clockwise, column)] = Coord(self.size.row, column - 1)
-            scm[(Side.bottom, Cyclic.anticlockwise, column)] = Coord(self.size.row, column + 1)
-
-        return scm
+        return self.geometry.generate_cyclic_map()
 
     def is_valid(self, row: int, column: int) -> bool:
         """Check if the given row and column coordinate is valid within the board.
@@ -128,6 +119,19 @@ class Board:
         """
         return (1 <= row <= self.size.row) and (1 <= column <= self.size.column)
 
+    def neighbours(self, moves: Callable[[], list[Coord]], row: int, column: int) -> tuple[Coord, ...]:
+        """Return the cells on the board reached from a cell by a set of moves.
+
+        Args:
+            moves (Callable[[], list[Coord]]): The method listing the offsets, such as `Moves.orthogonals`.
+            row (int): Row number.
+            column (int): Column number.
+
+        Returns:
+            tuple[Coord, ...]: The cells reached, in the order of the moves.
+        """
+        return self.geometry.neighbours(moves)[self.geometry.index(row, column)]
+
     def is_valid_coordinate(self, coord: Coord) -> bool:
         """Check if start_location given coordinate is valid within the board.
 
@@ -177,17 +181,7 @@ class Board:
         if index < min_index or index > max_index:
             raise ValueError(f'Index {index} out of range for {side.name} side.')
 
-        if side == Side.top:
-            return Coord(0, index)
-        if side == Side.bottom:
-            return Coord(self.size.row + 1, index)
-        if side == Side.left:
-            return Coord(index, 0)
-        if side == Side.right:
-            return Coord(index, self.size.column + 1)
-
-        # Should never reach here due to the initial side validation
-        raise ValueError(f'Unhandled side: {side}')
+        return self.geometry.side_coordinates[(side, index)]
 
     @classmethod
     def schema(cls) -> Validator:
@@ -1,58 +1,81 @@
 """BookKeepingCell."""
+from collections.abc import Iterable
+
 from src.utils.sudoku_exception import SudokuError
 
 
 class BookKeepingCell:
-    """Handles bookkeeping for possible cell_values of digits in a puzzle."""
+    """Handles bookkeeping for possible cell_values of digits in a puzzle.
+
+    The possible digits are held in a single int, where bit digit - 1 is set if the digit is possible.
+    """
+
+    __slots__ = ('bits', 'digit_range', 'full', 'maximum_digit')
 
-    def __init__(self, maximum_digit: int) -> None:
+    def __init__(self, maximum_digit: int, bits: int | None = None) -> None:
         """Initialize a BookKeepingCell instance with a maximum digit limit.
 
         Args:
             maximum_digit (int): The maximum digit to consider.
+            bits (int | None): The possible digits as a bitmask. Defaults to every digit possible.
         """
         self.maximum_digit: int = maximum_digit
         self.digit_range: range = range(1, maximum_digit + 1)
-        self.possibles: list[bool] = [True for _ in range(self.maximum_digit)]
+        self.full: int = (1 << maximum_digit) - 1
+        self.bits: int = self.full if bits is None else bits & self.full
 
-    def __getitem__(self, digit: int) -> bool:
-        """Determine if a digit is possible.
+    def mask(self, digits: Iterable[int]) -> int:
+        """Convert digits to a bitmask, ignoring digits outside the digit range.
 
         Args:
-            digit (int): The digit to be checked.
+            digits (Iterable[int]): The digits.
 
         Returns:
-            bool: True if the digit is possible; False otherwise.
+            int: The bitmask with the bit for each digit set.
+        """
+        bits: int = 0
+        for digit in digits:
+            if 0 < digit <= self.maximum_digit:
+                bits |= 1 << (digit - 1)
+        return bits
 
-        Raises:
-            SudokuError: If the digit is invalid (less than 1 or greater than the maximum allowed digit).
+    @property
+    def possibles(self) -> list[bool]:
+        """Return whether each digit is possible.
+
+        Returns:
+            list[bool]: One flag per digit, starting at 1.
         """
-        if digit - 1 < 0 or digit > self.maximum_digit:
-            raise SudokuError(f'Invalid digit: {digit}.')
-        return self.possibles[digit - 1]
+        return [bool(self.bits >> index & 1) for index in range(self.maximum_digit)]
 
-    def __setitem__(self, digit: int, digit_value: bool) -> None:
-        """Set whether a digit is possible.
+    def digits(self) -> list[int]:
+        """Return the possible digits.
+
+        Returns:
+            list[int]: The possible digits in ascending order.
+        """
+        return [digit for digit in self.digit_range if self.bits >> (digit - 1) & 1]
+
+    def check_digit(self, digit: int) -> None:
+        """Check that a digit is valid.
 
         Args:
-            digit (int): The digit to be updated.
-            digit_value (bool): The digit to be assigned, indicating if the digit is possible.
+            digit (int): The digit to be checked.
 
         Raises:
             SudokuError: If the digit is invalid (less than 1 or greater than the maximum allowed digit).
         """
         if digit - 1 < 0 or digit > self.maximum_digit:
             raise SudokuError(f'Invalid digit: {digit}.')
-        self.possibles[digit - 1] = digit_value
 
-    def __and__(self, other: 'BookKeepingCell') -> 'BookKeepingCell':
-        """Compute the logical AND of two BookKeepingCell instances.
+    def check_other(self, other: object) -> 'BookKeepingCell':
+        """Check that another instance can be combined with this one.
 
         Args:
-            other (BookKeepingCell): Another BookKeepingCell instance to combine with.
+            other (object): The other instance.
 
         Returns:
-            BookKeepingCell: A new instance with the combined possibilities from both cells.
+            BookKeepingCell: The other instance.
 
         Raises:
             SudokuError: If the other instance is not a BookKeepingCell
@@ -62,10 +85,43 @@ class BookKeepingCell:
             raise SudokuError(f'Expected an instance of BookKeepingCell, got {type(other)}.')
         if self.maximum_digit != other.maximum_digit:
             raise SudokuError(f'Maximum digit mismatch: {self.maximum_digit} != {other.maximum_digit}.')
-        combined_cell: BookKeepingCell = BookKeepingCell(self.maximum_digit)
-        for digit in self.digit_range:
-            combined_cell[digit] = self[digit] and other[digit]
-        return combined_cell
+        return other
+
+    def __getitem__(self, digit: int) -> bool:
+        """Determine if a digit is possible.
+
+        Args:
+            digit (int): The digit to be checked.
+
+        Returns:
+            bool: True if the digit is possible; False otherwise.
+        """
+        self.check_digit(digit)
+        return bool(self.bits >> (digit - 1) & 1)
+
+    def __setitem__(self, digit: int, digit_value: bool) -> None:
+        """Set whether a digit is possible.
+
+        Args:
+            digit (int): The digit to be updated.
+            digit_value (bool): The digit to be assigned, indicating if the digit is possible.
+        """
+        self.check_digit(digit)
+        if digit_value:
+            self.bits |= 1 << (digit - 1)
+        else:
+            self.bits &= ~(1 << (digit - 1))
+
+    def __and__(self, other: 'BookKeepingCell') -> 'BookKeepingCell':
+        """Compute the logical AND of two BookKeepingCell instances.
+
+        Args:
+            other (BookKeepingCell): Another BookKeepingCell instance to combine with.
+
+        Returns:
+            BookKeepingCell: A new instance with the combined possibilities from both cells.
+        """
+        return BookKeepingCell(self.maximum_digit, self.bits & self.check_other(other).bits)
 
     def __or__(self, other: 'BookKeepingCell') -> 'BookKeepingCell':
         """Compute the logical OR of two BookKeepingCell instances.
@@ -75,19 +131,8 @@ class BookKeepingCell:
 
         Returns:
             BookKeepingCell: A new instance with the combined possibilities from both cells.
-
-        Raises:
-            SudokuError: If the other instance is not a BookKeepingCell
-                or if there is a mismatch in the maximum digit.
         """
-        if not isinstance(other, BookKeepingCell):
-            raise SudokuError(f'Expected an instance of BookKeepingCell, got {type(other)}.')
-        if self.maximum_digit != other.maximum_digit:
-            raise SudokuError(f'Maximum digit mismatch: {self.maximum_digit} != {other.maximum_digit}.')
-        combined_cell: BookKeepingCell = BookKeepingCell(self.maximum_digit)
-        for digit in self.digit_range:
-            combined_cell[digit] = self[digit] or other[digit]
-        return combined_cell
+        return BookKeepingCell(self.maximum_digit, self.bits | self.check_other(other).bits)
 
     def __invert__(self) -> 'BookKeepingCell':
         """Invert the possibilities in the instance.
@@ -95,10 +140,7 @@ class BookKeepingCell:
         Returns:
             BookKeepingCell: A new instance with inverted possibilities.
         """
-        inverted_cell: BookKeepingCell = BookKeepingCell(self.maximum_digit)
-        for digit in self.digit_range:
-            inverted_cell[digit] = not self[digit]
-        return inverted_cell
+        return BookKeepingCell(self.maximum_digit, ~self.bits)
 
     def __eq__(self, other: object) -> bool:
         """Check if two BookKeepingCell instances are equal.
@@ -108,19 +150,10 @@ class BookKeepingCell:
 
         Returns:
             bool: True if both instances have identical possibilities; False otherwise.
-
-        Raises:
-            SudokuError: If the other instance is a BookKeepingCell and
-                there is a mismatch in the maximum digit.
         """
         if not isinstance(other, BookKeepingCell):
             return False
-        if self.maximum_digit != other.maximum_digit:
-            raise SudokuError(f'Maximum digit mismatch: {self.maximum_digit} != {other.maximum_digit}.')
-        for digit in self.digit_range:
-            if self[digit] != other[digit]:
-                return False
-        return True
+        return self.bits == self.check_other(other).bits
 
     def __str__(self) -> str:
         """Return a string representation of the possible digits.
@@ -128,7 +161,7 @@ class BookKeepingCell:
         Returns:
             str: A string where possible digits are displayed, others as spaces.
         """
-        digits: list[str] = [str(digit) if self[digit] else ' ' for digit in self.digit_range]
+        digits: list[str] = [str(digit) if self.bits >> (digit - 1) & 1 else ' ' for digit in self.digit_range]
         return ''.join(digits)
 
     def __repr__(self) -> str:
@@ -145,69 +178,92 @@ class BookKeepingCell:
         Returns:
             int: The number of possible digits.
         """
-        return sum(self.possibles)
+        return self.bits.bit_count()
 
-    def set_possible(self, digits: list[int]) -> None:
+    def restrict(self, bits: int) -> bool:
+        """Keep only the digits in a bitmask.
+
+        Args:
+            bits (int): The bitmask of the digits to keep.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
+        """
+        before: int = self.bits
+        self.bits &= bits
+        return self.bits != before
+
+    def set_possible(self, digits: list[int]) -> bool:
         """Set specific digits as possible, making others impossible.
 
         Args:
             digits (list[int]): The list of digits to mark as possible.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
         """
-        for digit in self.digit_range:
-            if digit not in digits:
-                self[digit] = False
+        return self.restrict(self.mask(digits))
 
-    def set_impossible(self, digits: list[int]) -> None:
+    def set_impossible(self, digits: list[int]) -> bool:
         """Set specific digits as impossible.
 
         Args:
             digits (list[int]): The list of digits to mark as impossible.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
+        """
+        return self.restrict(~self.mask(digits))
+
+    def set_odd(self) -> bool:
+        """Set all odd digits as possible, making even digits impossible.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
         """
-        for digit in self.digit_range:
-            if digit in digits:
-                self[digit] = False
+        return self.restrict(self.mask(self.digit_range[::2]))
 
-    def set_odd(self) -> None:
-        """Set all odd digits as possible, making even digits impossible."""
-        for digit in self.digit_range:
-            if digit % 2 != 1:
-                self[digit] = False
+    def set_even(self) -> bool:
+        """Set all even digits as possible, making odd digits impossible.
 
-    def set_even(self) -> None:
-        """Set all even digits as possible, making odd digits impossible."""
-        for digit in self.digit_range:
-            if digit % 2 != 0:
-                self[digit] = False
+        Returns:
+            bool: True if any digit was removed, False otherwise.
+        """
+        return self.restrict(self.mask(self.digit_range[1::2]))
 
-    def set_minimum(self, lower: int) -> None:
+    def set_minimum(self, lower: int) -> bool:
         """Set a minimum possible digit.
 
         Args:
             lower (int): The lowest digit to keep as possible.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
         """
-        for digit in self.digit_range:
-            if digit < lower:
-                self[digit] = False
+        return self.restrict(~((1 << max(lower - 1, 0)) - 1))
 
-    def set_maximum(self, upper: int) -> None:
+    def set_maximum(self, upper: int) -> bool:
         """Set a maximum possible digit.
 
         Args:
             upper (int): The highest digit to keep as possible.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
         """
-        for digit in self.digit_range:
-            if digit > upper:
-                self[digit] = False
+        return self.restrict((1 << max(upper, 0)) - 1)
 
-    def set_range(self, lower: int, upper: int) -> None:
+    def set_range(self, lower: int, upper: int) -> bool:
         """Set a range of possible digits.
 
         Args:
             lower (int): The lowest digit to keep as possible.
             upper (int): The highest digit to keep as possible.
+
+        Returns:
+            bool: True if any digit was removed, False otherwise.
         """
-        self.set_minimum(lower)
-        self.set_maximum(upper)
+        return self.set_minimum(lower) | self.set_maximum(upper)
 
     def fixed(self) -> bool:
         """Check if only one digit is marked as possible.
@@ -215,7 +271,7 @@ class BookKeepingCell:
         Returns:
             bool: True if only one digit is possible, False otherwise.
         """
-        return sum(self.possibles) == 1
+        return self.is_unique()
 
     def is_possible(self, digit: int) -> bool:
         """Check if a specific digit is possible.
@@ -234,4 +290,4 @@ class BookKeepingCell:
         Returns:
             bool: True if only one digit is possible, False otherwise.
         """
-        return sum(self.possibles) == 1
+        return self.bits != 0 and self.bits & (self.bits - 1) == 0
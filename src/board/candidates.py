@@ -0,0 +1,150 @@
+"""Candidates."""
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from src.board.book_keeping_cell import BookKeepingCell
+from src.board.geometry import Geometry
+from src.utils.coord import Coord
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.board.board import Board
+
+
+class Candidates:
+    """Board-wide candidate grid, with one bitmask BookKeepingCell per cell.
+
+    Reductions over rows, columns, boxes or any group of cells combine the bitmasks directly,
+    so they cost one integer operation per cell rather than one per digit.
+    """
+
+    def __init__(self, board: 'Board') -> None:
+        """Initialize the grid with every digit possible in every cell.
+
+        Args:
+            board (Board): The board the candidates belong to.
+        """
+        self.rows: int = board.size.row
+        self.columns: int = board.size.column
+        self.maximum_digit: int = board.digits.maximum
+        self.geometry: Geometry = board.geometry
+        self.books: list[BookKeepingCell] = [
+            BookKeepingCell(self.maximum_digit) for _ in range(self.rows * self.columns)
+        ]
+
+    def __getitem__(self, index: tuple[int, int]) -> BookKeepingCell:
+        """Return the bookkeeping for a cell.
+
+        Args:
+            index (tuple[int, int]): The row and column of the cell.
+
+        Returns:
+            BookKeepingCell: The bookkeeping for the cell.
+        """
+        row, column = index
+        return self.books[(row - 1) * self.columns + column - 1]
+
+    def __iter__(self) -> Iterator[BookKeepingCell]:
+        """Iterate over the bookkeeping of each cell in row major order.
+
+        Returns:
+            Iterator[BookKeepingCell]: The bookkeeping of each cell.
+        """
+        return iter(self.books)
+
+    def __len__(self) -> int:
+        """Return the total number of candidates on the board.
+
+        Returns:
+            int: The sum of the number of possible digits in each cell.
+        """
+        return sum(book.bits.bit_count() for book in self.books)
+
+    def union(self, cells: Iterable[tuple[int, int]]) -> int:
+        """Return the digits possible in at least one of the cells.
+
+        Args:
+            cells (Iterable[tuple[int, int]]): The rows and columns of the cells.
+
+        Returns:
+            int: The bitmask of the digits.
+        """
+        bits: int = 0
+        for cell in cells:
+            bits |= self[cell].bits
+        return bits
+
+    def intersection(self, cells: Iterable[tuple[int, int]]) -> int:
+        """Return the digits possible in every one of the cells.
+
+        Args:
+            cells (Iterable[tuple[int, int]]): The rows and columns of the cells.
+
+        Returns:
+            int: The bitmask of the digits.
+        """
+        bits: int = (1 << self.maximum_digit) - 1
+        for cell in cells:
+            bits &= self[cell].bits
+        return bits
+
+    def row(self, row: int) -> int:
+        """Return the digits possible somewhere in a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            int: The bitmask of the digits.
+        """
+        return self.union((row, column) for column in range(1, self.columns + 1))
+
+    def column(self, column: int) -> int:
+        """Return the digits possible somewhere in a column.
+
+        Args:
+            column (int): The column.
+
+        Returns:
+            int: The bitmask of the digits.
+        """
+        return self.union((row, column) for row in range(1, self.rows + 1))
+
+    def box(self, box: int, box_size: Coord) -> int:
+        """Return the digits possible somewhere in a box.
+
+        Args:
+            box (int): The box number, starting at 1 in reading order.
+            box_size (Coord): The number of rows and columns in a box.
+
+        Returns:
+            int: The bitmask of the digits.
+        """
+        bits: int = 0
+        for index in self.geometry.box_cells(box_size)[box - 1]:
+            bits |= self.books[index].bits
+        return bits
+
+    def fixed(self) -> list[tuple[int, int]]:
+        """Return the cells with exactly one possible digit.
+
+        Returns:
+            list[tuple[int, int]]: The rows and columns of the cells.
+        """
+        return [
+            (index // self.columns + 1, index % self.columns + 1)
+            for index, book in enumerate(self.books)
+            if book.is_unique()
+        ]
+
+    def reset(self) -> None:
+        """Make every digit possible in every cell again."""
+        for book in self.books:
+            book.bits = book.full
+
+    def __repr__(self) -> str:
+        """Return a string representation of the candidates.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.rows!r}, {self.columns!r}, {self.maximum_digit!r})'
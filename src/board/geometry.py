@@ -0,0 +1,178 @@
+"""Geometry."""
+from collections.abc import Callable
+from typing import ClassVar
+
+from src.utils.coord import Coord
+from src.utils.cyclic import Cyclic
+from src.utils.side import Side
+
+
+class Geometry:
+    """Lookup tables for the shape of a board, shared by every board of the same size.
+
+    The tables only depend on the number of rows and columns, so they are built once per size and kept
+    in `classes`. Tables for a box size or a set of moves are built the first time they are asked for.
+    Cells are numbered from 0 in reading order.
+
+    Attributes:
+        size (Coord): The number of rows and columns.
+        row_range (list[int]): The row numbers, starting at 1.
+        column_range (list[int]): The column numbers, starting at 1.
+        side_bounds (dict[Side, tuple[int, int]]): The first and last index along each side.
+        side_cyclic_map (dict[tuple[Side, Cyclic, int], Coord]): The cell reached going round each side.
+        cells (tuple[Coord, ...]): The coordinate of each cell.
+        side_coordinates (dict[tuple[Side, int], Coord]): The coordinate just outside each side, by index.
+        box_tables (dict[tuple[int, int], tuple[int, ...]]): The box of each cell, by box size.
+        box_cell_tables (dict[tuple[int, int], tuple[tuple[int, ...], ...]]): The cells of each box, by box size.
+        neighbour_tables (dict[Callable[[], list[Coord]], tuple[tuple[Coord, ...], ...]]): The cells a set of
+            moves reaches from each cell, by the method listing the moves.
+    """
+
+    classes: ClassVar[dict[tuple[int, int], 'Geometry']] = {}
+
+    def __init__(self, size: Coord) -> None:
+        """Build the tables for a board size.
+
+        Args:
+            size (Coord): The number of rows and columns.
+        """
+        self.size: Coord = size
+        self.row_range: list[int] = list(range(1, size.row + 1))
+        self.column_range: list[int] = list(range(1, size.column + 1))
+        self.side_bounds: dict[Side, tuple[int, int]] = {
+            Side.top: (1, size.column),
+            Side.bottom: (1, size.column),
+            Side.left: (1, size.row),
+            Side.right: (1, size.row),
+        }
+        self.side_cyclic_map: dict[tuple[Side, Cyclic, int], Coord] = self.generate_cyclic_map()
+        self.cells: tuple[Coord, ...] = tuple(
+            Coord(row, column) for row in self.row_range for column in self.column_range
+        )
+        self.side_coordinates: dict[tuple[Side, int], Coord] = {}
+        for index in range(1, size.column + 1):
+            self.side_coordinates[(Side.top, index)] = Coord(0, index)
+            self.side_coordinates[(Side.bottom, index)] = Coord(size.row + 1, index)
+        for index in range(1, size.row + 1):
+            self.side_coordinates[(Side.left, index)] = Coord(index, 0)
+            self.side_coordinates[(Side.right, index)] = Coord(index, size.column + 1)
+        self.box_tables: dict[tuple[int, int], tuple[int, ...]] = {}
+        self.box_cell_tables: dict[tuple[int, int], tuple[tuple[int, ...], ...]] = {}
+        self.neighbour_tables: dict[Callable[[], list[Coord]], tuple[tuple[Coord, ...], ...]] = {}
+
+    @classmethod
+    def shared(cls, size: Coord) -> 'Geometry':
+        """Return the geometry for a board size, building it the first time the size is seen.
+
+        Args:
+            size (Coord): The number of rows and columns.
+
+        Returns:
+            Geometry: The shared geometry.
+        """
+        key: tuple[int, int] = (size.row, size.column)
+        if key not in cls.classes:
+            cls.classes[key] = cls(size)
+        return cls.classes[key]
+
+    def generate_cyclic_map(self) -> dict[tuple[Side, Cyclic, int], Coord]:
+        """Generate a cyclic map for a board with cyclic connections along each side.
+
+        Returns:
+            dict[tuple[Side, Cyclic, int], Coord]: The coordinate reached from each side, direction and index.
+        """
+        scm: dict[tuple[Side, Cyclic, int], Coord] = {}
+
+        # Top and bottom row connections (left-right)
+        for row in range(self.size.row):
+            scm[(Side.left, Cyclic.clockwise, row)] = Coord(row - 1, 1)
+            scm[(Side.left, Cyclic.anticlockwise, row)] = Coord(row + 1, 1)
+            scm[(Side.right, Cyclic.clockwise, row)] = Coord(row + 1, self.size.column)
+            scm[(Side.right, Cyclic.anticlockwise, row)] = Coord(row - 1, self.size.column)
+
+        # Top and bottom column connections (top-bottom)
+        for column in range(self.size.column):
+            scm[(Side.top, Cyclic.clockwise, column)] = Coord(1, column + 1)
+            scm[(Side.top, Cyclic.anticlockwise, column)] = Coord(1, column - 1)
+            scm[(Side.bottom, Cyclic.clockwise, column)] = Coord(self.size.row, column - 1)
+            scm[(Side.bottom, Cyclic.anticlockwise, column)] = Coord(self.size.row, column + 1)
+
+        return scm
+
+    def index(self, row: int, column: int) -> int:
+        """Return the number of a cell in reading order.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            int: The zero based index of the cell.
+        """
+        return (row - 1) * self.size.column + column - 1
+
+    def boxes(self, box_size: Coord) -> tuple[int, ...]:
+        """Return the box of each cell for a box size.
+
+        Args:
+            box_size (Coord): The number of rows and columns in a box.
+
+        Returns:
+            tuple[int, ...]: The box number, starting at 1, of each cell in reading order.
+        """
+        key: tuple[int, int] = (box_size.row, box_size.column)
+        if key not in self.box_tables:
+            self.box_tables[key] = tuple(
+                ((coord.row - 1) // box_size.row) * box_size.row + (coord.column - 1) // box_size.column + 1
+                for coord in self.cells
+            )
+        return self.box_tables[key]
+
+    def box_cells(self, box_size: Coord) -> tuple[tuple[int, ...], ...]:
+        """Return the cells in each box for a box size.
+
+        Args:
+            box_size (Coord): The number of rows and columns in a box.
+
+        Returns:
+            tuple[tuple[int, ...], ...]: For each box, starting with box 1, the indices of its cells in reading order.
+        """
+        key: tuple[int, int] = (box_size.row, box_size.column)
+        if key not in self.box_cell_tables:
+            boxes: tuple[int, ...] = self.boxes(box_size)
+            self.box_cell_tables[key] = tuple(
+                tuple(index for index, number in enumerate(boxes) if number == box)
+                for box in range(1, max(boxes) + 1)
+            )
+        return self.box_cell_tables[key]
+
+    def neighbours(self, moves: Callable[[], list[Coord]]) -> tuple[tuple[Coord, ...], ...]:
+        """Return the cells on the board reached from each cell by a set of moves.
+
+        Args:
+            moves (Callable[[], list[Coord]]): The method listing the offsets, such as `Moves.orthogonals`.
+
+        Returns:
+            tuple[tuple[Coord, ...], ...]: For each cell in reading order, the cells reached, in the order of
+            the moves.
+        """
+        if moves not in self.neighbour_tables:
+            offsets: list[Coord] = moves()
+            self.neighbour_tables[moves] = tuple(
+                tuple(
+                    coord + offset
+                    for offset in offsets
+                    if 1 <= coord.row + offset.row <= self.size.row
+                    and 1 <= coord.column + offset.column <= self.size.column
+                )
+                for coord in self.cells
+            )
+        return self.neighbour_tables[moves]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the geometry.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.size!r})'
@@ -1,6 +1,7 @@
 """AddConstraintsCommand."""
 from typing import cast
 
+from src.commands.bookkeeping_command import BookkeepingCommand
 from src.commands.command import CommandError
 from src.commands.create_constraints_command import CreateConstraintsCommand
 from src.commands.create_solver_command import CreateSolverCommand
@@ -15,8 +16,8 @@ class AddConstraintsCommand(SimpleCommand):
     def __init__(self):
         """Construct a AddConstraintsCommand."""
         super().__init__()
-        self.add_preconditions([CreateSolverCommand, CreateConstraintsCommand])
-        self.target = 'answer'
+        self.add_preconditions([CreateSolverCommand, CreateConstraintsCommand, BookkeepingCommand])
+        self.target = 'model'
 
     def work(self, problem: Problem) -> None:
         """Solve the puzzle.
@@ -34,5 +35,6 @@ class AddConstraintsCommand(SimpleCommand):
         if problem.constraints is None:
             raise CommandError(f'Constraints must be created before {self.name}.')
         solver = cast(Solver, problem.solver)
-        problem.constraints.add_constraint(solver)
-        solver.save_lp('constraints.lp')
+        solver.add_constraints(problem.constraints)
+        problem.constraints.add_bookkeeping_constraint(solver)
+        problem.model = solver.model
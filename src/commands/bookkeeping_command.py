@@ -0,0 +1,36 @@
+"""BookkeepingCommand."""
+import logging
+
+from src.commands.command import CommandError
+from src.commands.create_constraints_command import CreateConstraintsCommand
+from src.commands.problem import Problem
+from src.commands.simple_command import SimpleCommand
+from src.solvers.bookkeeping_propagator import BookkeepingPropagator
+
+
+class BookkeepingCommand(SimpleCommand):
+    """Command for running the bookkeeping of the constraints to a fixpoint."""
+
+    def __init__(self):
+        """Initialize a BookkeepingCommand instance."""
+        super().__init__()
+        self.add_preconditions([CreateConstraintsCommand])
+        self.target = 'propagator'
+
+    def work(self, problem: Problem) -> None:
+        """Eliminate candidates from the cells by repeating the bookkeeping of each constraint until nothing changes.
+
+        Args:
+            problem (Problem): The problem instance holding the constraints.
+
+        Raises:
+            CommandError: If the constraints are not created.
+        """
+        super().work(problem)
+        if problem.constraints is None:
+            raise CommandError(f'Constraints must be created before {self.name}.')
+        propagator: BookkeepingPropagator = BookkeepingPropagator(problem.constraints)
+        propagator.reset()
+        propagator.run()
+        logging.info(f'Bookkeeping: {propagator.passes} passes, {propagator.eliminations} eliminations')
+        problem.propagator = propagator
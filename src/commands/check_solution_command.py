@@ -0,0 +1,56 @@
+"""CheckSolutionCommand."""
+import logging
+
+from src.commands.command import CommandError
+from src.commands.create_constraints_command import CreateConstraintsCommand
+from src.commands.problem import Problem
+from src.commands.simple_command import SimpleCommand
+from src.items.solution import Solution
+from src.solvers.answer import Answer
+
+
+class CheckSolutionCommand(SimpleCommand):
+    """Command for checking a problem's Solution block against its constraints, without a solver."""
+
+    def __init__(self):
+        """Initialize a CheckSolutionCommand instance."""
+        super().__init__()
+        self.add_preconditions([CreateConstraintsCommand])
+        self.target = 'violations'
+
+    @staticmethod
+    def solution(problem: Problem) -> list[str] | None:
+        """Find the rows of the problem's solution, in the constraints or at the top level of the file.
+
+        Args:
+            problem (Problem): The problem instance.
+
+        Returns:
+            list[str] | None: The rows of digits, or None if the problem has no solution.
+        """
+        if problem.constraints is not None:
+            for solution in problem.constraints.find_instances(Solution):
+                return solution.rows  # type: ignore
+        if problem.config is not None and 'Solution' in problem.config:
+            return [str(row) for row in problem.config['Solution']]
+        return None
+
+    def work(self, problem: Problem) -> None:
+        """Check the solution against every constraint and store the violations found.
+
+        Args:
+            problem (Problem): The problem instance.
+
+        Raises:
+            CommandError: If the constraints are not created.
+        """
+        super().work(problem)
+        if problem.board is None or problem.constraints is None:
+            raise CommandError(f'Constraints must be created before {self.name}.')
+        rows: list[str] | None = self.solution(problem)
+        if rows is None:
+            logging.warning(f'{self.name}: no solution to check.')
+            return
+        problem.violations = problem.constraints.check(Answer(problem.board, rows))
+        for violation in problem.violations:
+            logging.warning(f'{self.name}: {violation}')
@@ -1,5 +1,6 @@
 """Command."""
 import logging
+from graphlib import TopologicalSorter
 from typing import ClassVar
 
 from src.commands.problem import Problem
@@ -32,6 +33,7 @@ class Command:
 
     # Class Variables
     classes: ClassVar[dict[str, type['Command']]] = {}
+    graphs: ClassVar[dict[type['Command'], dict[type['Command'], tuple[type['Command'], ...]]]] = {}
 
     def __init_subclass__(cls, **kwargs):
         """Register the subclass to the `Item` class hierarchy.
@@ -82,20 +84,66 @@ class Command:
         """
         logging.info(f'Running {self.name} {problem.problem_file_name}')
 
-    def execute(self, problem: Problem) -> None:
-        """Execute the command, performing validation and the main action.
+    @classmethod
+    def precondition_graph(cls) -> dict[type['Command'], tuple[type['Command'], ...]]:
+        """Resolve the full precondition graph rooted at this command class.
+
+        The graph is resolved once per command class and cached, so repeated executions
+        do not instantiate the whole precondition tree again.
+
+        Returns:
+            dict[type[Command], tuple[type[Command], ...]]: Each command class mapped to its direct preconditions.
+        """
+        if cls not in Command.graphs:
+            graph: dict[type[Command], tuple[type[Command], ...]] = {}
+            pending: list[type[Command]] = [cls]
+            while pending:
+                command_class: type[Command] = pending.pop()
+                if command_class in graph:
+                    continue
+                graph[command_class] = tuple(command_class().preconditions)
+                pending.extend(graph[command_class])
+            Command.graphs[cls] = graph
+        return Command.graphs[cls]
+
+    def schedule(self) -> list[type['Command']]:
+        """Return the preconditions of this command in topological order.
+
+        Shared ancestors appear only once, before every command that depends on them.
+
+        Returns:
+            list[type[Command]]: The precondition classes in the order they must run.
+        """
+        graph: dict[type[Command], tuple[type[Command], ...]] = {}
+        for precondition_class in self.preconditions:
+            graph |= precondition_class.precondition_graph()
+        return list(TopologicalSorter(graph).static_order())
+
+    def is_done(self, problem: Problem) -> bool:
+        """Check if this command has already been satisfied for the problem.
 
-        This method validates the line, inputs, and outputs, performs the core work of the command,
-        and performs post-execution validation.
+        A command is satisfied if it has already run against the problem, or if its target
+        has already been filled in.
 
         Args:
-            problem (Problem): The problem instance to execute the command on.
+            problem (Problem): The problem instance to check.
+
+        Returns:
+            bool: True if the command does not need to run, False otherwise.
+        """
+        if self.__class__.__name__ in problem.executed:
+            return True
+        return self.target is not None and getattr(problem, self.target, None) is not None
+
+    def run(self, problem: Problem) -> None:
+        """Check the preconditions and perform the work of this command only.
+
+        Args:
+            problem (Problem): The problem instance to run the command on.
 
         Raises:
-            CommandError: If any validation step or the execution itself fails.
+            CommandError: If the preconditions are not met or the work fails.
         """
-        for precondition in self.preconditions:
-            precondition().execute(problem)
         try:
             self.check_preconditions(problem)
         except CommandError as preconditions_exp:
@@ -110,6 +158,24 @@ class Command:
                 exc_info=True,
             )
             raise CommandError(f'Error in {self.__class__.__name__}.work') from work_exp
+        problem.executed.add(self.__class__.__name__)
+
+    def execute(self, problem: Problem) -> None:
+        """Execute the command, performing validation and the main action.
+
+        The preconditions form a graph. Each precondition is run at most once per problem,
+        in topological order, and is skipped if it has already run or its target is already filled.
+        The command itself is always run.
+
+        Args:
+            problem (Problem): The problem instance to execute the command on.
+        """
+        for precondition_class in self.schedule():
+            precondition: Command = precondition_class()
+            if precondition.is_done(problem):
+                continue
+            precondition.run(problem)
+        self.run(problem)
 
     @property
     def name(self) -> str:
@@ -64,7 +64,7 @@ class ComposedCommand(Command):
             composed = command1 | command2 | command3
             ```
         """
-        command: ComposedCommand = ComposedCommand(self.commands.copy())
+        command: ComposedCommand = self.__class__(self.commands.copy())
         command.add(other)
         return command
 
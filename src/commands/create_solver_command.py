@@ -3,6 +3,8 @@ from src.commands.command import CommandError
 from src.commands.create_board_command import CreateBoardCommand
 from src.commands.problem import Problem
 from src.commands.simple_command import SimpleCommand
+from src.solvers.propagation_backend import PropagationBackend
+from src.solvers.pulp_backend import PulpBackend
 from src.solvers.solver import Solver
 
 
@@ -19,7 +21,8 @@ class CreateSolverCommand(SimpleCommand):
         """Build the solver and stores it in the problem instance.
 
         This method creates start_location new Solver instance using the provided board and configuration,
-        and stores it in the target attribute within the problem instance.
+        and stores it in the target attribute within the problem instance. The solver tries the native
+        propagation backend first and falls back to PuLP for anything it does not support.
 
         Args:
             problem (Problem): The problem instance where the solver will be created.
@@ -30,4 +33,8 @@ class CreateSolverCommand(SimpleCommand):
         super().work(problem)
         if problem.board is None:
             raise CommandError('Board must be created.')
-        problem.solver = Solver(board=problem.board, name='Problem')
+        problem.solver = Solver(
+            board=problem.board,
+            name='Problem',
+            backends=[PropagationBackend(), PulpBackend()],
+        )
@@ -3,21 +3,85 @@ import logging
 from itertools import product
 
 from src.commands.command import CommandError
+from src.commands.create_constraints_command import CreateConstraintsCommand
 from src.commands.problem import Problem
 from src.commands.simple_command import SimpleCommand
 from src.commands.solve_command import SolveCommand
 from src.solvers.answer import Answer
+from src.solvers.canonical_form import CanonicalForm
+from src.solvers.solve_cache import SolveCache
 from src.solvers.solver_status import SolverStatus
-from src.solvers.variables import Variables
+from src.utils.violation import Violation
+
+CACHED_STATUSES: tuple[SolverStatus, ...] = (SolverStatus.optimal, SolverStatus.infeasible, SolverStatus.unbounded)
 
 
 class ExtractAnswerCommand(SimpleCommand):
-    """Command for extracting the line from the solver's results."""
+    """Command for extracting the line from the solver's results.
+
+    Attributes:
+        cache (SolveCache | None): The solve cache to answer from and store into, or None to always solve.
+    """
 
-    def __init__(self):
-        """Initialize an ExtractAnswerCommand instance."""
+    def __init__(self, cache: SolveCache | None = None):
+        """Initialize an ExtractAnswerCommand instance.
+
+        Args:
+            cache (SolveCache | None): The solve cache to answer from and store into, or None to always solve.
+        """
         super().__init__()
         self.add_preconditions([SolveCommand])
+        self.target = 'answer'
+        self.cache: SolveCache | None = cache
+
+    def execute(self, problem: Problem) -> None:
+        """Extract the answer, using the solve cache if there is one.
+
+        With a cache, only the board and constraints are built to compute the puzzle's canonical form.
+        A puzzle found in the cache is answered from it, moved back from the canonical orientation and
+        digits, without building or solving its model. Its status goes in `cached_status`, so `status`
+        is still empty and later commands that need a solve still run one. Otherwise the puzzle is solved
+        as usual and the result is stored in the canonical orientation and digits, unless the answer
+        breaks a constraint.
+
+        Args:
+            problem (Problem): The problem instance from which to extract the line.
+
+        Raises:
+            CommandError: If the board or constraints are not created.
+        """
+        if self.cache is None:
+            super().execute(problem)
+            return
+        constraints_command: CreateConstraintsCommand = CreateConstraintsCommand()
+        if not constraints_command.is_done(problem):
+            constraints_command.execute(problem)
+        if problem.board is None or problem.constraints is None:
+            raise CommandError(f'Constraints must be created before {self.name}.')
+        form: CanonicalForm = CanonicalForm.create(problem.board, problem.constraints)
+        entry = self.cache.get(form.key)
+        if entry is not None:
+            status, digits, _ = entry
+            problem.cached_status = status
+            if digits is not None:
+                problem.answer = Answer(problem.board)
+                problem.answer.digits = form.to_original(digits)
+            problem.executed.add(self.__class__.__name__)
+            return
+        super().execute(problem)
+        if problem.status in CACHED_STATUSES and problem.solver is not None:
+            statistics: dict[str, str] = self.cache.statistics(problem.solver.log)
+            if problem.solver.backend is not None:
+                statistics['Backend'] = problem.solver.backend.name
+            canonical: Answer | None = None
+            if problem.answer is not None:
+                violations: list[Violation] = problem.constraints.check(problem.answer)
+                if violations:
+                    logging.warning(f'{self.name}: not caching an answer that breaks {violations[0]}')
+                    return
+                canonical = Answer(problem.board)
+                canonical.digits = form.to_canonical(problem.answer.digits)
+            self.cache.put(form.key, problem.status, canonical, statistics)
 
     def work(self, problem: Problem) -> None:
         """Extract the line from the solver's results and store it in the problem.
@@ -43,7 +107,5 @@ class ExtractAnswerCommand(SimpleCommand):
             return
 
         problem.answer = Answer(problem.board)
-        variables: Variables = problem.solver.variables
         for row, column in product(problem.board.row_range, problem.board.column_range):
-            number: int = int(variables.numbers[row, column].varValue)
-            problem.answer[row, column] = number
+            problem.answer[row, column] = problem.solver.answer[row, column]
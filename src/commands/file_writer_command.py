@@ -1,12 +1,13 @@
 """FileWriterCommand."""
 from pathlib import Path
+from typing import TextIO
 from xml.dom.minidom import Document
 
 import oyaml as yaml
 
 from src.commands.command import CommandError
-from src.commands.create_linear_program_command import CreateLinearProgramCommand
 from src.commands.create_rules_command import CreateRulesCommand
+from src.commands.presolve_command import PresolveCommand
 from src.commands.problem import Problem
 from src.commands.simple_command import SimpleCommand
 from src.commands.svg_answer_command import SVGAnswerCommand
@@ -41,16 +42,25 @@ class FileWriterCommand(SimpleCommand):
         target_file_path: Path = problem.output_directory / self.target_file_path
         if self.source is None:
             raise CommandError(f'Source is not set {self.name}.')
-        data_to_write = getattr(problem, self.source)
         try:
             with target_file_path.open(mode='w', encoding='utf-8') as file_handler:
-                if isinstance(data_to_write, str):
-                    file_handler.write(data_to_write)
-                if isinstance(data_to_write, Document):
-                    file_handler.write(data_to_write.toprettyxml(indent='  '))
+                self.write(problem, file_handler)
         except Exception as exc:
             raise CommandError(f'Failed to write {target_file_path!s}: {exc}') from exc
 
+    def write(self, problem: Problem, file_handler: TextIO) -> None:
+        """Write the source data to an open file.
+
+        Args:
+            problem (Problem): The problem holding the source data.
+            file_handler (TextIO): The open file.
+        """
+        data_to_write = getattr(problem, str(self.source))
+        if isinstance(data_to_write, str):
+            file_handler.write(data_to_write)
+        if isinstance(data_to_write, Document):
+            file_handler.write(data_to_write.toprettyxml(indent='  '))
+
     def __repr__(self) -> str:
         """Return a string representation of the command.
 
@@ -147,7 +157,7 @@ class SVGPencilMarkWriterCommand(FileWriterCommand):
     def __init__(self) -> None:
         """Initialize SVGFileWriterCommand."""
         super().__init__()
-        self.source: str = 'problem'
+        self.source: str = 'svg_pencil_mark'
         self.add_preconditions([SVGPencilMarkCommand])
         self.target_file_path: Path = Path('svg_pencil_mark.svg')
 
@@ -169,7 +179,7 @@ class SVGSolutionWriterCommand(FileWriterCommand):
     def __init__(self) -> None:
         """Initialize SVGFileWriterCommand."""
         super().__init__()
-        self.source: str = 'answer'
+        self.source: str = 'svg_solution'
         self.add_preconditions([SVGSolutionCommand])
         self.target_file_path: Path = Path('solution.svg')
 
@@ -180,17 +190,34 @@ class SVGAnswerFileWriterCommand(FileWriterCommand):
     def __init__(self) -> None:
         """Initialize SVGFileWriterCommand."""
         super().__init__()
-        self.source: str = 'answer'
+        self.source: str = 'svg_answer'
         self.add_preconditions([SVGAnswerCommand])
         self.target_file_path: Path = Path('answer.svg')
 
 
 class LPFileWriterCommand(FileWriterCommand):
-    """Write LP file into a file."""
+    """Write the LP version of the problem into a file, streaming it from the solver."""
 
     def __init__(self) -> None:
         """Initialize LPFileWriterCommand."""
         super().__init__()
         self.source: str = 'linear_program'
-        self.add_preconditions([CreateLinearProgramCommand])
+        self.add_preconditions([PresolveCommand])
         self.target_file_path = Path('problem.lp')
+
+    def write(self, problem: Problem, file_handler: TextIO) -> None:
+        """Write the LP version of the problem, using the text if it has already been produced.
+
+        Args:
+            problem (Problem): The problem holding the solver.
+            file_handler (TextIO): The open file.
+
+        Raises:
+            CommandError: If the solver is not created.
+        """
+        if problem.linear_program is not None:
+            file_handler.write(problem.linear_program)
+            return
+        if problem.solver is None:
+            raise CommandError(f'Solver must be created before {self.name}.')
+        problem.solver.write_lp(file_handler)
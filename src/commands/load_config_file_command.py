@@ -9,10 +9,10 @@ class LoadConfigFileCommand(SimpleCommand):
     """Command to load the contents of a file into a problem."""
 
     def __init__(self):
-        """Initialize start_location CreateBoardCommand instance."""
+        """Initialize start_location LoadConfigFileCommand instance."""
         super().__init__()
         self.add_preconditions([])
-        self.target = 'board'
+        self.target = 'raw_config'
 
     def work(self, problem: Problem) -> None:
         """Load file contents into the problem.
@@ -0,0 +1,87 @@
+"""Parallel composed command.
+
+Runs the commands of a composed command, and their preconditions, on a thread pool.
+Each command is started as soon as all of its preconditions have finished, so
+independent branches of the precondition graph overlap instead of running one after another.
+"""
+from collections.abc import Hashable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+
+from src.commands.command import Command
+from src.commands.composed_command import ComposedCommand
+from src.commands.problem import Problem
+
+
+class ParallelComposedCommand(ComposedCommand):
+    """Combine multiple commands and run independent branches in parallel."""
+
+    def __init__(self, commands: list[Command] | None = None, max_workers: int | None = None):
+        """Initialize a new instance of the ParallelComposedCommand class.
+
+        Args:
+            commands (list[Command], optional): A list of commands to initialize
+                in the composed command. Defaults to an empty list.
+            max_workers (int | None): Maximum number of threads. Defaults to the ThreadPoolExecutor default.
+        """
+        super().__init__(commands)
+        self.max_workers: int | None = max_workers
+
+    def graph(self) -> tuple[dict[Hashable, tuple[Hashable, ...]], dict[Hashable, Command]]:
+        """Build the combined precondition graph of all the commands.
+
+        Preconditions are keyed by their class. A command is keyed by its class if that class
+        is also a precondition of another command, so it only runs once. Otherwise, it is keyed by itself.
+
+        Returns:
+            tuple[dict[Hashable, tuple[Hashable, ...]], dict[Hashable, Command]]: The graph mapping each
+                node to the nodes it depends on, and the commands supplied for nodes that are not
+                created from their class.
+        """
+        graph: dict[Hashable, tuple[Hashable, ...]] = {}
+        for command in self.commands:
+            for precondition_class in command.preconditions:
+                graph |= precondition_class.precondition_graph()
+        supplied: dict[Hashable, Command] = {}
+        for command in self.commands:
+            node: Hashable = command.__class__ if command.__class__ in graph else command
+            graph[node] = tuple(command.preconditions)
+            supplied[node] = command
+        return graph, supplied
+
+    @staticmethod
+    def run_node(node: Hashable, supplied: dict[Hashable, Command], problem: Problem) -> None:
+        """Run one node of the graph under the lock for its target.
+
+        Args:
+            node (Hashable): The node to run.
+            supplied (dict[Hashable, Command]): The commands supplied for nodes.
+            problem (Problem): The problem instance to execute the command on.
+        """
+        if node in supplied:
+            supplied[node].execute(problem)
+            return
+        command: Command = node()  # type: ignore[operator]
+        with problem.lock(command.target):
+            if not command.is_done(problem):
+                command.run(problem)
+
+    def execute(self, problem: Problem) -> None:
+        """Execute all commands, running independent branches in parallel.
+
+        Args:
+            problem (Problem): The problem instance to execute the commands on.
+        """
+        Command.execute(self, problem)
+        graph, supplied = self.graph()
+        sorter: TopologicalSorter = TopologicalSorter(graph)
+        sorter.prepare()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: dict[Future, Hashable] = {}
+            while sorter.is_active():
+                for node in sorter.get_ready():
+                    running[executor.submit(self.run_node, node, supplied, problem)] = node
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    future.result()
+                    sorter.done(running.pop(future))
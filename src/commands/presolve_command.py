@@ -0,0 +1,46 @@
+"""PresolveCommand."""
+import logging
+
+from src.commands.add_constraints_command import AddConstraintsCommand
+from src.commands.command import CommandError
+from src.commands.problem import Problem
+from src.commands.simple_command import SimpleCommand
+from src.solvers.presolve import Presolve
+from src.solvers.sparse_model import SparseModel
+
+
+class PresolveCommand(SimpleCommand):
+    """Command for shrinking the model before it is written out and solved."""
+
+    def __init__(self):
+        """Initialize a PresolveCommand instance."""
+        super().__init__()
+        self.add_preconditions([AddConstraintsCommand])
+        self.target = 'presolve'
+
+    def work(self, problem: Problem) -> None:
+        """Substitute the variables fixed by bookkeeping into the model and drop the rows and columns no longer needed.
+
+        A sparse model is passed through unchanged.
+
+        Args:
+            problem (Problem): The problem instance holding the solver.
+
+        Raises:
+            CommandError: If the solver is not created.
+        """
+        super().work(problem)
+        if problem.solver is None:
+            raise CommandError(f'Solver must be created before {self.name}.')
+        if isinstance(problem.solver.model, SparseModel):
+            problem.model = problem.solver.model
+            logging.info(f'Presolve: skipped for sparse model, {problem.model.row_count} rows')
+            return
+        presolve: Presolve = Presolve(problem.solver)
+        presolve.run()
+        problem.model = problem.solver.model
+        logging.info(
+            f'Presolve: rows {presolve.rows} -> {len(problem.model.constraints)}, '
+            f'columns {presolve.columns} -> {len(problem.model.variables())}',
+        )
+        problem.presolve = presolve
@@ -1,18 +1,24 @@
 """Problem module."""
 
+import threading
 from pathlib import Path
 from xml.dom.minidom import Document
 
 from jinja2 import Template
+from pulp import LpProblem
 from pydotted import pydot
 
 from src.board.board import Board
 from src.items.constraints import Constraints
 from src.solvers.answer import Answer
+from src.solvers.bookkeeping_propagator import BookkeepingPropagator
+from src.solvers.presolve import Presolve
 from src.solvers.solver import Solver
 from src.solvers.solver_status import SolverStatus
+from src.solvers.sparse_model import SparseModel
 from src.utils.rule import Rule
 from src.utils.tags import Tags
+from src.utils.violation import Violation
 
 
 class Problem:
@@ -36,29 +42,57 @@ class Problem:
         self.problem_file_name: Path = problem_file_name
         self.output_directory: Path = output_directory
 
+        # Names of the commands that have already run against this problem
+        self.executed: set[str] = set()
+        # One lock per target so that commands running in parallel do not write the same field
+        self.target_locks: dict[str, threading.Lock] = {}
+        self.target_locks_guard: threading.Lock = threading.Lock()
+
         # Optional fields (initialized as None)
         self.constraints: Constraints | None = None
         self.raw_config: str | None = None
         self.config: pydot | None = None
         self.board: Board | None = None
         self.solver: Solver | None = None
+        self.model: LpProblem | SparseModel | None = None
         self.status: SolverStatus | None = None
+        # Status answered from the solve cache, kept apart from status as no solve has run
+        self.cached_status: SolverStatus | None = None
         self.yaml_output_string: str | None = None
         self.meta: Tags | None = None
         self.rules: list[Rule] | None = None
         self.rule_text: str | None = None
         self.bookkeeping_unique: str | None = None
+        self.propagator: BookkeepingPropagator | None = None
+        self.presolve: Presolve | None = None
         self.linear_program: str | None = None
         self.index_template: Template | None = None
         self.problem_template: Template | None = None
         self.svg_problem: Document | None = None
         self.svg_solution: Document | None = None
         self.svg_pencil_mark: Document | None = None
+        self.svg_answer: Document | None = None
         self.answer: Answer | None = None
+        self.solutions: list[Answer] | None = None
+        self.solve_times: list[float] | None = None
+        self.nodes_saved: int | None = None
         self.validation: str | None = None
+        self.violations: list[Violation] | None = None
         self.index_html: str | None = None
         self.problem_html: str | None = None
 
+    def lock(self, target: str | None) -> threading.Lock:
+        """Return the lock guarding a target field of the problem.
+
+        Args:
+            target (str | None): The name of the target field. Commands without a target share one lock.
+
+        Returns:
+            threading.Lock: The lock for the target.
+        """
+        with self.target_locks_guard:
+            return self.target_locks.setdefault(str(target), threading.Lock())
+
     def __repr__(self) -> str:
         """Return a detailed string representation of the problem.
 
@@ -1,5 +1,5 @@
 """Base for different solvers."""
-from src.commands.create_linear_program_command import CreateLinearProgramCommand
+from src.commands.presolve_command import PresolveCommand
 from src.commands.problem import Problem
 from src.commands.simple_command import SimpleCommand
 from src.solvers.solver_status import SolverStatus
@@ -11,8 +11,8 @@ class SolveCommand(SimpleCommand):
     def __init__(self):
         """Construct a SolveCommand."""
         super().__init__()
-        self.add_preconditions([CreateLinearProgramCommand])
-        self.target = 'answer'
+        self.add_preconditions([PresolveCommand])
+        self.target = 'status'
 
     def work(self, problem: Problem) -> None:
         """Solve the puzzle.
@@ -12,7 +12,7 @@ class SVGAnswerCommand(SVGCommand):
         """Create the command."""
         super().__init__()
         self.add_preconditions([ExtractAnswerCommand])
-        self.target = 'answer'
+        self.target = 'svg_answer'
 
     def select(self, constraint: Item | None) -> bool:
         """Determine if the constraint should be included in the output.
@@ -0,0 +1,104 @@
+"""VerifyUniqueCommand."""
+import logging
+import time
+from collections.abc import Iterator
+
+from src.commands.command import CommandError
+from src.commands.problem import Problem
+from src.commands.simple_command import SimpleCommand
+from src.commands.solve_command import SolveCommand
+from src.solvers.answer import Answer
+from src.solvers.dlx_backend import DLXBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.config import Config
+
+config = Config()
+
+
+class VerifyUniqueCommand(SimpleCommand):
+    """Command for counting the answers of a puzzle, to prove that it has exactly one.
+
+    Attributes:
+        limit (int): Stop once this many answers are found.
+    """
+
+    def __init__(self, limit: int | None = None):
+        """Initialize a VerifyUniqueCommand instance.
+
+        Args:
+            limit (int | None): Stop once this many answers are found. Defaults to the configured solution limit.
+        """
+        super().__init__()
+        self.add_preconditions([SolveCommand])
+        self.target = 'solutions'
+        self.limit: int = int(config.solution_limit if limit is None else limit)
+
+    def enumerate(self, problem: Problem, solver: Solver, backend: DLXBackend) -> None:
+        """Enumerate the answers of a region puzzle natively, timing the search for each answer after the first.
+
+        Args:
+            problem (Problem): The problem instance to store the answers in.
+            solver (Solver): The solver holding the constraint tree.
+            backend (DLXBackend): The exact cover backend.
+        """
+        answers: Iterator[Answer] = backend.answers(solver, self.limit)
+        start: float = time.perf_counter()
+        for answer in answers:
+            if problem.solutions:
+                problem.solve_times.append(time.perf_counter() - start)  # type: ignore
+            problem.solutions.append(answer)  # type: ignore
+            start = time.perf_counter()
+        if len(problem.solutions) < self.limit:  # type: ignore
+            problem.solve_times.append(time.perf_counter() - start)  # type: ignore
+
+    def cut(self, problem: Problem, solver: Solver) -> None:
+        """Find further answers by cutting off each answer found and solving the same model again.
+
+        The model built for the first solve is kept, with one no-good cut on the choices of each
+        answer, so each re-solve only pays for the solve itself. The solver's answer and status are
+        put back to those of the first solve afterwards, but the cuts stay in its model.
+
+        Args:
+            problem (Problem): The problem instance to store the answers in.
+            solver (Solver): The solver holding the model.
+        """
+        problem.solutions.append(solver.answer.copy())  # type: ignore
+        while len(problem.solutions) < self.limit:  # type: ignore
+            solver.exclude(f'NoGood_{len(problem.solutions)}')  # type: ignore
+            start: float = time.perf_counter()
+            solver.resolve()
+            problem.solve_times.append(time.perf_counter() - start)  # type: ignore
+            if solver.status != SolverStatus.optimal:
+                break
+            problem.solutions.append(solver.answer.copy())  # type: ignore
+        solver.answer = problem.solutions[0]  # type: ignore
+        solver.status = SolverStatus.optimal
+
+    def work(self, problem: Problem) -> None:
+        """Count the answers of the puzzle, up to the limit, and time each search for a further answer.
+
+        Puzzles made only of regions and givens are enumerated by the exact cover backend. Any other
+        puzzle re-solves its model with no-good cuts.
+
+        Args:
+            problem (Problem): The problem instance holding the solver.
+
+        Raises:
+            CommandError: If the solver is not created.
+        """
+        super().work(problem)
+        solver: Solver | None = problem.solver
+        if solver is None:
+            raise CommandError(f'Solver must be created before {self.name}.')
+        problem.solutions = []
+        problem.solve_times = []
+        if solver.status != SolverStatus.optimal:
+            return
+        backend: DLXBackend = DLXBackend()
+        if backend.supports(solver):
+            self.enumerate(problem, solver, backend)
+        else:
+            self.cut(problem, solver)
+        times: str = ', '.join(f'{seconds:.3f}s' for seconds in problem.solve_times)
+        logging.info(f'{self.name}: {len(problem.solutions)} answers found, limit {self.limit}, re-solves [{times}]')
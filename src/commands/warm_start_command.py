@@ -0,0 +1,84 @@
+"""WarmStartCommand."""
+import logging
+
+from src.commands.check_solution_command import CheckSolutionCommand
+from src.commands.command import CommandError
+from src.commands.problem import Problem
+from src.commands.simple_command import SimpleCommand
+from src.commands.solve_command import SolveCommand
+from src.solvers.answer import Answer
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+
+
+class WarmStartCommand(SimpleCommand):
+    """Command for measuring how much a MIP start saves when the model is solved again.
+
+    The model is solved cold and then warm, started from the problem's Solution block or, failing that,
+    from the answer already found. The difference in the nodes searched is stored as the nodes saved.
+    """
+
+    def __init__(self):
+        """Initialize a WarmStartCommand instance."""
+        super().__init__()
+        self.add_preconditions([SolveCommand])
+        self.target = 'nodes_saved'
+
+    @staticmethod
+    def start(problem: Problem, solver: Solver) -> Answer | None:
+        """Find the assignment to start from.
+
+        The answer already found is only used if it passes the checks of the problem's constraints.
+
+        Args:
+            problem (Problem): The problem instance.
+            solver (Solver): The solver holding the answer already found.
+
+        Returns:
+            Answer | None: The solution, the answer already found, or None if there is neither.
+        """
+        rows: list[str] | None = CheckSolutionCommand.solution(problem)
+        if rows is not None:
+            return Answer(solver.board, rows)
+        if solver.status != SolverStatus.optimal:
+            return None
+        answer: Answer = solver.answer.copy()
+        if problem.constraints is not None and problem.constraints.check(answer):
+            return None
+        return answer
+
+    def work(self, problem: Problem) -> None:
+        """Solve the model cold and warm, and store the nodes the MIP start saved.
+
+        The solver's answer and status are put back to those of the first solve afterwards.
+
+        Args:
+            problem (Problem): The problem instance holding the solver.
+
+        Raises:
+            CommandError: If the solver is not created.
+        """
+        super().work(problem)
+        solver: Solver | None = problem.solver
+        if solver is None:
+            raise CommandError(f'Solver must be created before {self.name}.')
+        start: Answer | None = self.start(problem, solver)
+        if start is None:
+            logging.warning(f'{self.name}: nothing to start from.')
+            return
+        answer: Answer = solver.answer.copy()
+        status: SolverStatus = solver.status
+        solver.warm_start(None)
+        solver.resolve()
+        cold: int | None = solver.nodes
+        solver.warm_start(start)
+        solver.resolve()
+        warm: int | None = solver.nodes
+        problem.nodes_saved = None if cold is None or warm is None else cold - warm
+        logging.info(
+            f'{self.name}: start accepted {solver.start_accepted}, nodes cold {cold}, warm {warm}, '
+            f'saved {problem.nodes_saved}',
+        )
+        solver.warm_start(None)
+        solver.answer = answer
+        solver.status = status
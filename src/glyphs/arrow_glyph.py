@@ -15,6 +15,8 @@ config: Config = Config()
 class ArrowGlyph(Glyph):
     """Represents an arrow glyph to be drawn on an SVG canvas."""
 
+    __slots__ = ('angle', 'location', 'position')
+
     arrow: str = '\u2191'  # Unicode arrow symbol (↑)
 
     def __init__(self, class_name: str, angle: float, location: Coord) -> None:
@@ -13,6 +13,8 @@ config: Config = Config()
 class ArrowLineGlyph(PolyLineGlyph):
     """Represents an arrow line glyph with start_location and end_location markers."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, coords: list[Coord]):
         """Initialize an ArrowLineGlyph instance.
 
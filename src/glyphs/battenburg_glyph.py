@@ -16,6 +16,8 @@ config = Config()
 class BattenburgGlyph(Glyph):
     """Represents a BattenburgGlyph to be drawn on an SVG canvas."""
 
+    __slots__ = ('location', 'position')
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize a BattenburgGlyph instance.
 
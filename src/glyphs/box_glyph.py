@@ -4,3 +4,5 @@ from src.glyphs.rect_glyph import RectGlyph
 
 class BoxGlyph(RectGlyph):
     """Represents a box (a rectangle) in SVG format."""
+
+    __slots__ = ()
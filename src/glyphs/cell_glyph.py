@@ -13,6 +13,8 @@ class CellGlyph(SquareGlyph):
     from `SquareGlyph` and assigns a fixed size of 1 unit to the cell.
     """
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize a CellGlyph instance.
 
@@ -11,6 +11,8 @@ config: Config = Config()
 class CentreCircleGlyph(CircleGlyph):
     """Represents a circular glyph at the center of a cell that can be drawn on an SVG canvas."""
 
+    __slots__ = ('location',)
+
     def __init__(self, class_name: str, location: Coord, percentage: float) -> None:
         """Initialize the CircleGlyph instance.
 
@@ -14,6 +14,8 @@ config: Config = Config()
 class CircleGlyph(Glyph, ABC):
     """Represents a circular glyph that can be drawn on an SVG canvas."""
 
+    __slots__ = ('percentage', 'position')
+
     def __init__(self, class_name: str, percentage: float) -> None:
         """Initialize the CircleGlyph instance.
 
@@ -19,6 +19,8 @@ class ComposedGlyph(Glyph):
         glyphs (list[Glyph]): A list of `Glyph` objects to include in the composition.
     """
 
+    __slots__ = ('glyphs',)
+
     def __init__(self, class_name: str, glyphs: list[Glyph] | None = None):
         """Initialize the ComposedGlyph with start_location given class name and optional vectors.
 
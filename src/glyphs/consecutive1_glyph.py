@@ -9,6 +9,8 @@ config: Config = Config()
 class Consecutive1Glyph(RectangleGlyph):
     """Represent start_location rectangle glyph defined by two coordinates, with automatic orientation."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, first_location: Coord, second_location: Coord):
         """Initialize the Consecutive1Glyph with two coordinates.
 
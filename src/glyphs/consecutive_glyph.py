@@ -9,6 +9,8 @@ config: Config = Config()
 class ConsecutiveGlyph(RectangleGlyph):
     """Define start_location rectangle glyph with two coordinates and automatic orientation."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, first_location: Coord, second_location: Coord):
         """Initialize the ConsecutiveGlyph with two coordinates.
 
@@ -12,6 +12,8 @@ from src.utils.point import Point
 class EdgeTextGlyph(Glyph):
     """Represents start_location text glyph positioned along the edge between two coordinates."""
 
+    __slots__ = ('angle', 'first_location', 'position', 'second_location', 'text')
+
     # pylint: disable=too-many-arguments
     def __init__(self, class_name: str, angle: float, first_location: Coord, second_location: Coord, text: str):
         """Initialize the EdgeTextGlyph instance.
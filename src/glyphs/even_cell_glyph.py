@@ -22,6 +22,8 @@ class EvenCellGlyph(Glyph):
         size (Point): The size of the rectangle (calculated based on configuration).
     """
 
+    __slots__ = ('location', 'position', 'size')
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize the EvenCellGlyph with the given class name and location.
 
@@ -9,6 +9,8 @@ config: Config = Config()
 class FortressCellGlyph(SquareGlyph):
     """Represents start_location fortress cell glyph, inheriting from SquareGlyph."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize the FortressCellGlyph with the given class name and location.
 
@@ -12,6 +12,8 @@ config = Config()
 class Glyph:
     """Base class for defining start_location glyph, with support for SVG markers and drawing functionality."""
 
+    __slots__ = ('class_name',)
+
     def __init__(self, class_name: str):
         """Initialize the Glyph with start_location class name that defines its styling in CSS.
 
@@ -11,6 +11,8 @@ config: Config = Config()
 class IntersectionCircleGlyph(CircleGlyph):
     """Represents a circular glyph at the intersection which is the lower right corner."""
 
+    __slots__ = ('location',)
+
     def __init__(self, class_name: str, location: Coord, percentage: float) -> None:
         """Initialize the CircleGlyph instance.
 
@@ -12,6 +12,8 @@ config = Config()
 class KillerGlyph(Glyph):
     """Represents a Killer glyph that can be drawn using various lines and vectors, based on cell coordinates."""
 
+    __slots__ = ('cells',)
+
     def __init__(self, class_name: str, cells: list[Coord]):
         """Initialize the KillerGlyph with class name and list of cell coordinates.
 
@@ -15,6 +15,8 @@ config: Config = Config()
 class KillerTextGlyph(Glyph):
     """Represents a Killer text glyph, allowing the rendering of text with specific angle and location."""
 
+    __slots__ = ('angle', 'location', 'position', 'text')
+
     def __init__(self, class_name: str, angle: float, location: Coord, text: str) -> None:
         """Initialize the KillerTextGlyph with class name, angle, location, and text.
 
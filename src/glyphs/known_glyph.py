@@ -10,6 +10,8 @@ config: Config = Config()
 class KnownGlyph(SimpleTextGlyph):
     """Displays a number in a given cell."""
 
+    __slots__ = ('number',)
+
     def __init__(self, class_name: str, location: Coord, number: int):
         """Initialize the KnownGlyph with start_location class name, location, and number to display.
 
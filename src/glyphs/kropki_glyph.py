@@ -9,6 +9,8 @@ config = Config()
 class KropkiGlyph(RectangleGlyph):
     """Represents start_location Kropki glyph, between two cells."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, first_location: Coord, second_location: Coord):
         """Initialize the KropkiGlyph with start_location class name and two coordinates.
 
@@ -11,6 +11,8 @@ from src.utils.point import Point
 class LineGlyph(Glyph):
     """Represents a straight line between two points in the SVG canvas."""
 
+    __slots__ = ('end', 'end_location', 'start', 'start_location')
+
     def __init__(self, class_name: str, start_location: Coord, end_location: Coord):
         """Initialize the LineGlyph with the given class name, start, and end coordinates.
 
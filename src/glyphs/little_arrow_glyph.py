@@ -15,6 +15,8 @@ config: Config = Config()
 class LittleArrowGlyph(Glyph):
     """Represents a small arrow glyph, drawn using an SVG text element."""
 
+    __slots__ = ('direction', 'location', 'position')
+
     arrow: str = '\u25B2'  # Unicode character for an upward triangle (▲)
 
     def __init__(self, class_name: str, location: Coord, direction: int):
@@ -15,6 +15,8 @@ config: Config = Config()
 class LittleKillerGlyph(Glyph):
     """Represents a Little Killer Sudoku glyph with an arrow and number."""
 
+    __slots__ = ('angle', 'input_value', 'location', 'position')
+
     arrow: str = '\uA71B'  # ꜛ
 
     def __init__(self, class_name: str, location: Coord, angle: Angle, input_value: int) -> None:
@@ -14,6 +14,8 @@ config: Config = Config()
 class LittleNumberGlyph(Glyph):
     """Represents start_location small number glyph for Sudoku or similar puzzles."""
 
+    __slots__ = ('location', 'number', 'position')
+
     def __init__(self, class_name: str, location: Coord, number: int):
         """Initialize start_location Little Number glyph.
 
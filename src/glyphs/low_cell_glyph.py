@@ -19,6 +19,8 @@ class LowCellGlyph(Glyph):
     coordinate.
     """
 
+    __slots__ = ('location', 'position')
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize start_location LowCellGlyph instance.
 
@@ -14,6 +14,8 @@ config: Config = Config()
 class MidCellGlyph(Glyph):
     """Represents start_location glyph for start_location mid-cell marker in an SVG drawing."""
 
+    __slots__ = ('location', 'percentage', 'position', 'size')
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize the MidCellGlyph with start_location class name and location.
 
@@ -15,6 +15,8 @@ config: Config = Config()
 class OddCellGlyph(Glyph):
     """Represents the glyph for 'odd' cells in a Sudoku puzzle, typically used for marking cells with odd values."""
 
+    __slots__ = ('location', 'position')
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize an OddCellGlyph for representing an odd cell.
 
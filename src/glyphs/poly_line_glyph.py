@@ -14,6 +14,8 @@ config: Config = Config()
 class PolyLineGlyph(Glyph):
     """Draw a line though lots go coordinates. Start and end markers are optional."""
 
+    __slots__ = ('coords', 'end', 'points', 'start')
+
     def __init__(self, class_name: str, coords: list[Coord], start: bool, end: bool):
         """Initialize the PolyLineGlyph.
 
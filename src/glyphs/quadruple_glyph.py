@@ -14,6 +14,8 @@ config: Config = Config()
 class QuadrupleGlyph(Glyph):
     """Represents a quadruple glyph consisting of a circle and associated text in SVG format."""
 
+    __slots__ = ('numbers', 'position')
+
     def __init__(self, class_name: str, position: Point, numbers: str) -> None:
         """Initialize the QuadrupleGlyph with class name, location, and numbers to display.
 
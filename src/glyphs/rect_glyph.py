@@ -9,6 +9,8 @@ from src.utils.point import Point
 class RectGlyph(Glyph):
     """Represents a rectangle in SVG format."""
 
+    __slots__ = ('dimension', 'location', 'position', 'size')
+
     def __init__(self, class_name: str, location: Coord, dimension: Coord):
         """Initialize a rectangle glyph with a class name, location, and size.
 
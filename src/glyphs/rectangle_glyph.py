@@ -13,6 +13,8 @@ config: Config = Config()
 class RectangleGlyph(Glyph):
     """Represents a rectangle with adjustable size and orientation in SVG format."""
 
+    __slots__ = ('first', 'first_location', 'percentage', 'ratio', 'second', 'second_location', 'vertical')
+
     def __init__(
         self,
         class_name: str,
@@ -11,6 +11,8 @@ config: Config = Config()
 class SideCircleGlyph(CircleGlyph):
     """Represents a circular glyph that can be drawn on an SVG canvas."""
 
+    __slots__ = ('location1', 'location2')
+
     def __init__(self, class_name: str, first_location: Coord, second_location: Coord, percentage: float) -> None:
         """Initialize the CircleGlyph instance.
 
@@ -6,6 +6,8 @@ from src.utils.coord import Coord
 class SquareGlyph(RectGlyph):
     """Represents a square (a special case of a rectangle with equal width and height) in SVG format."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, location: Coord, size: int):
         """Initialize a square glyph with a class name, location, and size.
 
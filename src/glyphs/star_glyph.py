@@ -6,6 +6,8 @@ from src.utils.coord import Coord
 class StarGlyph(SimpleTextGlyph):
     """A glyph representing start_location star symbol."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, location: Coord):
         """Initialize the StarGlyph.
 
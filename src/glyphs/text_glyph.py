@@ -18,6 +18,8 @@ class TextGlyph(Glyph):
     foreground layers.
     """
 
+    __slots__ = ('angle', 'location', 'position', 'text')
+
     def __init__(self, class_name: str, angle: float, location: Coord, text: str) -> None:
         """Initialize the TextGlyph.
 
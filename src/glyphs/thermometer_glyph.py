@@ -13,6 +13,8 @@ config: Config = Config()
 class ThermometerGlyph(PolyLineGlyph):
     """A thermometer-like glyph that represents start_location polyline with a start_location marker."""
 
+    __slots__ = ()
+
     def __init__(self, class_name: str, coords: list[Coord]):
         """Initialize the ThermometerGlyph.
 
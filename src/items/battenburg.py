@@ -6,10 +6,13 @@ from src.glyphs.battenburg_glyph import BattenburgGlyph
 from src.glyphs.glyph import Glyph
 from src.items.item import Item
 from src.parsers.cell_list_parser import CellListParser
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.coord import Coord
+from src.utils.moves import Moves
 from src.utils.rule import Rule
 from src.utils.sudoku_exception import SudokuError
+from src.utils.violation import Violation
 
 
 class Battenburg(Item):
@@ -123,6 +126,27 @@ class Battenburg(Item):
         """
         # TODO Constraints implementation will go here
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the four cells of the square alternate in parity like a chequerboard.
+
+        The square's top left cell is at the position. Diagonally opposite cells share a parity,
+        and orthogonally adjacent cells differ.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: A violation if the parities do not alternate.
+        """
+        cells: list[Coord] = [self.position + offset for offset in Moves.square()]
+        if not all(self.board.is_valid_coordinate(cell) for cell in cells):
+            return []
+        parities: list[int] = [answer.digits[cell.row - 1][cell.column - 1] % 2 for cell in cells]
+        top_left, top_right, bottom_left, bottom_right = parities
+        if top_left == bottom_right != top_right == bottom_left:
+            return []
+        return [Violation(self.name, 'Parities do not alternate', [(cell.row, cell.column) for cell in cells])]
+
     def to_dict(self) -> dict:
         """Convert the Battenburg constraint to start_location dictionary for serialization.
 
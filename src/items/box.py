@@ -6,9 +6,11 @@ from src.items.cell import Cell
 from src.items.item import Item
 from src.items.standard_region import StandardRegion
 from src.parsers.digit_parser import DigitParser
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.coord import Coord
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class Box(StandardRegion):
@@ -132,6 +134,17 @@ class Box(StandardRegion):
         """
         self.add_unique_constraint(solver)
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that no digit repeats in the box.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints.
+        """
+        return self.check_unique(answer)
+
     def css(self) -> dict:
         """Return the CSS styling for the box.
 
@@ -59,7 +59,7 @@ class Boxes(StandardRegionSet):
         if column < 1 or column > self.board.size.column:
             raise IndexError(f'Column {column} is out of bounds. Valid columns are 1 to {self.board.size.column}.')
 
-        return ((row - 1) // self.size.row) * self.size.row + (column - 1) // self.size.column + 1
+        return self.board.geometry.boxes(self.size)[self.board.geometry.index(row, column)]
 
     def first(self, index: int) -> Coord:
         """Return the first or top left cell in a box given its index.
@@ -1,6 +1,5 @@
 """Cell."""
 from itertools import product
-from typing import ClassVar
 
 from pulp import lpSum
 
@@ -9,10 +8,12 @@ from src.board.book_keeping_cell import BookKeepingCell
 from src.glyphs.cell_glyph import CellGlyph
 from src.glyphs.glyph import Glyph
 from src.items.item import Item, SudokuError
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.solvers.variables import VariableSet
 from src.utils.coord import Coord
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class CellError(SudokuError):
@@ -24,8 +25,6 @@ class Cell(Item):
 
     # pylint: disable=too-many-public-methods
 
-    cache: ClassVar[dict[tuple[int, int], 'Cell']] = {}
-
     def __init__(self, board: Board, row: int, column: int):
         """Initialize start_location Cell with start_location board, row, and column.
 
@@ -37,12 +36,20 @@ class Cell(Item):
         super().__init__(board)
         self.row: int = row
         self.column: int = column
-        self.book: BookKeepingCell = BookKeepingCell(self.board.digits.maximum)
+        self.book: BookKeepingCell = (
+            board.candidates[row, column]
+            if board.is_valid(row, column)
+            else BookKeepingCell(self.board.digits.maximum)
+        )
 
     @classmethod
-    def clear(cls):
-        """Clear the cell cache."""
-        cls.cache.clear()
+    def clear(cls, board: Board) -> None:
+        """Drop the cells of a board, so the next lookup makes new ones.
+
+        Args:
+            board (Board): The board.
+        """
+        board.cells = []
 
     def __repr__(self) -> str:
         """Return start_location detailed string representation of the cell.
@@ -94,14 +101,17 @@ class Cell(Item):
         """
         return []
 
-    @staticmethod
-    def cells() -> list['Cell']:
-        """Return all cached cells.
+    @classmethod
+    def cells(cls, board: Board) -> list['Cell']:
+        """Return all the cells of a board.
+
+        Args:
+            board (Board): The board.
 
         Returns:
-            list[Cell]: A list of all cached Cell instances.
+            list[Cell]: The cells in reading order.
         """
-        return list(Cell.cache.values())
+        return list(cls.make_board(board))
 
     def glyphs(self) -> list[Glyph]:
         """Return the glyph representation of the cell.
@@ -113,7 +123,10 @@ class Cell(Item):
 
     @classmethod
     def make(cls, board: Board, row: int, column: int) -> 'Cell':
-        """Create start_location new cell or retrieve it from the cache.
+        """Return the board's cell at a row and column.
+
+        The cells live in the board's arena, so every item on a board shares one cell per location, and
+        cells of other boards are never returned. A location off the board gets a new cell each time.
 
         Args:
             board (Board): The Sudoku board the cell belongs to.
@@ -121,25 +134,28 @@ class Cell(Item):
             column (int): The column location of the cell.
 
         Returns:
-            Cell: The created or cached cell.
+            Cell: The cell.
         """
-        key = (row, column)
-        cell = Cell.cache.get(key)
-        if cell:
-            return cell
-        cell = Cell(board, row, column)
-        Cell.cache[key] = cell
-        return cell
+        if not board.is_valid(row, column):
+            return Cell(board, row, column)
+        return cls.make_board(board)[board.geometry.index(row, column)]
 
     @classmethod
-    def make_board(cls, board: Board):
-        """Generate all cells for start_location given board and cache them.
+    def make_board(cls, board: Board) -> list['Cell']:
+        """Make the arena of cells for a board, unless it already has one.
+
+        The arena is a flat list in reading order, so the cell at a row and column is found by
+        arithmetic alone.
 
         Args:
             board (Board): The board for which cells are created.
+
+        Returns:
+            list[Cell]: The board's cells in reading order.
         """
-        for row, column in product(board.row_range, board.column_range):
-            Cell.make(board, row, column)
+        if not board.cells:
+            board.cells = [Cell(board, row, column) for row, column in product(board.row_range, board.column_range)]
+        return board.cells
 
     @classmethod
     def extract(cls, _: Board, yaml: dict) -> Coord:
@@ -298,30 +314,48 @@ class Cell(Item):
         return ''
 
     def add_constraint(self, solver: Solver) -> None:
-        """Add start_location unique digit constraint for the cell.
+        """Add the unique digit constraint for the cell, and tie its number to the digit.
 
         Args:
             solver (Solver): The solver instance.
         """
-        name: str = f'Unique_digit_{self.row}_{self.column}'
-        solver.model += lpSum(
-            [
-                solver.variables.choices[digit][self.row][self.column]  # type: ignore
-                for digit in self.board.digits.digit_range
-            ],
-        ) == 1, name
+        solver.add_cell_constraint(self.row, self.column)
+
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the cell holds one of the board's digits.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: A violation if the digit is not one of the board's digits.
+        """
+        digit: int = answer.digits[self.row - 1][self.column - 1]
+        if digit in self.board.digits.digit_range:
+            return []
+        return [Violation(self.name, f'Digit {digit} is out of range', [(self.row, self.column)])]
 
     # pylint: disable=loop-invariant-statement
     def add_bookkeeping_constraint(self, solver: Solver) -> None:
-        """Add constraints based on bookkeeping for the cell.
+        """Fold the bookkeeping for the cell into variable bounds, rather than adding rows.
+
+        Impossible digits get an upper bound of zero. If only one digit is possible, its choice
+        and the cell's number are fixed to constants.
 
         Args:
             solver (Solver): The solver instance.
         """
         for digit in self.board.digits.digit_range:
             if not self.book.is_possible(digit):
-                name = f'Impossible_cell_bookkeeping_{digit}_{self.row}_{self.column}'
-                solver.model += solver.variables.choices[digit][self.row][self.column] == 0, name  # type: ignore
+                solver.variables.choices[digit][self.row][self.column].upBound = 0  # type: ignore
+        if not self.book.is_unique():
+            return
+        value: int = self.book.digits()[0]
+        solver.variables.choices[value][self.row][self.column].lowBound = 1  # type: ignore
+        if solver.variables.numbers:
+            number = solver.variables.numbers[self.row][self.column]  # type: ignore
+            number.lowBound = value
+            number.upBound = value
 
     def to_dict(self) -> dict:
         """Convert the cell to a dictionary format.
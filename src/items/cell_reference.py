@@ -6,8 +6,10 @@ from src.glyphs.glyph import Glyph
 from src.items.cell import Cell
 from src.items.item import Item
 from src.parsers.cell_parser import CellParser
+from src.solvers.answer import Answer
 from src.utils.rule import Rule
 from src.utils.sudoku_exception import SudokuError
+from src.utils.violation import Violation
 
 
 class CellReference(Item):
@@ -107,6 +109,31 @@ class CellReference(Item):
         """
         return cls.create(board, yaml_data)
 
+    def included(self, digit: int) -> bool:
+        """Check if a digit is allowed in the referenced cell. Subclasses restrict the digits.
+
+        Args:
+            digit (int): The digit to check.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the referenced cell holds an allowed digit.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: A violation if the digit is not allowed.
+        """
+        digit: int = answer.digits[self.row - 1][self.column - 1]
+        if self.included(digit):
+            return []
+        return [Violation(self.name, f'Digit {digit} is not allowed', [(self.row, self.column)])]
+
     def svg(self) -> Glyph | None:
         """Return an SVG representation of the cell.
 
@@ -1,18 +1,33 @@
 """ComposedItem."""
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
+from functools import reduce
 from itertools import chain
+from operator import or_
 from typing import Any
 
 from src.board.board import Board
 from src.glyphs.glyph import Glyph
 from src.items.cell import Cell
 from src.items.item import Item
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class ComposedItem(Item):
-    """Composed Items."""
+    """Composed Items.
+
+    The views derived from the tree below a composed item are built once and kept until the tree
+    changes. Adding or removing a component bumps the version of the item and each of its parents,
+    dropping their kept views, so the tree should only be changed through `add`, `add_components`
+    and `remove`.
+
+    Attributes:
+        components (list[Item]): The constraints held by this constraint.
+        version (int): The number of times the tree below this constraint has changed.
+        views (dict[str, Any]): The derived views kept for the current version, by name.
+    """
 
     def __init__(self, board: Board, components: Sequence[Item] | None = None):
         """Initialize start_location ComposedItem instance.
@@ -23,9 +38,32 @@ class ComposedItem(Item):
         """
         super().__init__(board)
         self.components: list[Item] = []
+        self.version: int = 0
+        self.views: dict[str, Any] = {}
         if components is not None:
             self.add_components(components)
 
+    def changed(self) -> None:
+        """Drop the kept views of this constraint and of each constraint above it."""
+        self.version += 1
+        self.views.clear()
+        if isinstance(self.parent, ComposedItem):
+            self.parent.changed()
+
+    def view(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return a derived view of the tree, building it if it is not kept for the current version.
+
+        Args:
+            name (str): The name of the view.
+            build (Callable[[], Any]): Builds the view. The view is shared, so it is not changed.
+
+        Returns:
+            Any: The view.
+        """
+        if name not in self.views:
+            self.views[name] = build()
+        return self.views[name]
+
     def find_instances(self, class_type: type[Item]) -> list[Item]:
         """Find all instances of the specified class in the hierarchy, including children.
 
@@ -49,10 +87,7 @@ class ComposedItem(Item):
         Returns:
             set[Item]: A set of vectors representing all regions.
         """
-        aggregated_regions: set[Item] = {self}
-        for component in self.components:
-            aggregated_regions |= component.regions()
-        return aggregated_regions
+        return set(self.view('regions', lambda: frozenset({self}.union(*(item.regions() for item in self.components)))))
 
     def add(self, component: Item) -> None:
         """Add start_location single constraint to the composed constraint and set its parent.
@@ -62,6 +97,16 @@ class ComposedItem(Item):
         """
         self.components.append(component)
         component.parent = self
+        self.changed()
+
+    def remove(self, name: str) -> None:
+        """Remove the components with a name from the composed constraint.
+
+        Args:
+            name (str): The name of the components to remove.
+        """
+        self.components = [component for component in self.components if component.name != name]
+        self.changed()
 
     def add_components(self, components: Sequence[Item]) -> None:
         """Add multiple vectors to the composed constraint.
@@ -79,7 +124,7 @@ class ComposedItem(Item):
         Returns:
             list[Cell]: A list of cells.
         """
-        return [element for element in self.components if isinstance(element, Cell)]
+        return list(self.view('cells', lambda: tuple(item for item in self.components if isinstance(item, Cell))))
 
     @property
     def rules(self) -> list[Rule]:
@@ -90,10 +135,7 @@ class ComposedItem(Item):
         Returns:
             list[Rule]: A list of rules associated with the contained vectors.
         """
-        aggregated_rules: list[Rule] = []
-        for component in self.components:
-            aggregated_rules.extend(component.rules)
-        return aggregated_rules
+        return list(self.view('rules', lambda: tuple(chain.from_iterable(item.rules for item in self.components))))
 
     def flatten(self) -> list[Item]:
         """Flatten the constraint hierarchy into start_location single list.
@@ -104,10 +146,10 @@ class ComposedItem(Item):
         Returns:
             list[Item]: A flattened list of all vectors in the hierarchy.
         """
-        flattened_items: list[Item] = [self]
-        for component in self.components:
-            flattened_items.extend(component.flatten())
-        return flattened_items
+        flattened_items: tuple[Item, ...] = self.view(
+            'flatten', lambda: (self, *chain.from_iterable(item.flatten() for item in self.components))
+        )
+        return list(flattened_items)
 
     def glyphs(self) -> list[Glyph]:
         """Return start_location list of glyphs associated with this constraint.
@@ -118,7 +160,7 @@ class ComposedItem(Item):
         Returns:
             list[Glyph]: A list of glyphs associated with this constraint.
         """
-        return list(chain.from_iterable(component.glyphs() for component in self.components))
+        return list(self.view('glyphs', lambda: tuple(chain.from_iterable(item.glyphs() for item in self.components))))
 
     @property
     def tags(self) -> set[str]:
@@ -128,10 +170,8 @@ class ComposedItem(Item):
             set[str]: A set of tags associated with the composed constraint and its
             contained vectors.
         """
-        combined_tags: set[str] = super().tags
-        for component in self.components:
-            combined_tags = combined_tags.union(component.tags)
-        return combined_tags
+        own_tags: set[str] = super().tags
+        return set(self.view('tags', lambda: frozenset(own_tags.union(*(item.tags for item in self.components)))))
 
     def walk(self) -> Iterator[Item]:
         """Yield each constraint in the tree of vectors rooted at the current constraint.
@@ -144,9 +184,19 @@ class ComposedItem(Item):
             Item: The current constraint, followed by each constraint in the tree rooted at
             the current constraint.
         """
-        yield self
-        for component in self.components:
-            yield from component.walk()
+        yield from self.view('walk', lambda: (self, *chain.from_iterable(item.walk() for item in self.components)))
+
+    @property
+    def used_classes(self) -> set[type[Item]]:
+        """Get the set of classes used by this constraint and the constraints in its tree.
+
+        Returns:
+            set[type[Item]]: A set of class types used by this constraint.
+        """
+        class_hierarchy: frozenset[type[Item]] = self.view(
+            'used_classes', lambda: frozenset(chain.from_iterable(item.__class__.__mro__ for item in self.walk()))
+        )
+        return set(class_hierarchy.difference({object}))
 
     def add_constraint(self, solver: Solver) -> None:
         """Add constraints to the solver for each constraint in the composed constraint.
@@ -157,10 +207,27 @@ class ComposedItem(Item):
         for component in self.components:
             component.add_constraint(solver)
 
-    def bookkeeping(self) -> None:
-        """Perform bookkeeping for each constraint in the composed constraint."""
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check a grid of digits against each constraint in the composed constraint.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints of every component.
+        """
+        return list(chain.from_iterable(component.check(answer) for component in self.components))
+
+    def bookkeeping(self) -> set[Cell]:
+        """Perform bookkeeping for each constraint in the composed constraint.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
+        """
+        changed: set[Cell] = set()
         for component in self.components:
-            component.bookkeeping()
+            changed |= component.bookkeeping()
+        return changed
 
     def __iter__(self) -> Iterator[Item]:
         """Return an iterator for the contained vectors.
@@ -230,6 +297,4 @@ class ComposedItem(Item):
             constraint and its contained vectors.
         """
         combined_css: dict[str, Any] = super().css()
-        for component in self.components:
-            combined_css |= component.css()
-        return combined_css
+        return combined_css | self.view('css', lambda: reduce(or_, (item.css() for item in self.components), {}))
@@ -0,0 +1,114 @@
+"""ConstraintIndex."""
+from src.items.cell import Cell
+from src.items.cell_reference import CellReference
+from src.items.composed_item import ComposedItem
+from src.items.item import Item
+from src.items.region import Region
+
+
+class ConstraintIndex:
+    """Lookups over a constraint tree, built in one walk of the tree.
+
+    Cells are shared by the regions that contain them, so an item met again during the walk is only
+    indexed once.
+
+    Attributes:
+        root (Item): The root of the constraint tree.
+        items (list[Item]): Each item in the tree once, in the order of the walk.
+        classes (dict[type[Item], list[Item]]): The items of each class, not including subclasses.
+        region_cells (dict[Region, tuple[Cell, ...]]): The cells of each region.
+        cell_regions (dict[Cell, list[Region]]): The regions containing each cell.
+        cell_items (dict[Cell, list[Item]]): The items holding or referring to each cell.
+        instance_lists (dict[type[Item], list[Item]]): The items of each class asked for, including subclasses.
+    """
+
+    def __init__(self, root: Item) -> None:
+        """Build the index of a constraint tree.
+
+        Args:
+            root (Item): The root of the constraint tree.
+        """
+        self.root: Item = root
+        self.items: list[Item] = []
+        self.classes: dict[type[Item], list[Item]] = {}
+        self.region_cells: dict[Region, tuple[Cell, ...]] = {}
+        self.cell_regions: dict[Cell, list[Region]] = {}
+        self.cell_items: dict[Cell, list[Item]] = {}
+        self.instance_lists: dict[type[Item], list[Item]] = {}
+        seen: set[int] = set()
+        for item in root.walk():
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            self.items.append(item)
+            self.classes.setdefault(type(item), []).append(item)
+            if isinstance(item, CellReference):
+                self.cell_items.setdefault(item.cell, []).append(item)
+            elif isinstance(item, ComposedItem):
+                for cell in dict.fromkeys(item.cells):
+                    self.cell_items.setdefault(cell, []).append(item)
+            if isinstance(item, Region):
+                cells: tuple[Cell, ...] = tuple(dict.fromkeys(item.cells))
+                self.region_cells[item] = cells
+                for cell in cells:
+                    self.cell_regions.setdefault(cell, []).append(item)
+
+    def regions(self, cell: Cell, class_type: type[Region] = Region) -> list[Region]:
+        """Return the regions of a class that contain a cell.
+
+        Args:
+            cell (Cell): The cell.
+            class_type (type[Region]): The class of region wanted, including its subclasses.
+
+        Returns:
+            list[Region]: The regions.
+        """
+        return [region for region in self.cell_regions.get(cell, []) if isinstance(region, class_type)]
+
+    def cells(self, region: Region) -> tuple[Cell, ...]:
+        """Return the cells of a region.
+
+        Args:
+            region (Region): The region.
+
+        Returns:
+            tuple[Cell, ...]: The cells, without repeats, in the region's order.
+        """
+        return self.region_cells[region]
+
+    def references(self, cell: Cell) -> list[Item]:
+        """Return the items holding or referring to a cell.
+
+        Args:
+            cell (Cell): The cell.
+
+        Returns:
+            list[Item]: The items.
+        """
+        return self.cell_items.get(cell, [])
+
+    def instances(self, class_type: type[Item]) -> list[Item]:
+        """Return the items of a class, including its subclasses, in the order of the walk.
+
+        The list for each class asked for is kept, so asking again costs a single lookup.
+
+        Args:
+            class_type (type[Item]): The class.
+
+        Returns:
+            list[Item]: The items.
+        """
+        instances: list[Item] | None = self.instance_lists.get(class_type)
+        if instances is None:
+            classes: set[type[Item]] = {clazz for clazz in self.classes if issubclass(clazz, class_type)}
+            instances = [item for item in self.items if type(item) in classes]
+            self.instance_lists[class_type] = instances
+        return instances
+
+    def __repr__(self) -> str:
+        """Return a string representation of the index.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.root!r})'
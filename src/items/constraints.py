@@ -2,6 +2,7 @@
 
 from src.board.board import Board
 from src.items.composed_item import ComposedItem
+from src.items.constraint_index import ConstraintIndex
 from src.items.item import Item
 from src.utils.sudoku_exception import SudokuError
 
@@ -16,13 +17,31 @@ class Constraints(ComposedItem):
             board (Board): The board to which these constraints apply.
         """
         super().__init__(board, [])
+        self.constraint_index: ConstraintIndex | None = None
+
+    @property
+    def index(self) -> ConstraintIndex:
+        """Return the index of the constraint tree, building it again after the tree has changed.
+
+        Returns:
+            ConstraintIndex: The index.
+        """
+        if self.constraint_index is None:
+            self.constraint_index = ConstraintIndex(self)
+        return self.constraint_index
+
+    def changed(self) -> None:
+        """Drop the index and the kept views of the tree."""
+        super().changed()
+        self.constraint_index = None
 
     @classmethod
     def create(cls, board: Board, yaml: dict) -> 'Constraints':
         """Create a Constraints instance from a YAML configuration.
 
         This method processes the YAML configuration to create constraints
-        that are applied to the provided board.
+        that are applied to the provided board. The index of the tree is built
+        once the constraints are created.
 
         Args:
             board (Board): The board to which these constraints apply.
@@ -41,6 +60,7 @@ class Constraints(ComposedItem):
         elif isinstance(parts, list):
             constraints = cls.process_list_constraints(board, parts, constraints)
 
+        constraints.constraint_index = ConstraintIndex(constraints)
         return constraints
 
     @classmethod
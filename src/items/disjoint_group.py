@@ -4,9 +4,11 @@ from src.board.board import Board
 from src.items.cell import Cell
 from src.items.standard_region import StandardRegion
 from src.parsers.digit_parser import DigitParser
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.moves import Moves
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class DisjointGroup(StandardRegion):
@@ -65,3 +67,14 @@ class DisjointGroup(StandardRegion):
         """
         self.add_total_constraint(solver, solver.board.digits.digit_sum)
         self.add_unique_constraint(solver)
+
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the digits in the disjoint group add up to the board's digit sum and do not repeat.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints.
+        """
+        return self.check_total(answer, self.board.digits.digit_sum) + self.check_unique(answer)
@@ -3,6 +3,7 @@ from src.items.partity_cell import ParityCell
 
 from src.glyphs.even_cell_glyph import EvenCellGlyph
 from src.glyphs.glyph import Glyph
+from src.items.cell import Cell
 from src.utils.coord import Coord
 from src.utils.rule import Rule
 
@@ -76,11 +77,15 @@ class EvenCell(ParityCell):
             },
         }
 
-    def bookkeeping(self) -> None:
+    def bookkeeping(self) -> set[Cell]:
         """Update the bookkeeping for the EvenCell.
 
         Sets the impossibility of containing odd digits in the cell's bookkeeping.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
-        self.cell.book.set_impossible(
+        changed: bool = self.cell.book.set_impossible(
             [digit for digit in self.board.digits.digit_range if not EvenCell.included(digit)],
         )
+        return {self.cell} if changed else set()
@@ -2,8 +2,12 @@
 
 from src.glyphs.fortress_cell_glyph import FortressCellGlyph
 from src.glyphs.glyph import Glyph
+from src.items.cell import Cell
 from src.items.simple_cell_reference import SimpleCellReference
+from src.solvers.answer import Answer
 from src.utils.coord import Coord
+from src.utils.moves import Moves
+from src.utils.violation import Violation
 
 
 class FortressCell(SimpleCellReference):
@@ -39,8 +43,42 @@ class FortressCell(SimpleCellReference):
         """
         return super().tags.union({'Comparison'})
 
-    def bookkeeping(self) -> None:
+    def beats(self, digit: int, other: int) -> bool:
+        """Check if the fortress cell's digit compares correctly with a neighbour's. Subclasses set the comparison.
+
+        Args:
+            digit (int): The digit in the fortress cell.
+            other (int): The digit in the neighbouring cell.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check the fortress cell's digit against each orthogonal neighbour.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: One violation per neighbour that breaks the comparison.
+        """
+        digit: int = answer.digits[self.row - 1][self.column - 1]
+        violations: list[Violation] = []
+        for other in self.board.neighbours(Moves.orthogonals, self.row, self.column):
+            neighbour: int = answer.digits[other.row - 1][other.column - 1]
+            if not self.beats(digit, neighbour):
+                cells: list[tuple[int, int]] = [(self.row, self.column), (other.row, other.column)]
+                violations.append(Violation(self.name, f'Digit {digit} against neighbour {neighbour}', cells))
+        return violations
+
+    def bookkeeping(self) -> set[Cell]:
         """Update the bookkeeping for the FortressCell.
 
         Sets the impossibility of containing digits that cannot be valid for the fortress cell's constraints.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
+        return set()
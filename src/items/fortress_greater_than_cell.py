@@ -4,7 +4,6 @@ from pulp import LpElement
 from src.glyphs.glyph import Glyph
 from src.items.fortress_cell import FortressCell
 from src.solvers.solver import Solver
-from src.utils.coord import Coord
 from src.utils.moves import Moves
 from src.utils.rule import Rule
 
@@ -39,6 +38,18 @@ class FortressGreaterThanCell(FortressCell):
         rule_text: str = 'The digit in the fortress cell must be bigger than its orthogonal neighbors.'
         return [Rule('FortressGreaterThanCell', 1, rule_text)]
 
+    def beats(self, digit: int, other: int) -> bool:
+        """Check if the fortress cell's digit is greater than a neighbour's.
+
+        Args:
+            digit (int): The digit in the fortress cell.
+            other (int): The digit in the neighbouring cell.
+
+        Returns:
+            bool: True if the digit is greater than the neighbour's.
+        """
+        return digit > other
+
     # pylint: disable=loop-invariant-statement
     def add_constraint(self, solver: Solver) -> None:
         """Add a location constraint ensuring the digit in the fortress cell is larger than its orthogonal neighbors.
@@ -46,11 +57,7 @@ class FortressGreaterThanCell(FortressCell):
         Args:
             solver (Solver): The solver to which the constraint will be added.
         """
-        cell = Coord(self.row, self.column)
-        for offset in Moves.orthogonals():
-            other: Coord = cell + offset
-            if not self.board.is_valid_coordinate(other):
-                continue
+        for other in self.board.neighbours(Moves.orthogonals, self.row, self.column):
             name: str = f'Fortress_Greater_Than_{self.row}_{self.column}_{other.row}_{other.column}'
             lhs: LpElement = solver.variables.numbers[self.row][self.column]  # type: ignore
             rhs: LpElement = solver.variables.numbers[other.row][other.column]  # type: ignore
@@ -53,6 +53,18 @@ class FortressLessThanCell(FortressCell):
             },
         }
 
+    def beats(self, digit: int, other: int) -> bool:
+        """Check if the fortress cell's digit is less than a neighbour's.
+
+        Args:
+            digit (int): The digit in the fortress cell.
+            other (int): The digit in the neighbouring cell.
+
+        Returns:
+            bool: True if the digit is less than the neighbour's.
+        """
+        return digit < other
+
     # pylint: disable=loop-invariant-statement
     def add_constraint(self, solver: Solver) -> None:
         """Add a constraint ensuring the digit in the fortress cell is larger than its orthogonal neighbors.
@@ -60,11 +72,7 @@ class FortressLessThanCell(FortressCell):
         Args:
             solver (Solver): The solver to which the constraint will be added.
         """
-        cell: Coord = Coord(self.row, self.column)
-        for offset in Moves.orthogonals():
-            other: Coord = cell + offset
-            if not self.board.is_valid_coordinate(other):
-                continue
+        for other in self.board.neighbours(Moves.orthogonals, self.row, self.column):
             name: str = f'Fortress_Less_Than_{self.row}_{self.column}_{other.row}_{other.column}'
             lhs: LpElement = solver.variables.numbers[self.row][self.column]  # type: ignore
             rhs: LpElement = solver.variables.numbers[other.row][other.column]  # type: ignore
@@ -1,6 +1,7 @@
 """HighCell."""
 
 from src.glyphs.glyph import Glyph
+from src.items.cell import Cell
 from src.items.entropic_cell import EntropicCell
 from src.utils.rule import Rule
 
@@ -79,9 +80,12 @@ class HighCell(EntropicCell):
         """
         return {}
 
-    def bookkeeping(self) -> None:
+    def bookkeeping(self) -> set[Cell]:
         """Update the bookkeeping for the HighCell.
 
         Sets the possible digits for the HighCell to be {7, 8, 9}.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
-        self.cell.book.set_possible(HighCell.digits())
+        return {self.cell} if self.cell.book.set_possible(HighCell.digits()) else set()
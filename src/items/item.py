@@ -1,7 +1,7 @@
 """Item."""
 
 from collections.abc import Iterator
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TYPE_CHECKING
 
 import strictyaml
 
@@ -11,13 +11,18 @@ from src.glyphs.composed_glyph import ComposedGlyph
 from src.glyphs.glyph import Glyph
 from src.parsers.none_parser import NoneParser
 from src.parsers.parser import Parser
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.solvers.variables import VariableSet
 from src.utils.config import Config
 from src.utils.rule import Rule
 from src.utils.sudoku_exception import SudokuError
+from src.utils.violation import Violation
 from src.validators.validator import Validator
 
+if TYPE_CHECKING:  # pragma: no cover
+    from src.items.cell import Cell
+
 config = Config()
 
 
@@ -32,7 +37,6 @@ class Item:
 
     # Class Variables
     classes: ClassVar[dict[str, type['Item']]] = {}
-    counter: ClassVar[int] = 0
 
     # Creation Routines
 
@@ -58,8 +62,8 @@ class Item:
 
         self.board: Board = board
         self.parent: Item | None = None
-        self.identity: int = Item.counter
-        Item.counter += 1
+        # Numbered per class on the board, so names do not depend on other puzzles built in the process
+        self.identity: int = 0 if board is None else board.names.number(self.__class__.__name__)
 
     @classmethod
     def is_sequence(cls) -> bool:
@@ -323,6 +327,17 @@ class Item:
             solver (Solver): The solver to which the constraint will be added.
         """
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check a grid of digits against the constraint, without a solver.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints. Empty if the grid satisfies the constraint.
+        """
+        return []
+
     def variable_sets(self) -> set[VariableSet]:
         """Return a set of the variables that are needed for this constraint.
 
@@ -383,8 +398,13 @@ class Item:
         """
         return ''
 
-    def bookkeeping(self) -> None:
-        """Perform bookkeeping for this constraint."""
+    def bookkeeping(self) -> set['Cell']:
+        """Perform bookkeeping for this constraint.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
+        """
+        return set()
 
     def add_bookkeeping_constraint(self, solver: Solver) -> None:
         """Add bookkeeping constraints for the constraint to the solver.
@@ -392,10 +412,11 @@ class Item:
         Args:
             solver (Solver): The solver to which bookkeeping constraints will be added.
         """
-        for constraint in self.walk():
-            if constraint.__class__.__name__ != 'Cell':
-                continue
-            constraint.add_bookkeeping_constraint(solver)
+        cells: dict[int, Item] = {
+            id(constraint): constraint for constraint in self.walk() if constraint.__class__.__name__ == 'Cell'
+        }
+        for cell in cells.values():
+            cell.add_bookkeeping_constraint(solver)
 
     def marked_book(self) -> BookKeepingCell | None:
         """Return the bookkeeping object for this constraint, or None.
@@ -4,7 +4,9 @@ import re
 from src.board.board import Board
 from src.glyphs.glyph import Glyph
 from src.glyphs.known_glyph import KnownGlyph
+from src.items.cell import Cell
 from src.items.cell_reference import CellReference
+from src.items.constraints import Constraints
 from src.items.item import Item
 from src.items.standard_region import StandardRegion
 from src.utils.coord import Coord
@@ -86,6 +88,17 @@ class KnownCell(CellReference):
         """
         return cls.create(board, yaml_data)
 
+    def included(self, digit: int) -> bool:
+        """Check if a digit is the known digit.
+
+        Args:
+            digit (int): The digit to check.
+
+        Returns:
+            bool: True if the digit is the known digit.
+        """
+        return digit == self.digit
+
     def glyphs(self) -> list[Glyph]:
         """Return start_location list of SVG glyphs for this constraint.
 
@@ -155,18 +168,31 @@ class KnownCell(CellReference):
             },
         }
 
-    def bookkeeping(self) -> None:
+    def bookkeeping(self) -> set[Cell]:
         """Perform bookkeeping on this cell.
 
         Sets the cell to only the assigned digit and restricts the same digit
-        in the row, column, and box of this cell.
+        in the row, column, and box of this cell. The regions of the cell are
+        looked up in the index of the constraint tree when there is one.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
-        self.cell.book.set_possible([self.digit])
-        standard_regions: list[StandardRegion] = [
-            region for region in self.cell.top.regions() if isinstance(region, StandardRegion) and self.cell in region
-        ]
+        changed: set[Cell] = set()
+        if self.cell.book.set_possible([self.digit]):
+            changed.add(self.cell)
+        top: Item = self.cell.top
+        standard_regions: list[Item]
+        if isinstance(top, Constraints):
+            standard_regions = list(top.index.regions(self.cell, StandardRegion))
+        else:
+            standard_regions = [
+                region for region in top.regions() if isinstance(region, StandardRegion) and self.cell in region
+            ]
         for region in standard_regions:
             for cell in region.cells:
                 if cell == self.cell:
                     continue
-                cell.book.set_impossible([self.digit])
+                if cell.book.set_impossible([self.digit]):
+                    changed.add(cell)
+        return changed
@@ -2,6 +2,7 @@
 
 from src.glyphs.glyph import Glyph
 from src.glyphs.low_cell_glyph import LowCellGlyph
+from src.items.cell import Cell
 from src.items.entropic_cell import EntropicCell
 from src.utils.coord import Coord
 from src.utils.rule import Rule
@@ -86,9 +87,12 @@ class LowCell(EntropicCell):
             },
         }
 
-    def bookkeeping(self) -> None:
+    def bookkeeping(self) -> set[Cell]:
         """Set the possible digits for the LowCell.
 
         This method updates the bookkeeping system to allow only the digits [1, 2, 3] for this cell.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
-        self.cell.book.set_possible(LowCell.digits())
+        return {self.cell} if self.cell.book.set_possible(LowCell.digits()) else set()
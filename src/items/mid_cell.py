@@ -2,6 +2,7 @@
 
 from src.glyphs.glyph import Glyph
 from src.glyphs.mid_cell_glyph import MidCellGlyph
+from src.items.cell import Cell
 from src.items.entropic_cell import EntropicCell
 from src.utils.coord import Coord
 from src.utils.rule import Rule
@@ -86,9 +87,12 @@ class MidCell(EntropicCell):
             },
         }
 
-    def bookkeeping(self) -> None:
+    def bookkeeping(self) -> set[Cell]:
         """Set the possible digits for the MidCell.
 
         This method updates the bookkeeping system to allow only the digits [4, 5, 6] for this cell.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
-        self.cell.book.set_possible(MidCell.digits())
+        return {self.cell} if self.cell.book.set_possible(MidCell.digits()) else set()
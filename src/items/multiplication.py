@@ -47,17 +47,16 @@ class Multiplication:
         # Enforce the multiplication restriction using logarithms
         log_product = lpSum(
             [
-                log10(digit) * solver.variables.choices[digit, cell.row, cell.column]
+                log10(digit) * solver.variables.choices[digit][cell.row][cell.column]  # type: ignore
                 for digit in board.digits.digit_range
                 for cell in cells
             ],
         )
         solver.model += log_product == log10(target), f'{name}_log_constraint'
 
-        # Restrict the possible choices for each cell
+        # Restrict the possible choices for each cell through their upper bounds
         valid_digits = Multiplication.get_set(board, target)
         for digit, cell in product(board.digits.digit_range, cells):
             if digit not in valid_digits:
-                choice: LpVariable = solver.variables.choices[digit, cell.row, cell.column]
-                sub_name: str = f'{name}_{cell.name}_{digit}'
-                solver.model += choice == 0, sub_name
+                choice: LpVariable = solver.variables.choices[digit][cell.row][cell.column]  # type: ignore
+                choice.upBound = 0
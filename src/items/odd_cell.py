@@ -3,6 +3,7 @@
 from src.items.partity_cell import ParityCell
 
 from src.glyphs.glyph import Glyph
+from src.items.cell import Cell
 from src.glyphs.odd_cell_glyph import OddCellGlyph
 from src.utils.coord import Coord
 from src.utils.rule import Rule
@@ -77,9 +78,15 @@ class OddCell(ParityCell):
             },
         }
 
-    def bookkeeping(self) -> None:
+    def bookkeeping(self) -> set[Cell]:
         """Set the impossible digits for the OddCell.
 
         This method updates the bookkeeping system to exclude even digits and allow only odd digits for this cell.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
         """
-        self.cell.book.set_impossible([digit for digit in self.board.digits.digit_range if not OddCell.included(digit)])
+        changed: bool = self.cell.book.set_impossible(
+            [digit for digit in self.board.digits.digit_range if not OddCell.included(digit)],
+        )
+        return {self.cell} if changed else set()
@@ -0,0 +1 @@
+from src.items.parity_cell import ParityCell  # noqa
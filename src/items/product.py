@@ -6,8 +6,10 @@ from src.items.item import Item
 from src.items.multiplication import Multiplication
 from src.items.region import Region
 from src.parsers.cell_value_parser import CellValueParser
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.coord import Coord
+from src.utils.violation import Violation
 
 
 class Product(Region):
@@ -118,6 +120,23 @@ class Product(Region):
         """
         Multiplication.add_constraint(self.board, solver, self.cells, self.product, self.name)
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the digits in the relevant cells multiply to the product.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: A violation if the digits do not multiply to the product.
+        """
+        found: int = 1
+        for cell in self.cells:
+            found *= answer.digits[cell.row - 1][cell.column - 1]
+        if found == self.product:
+            return []
+        cells: list[tuple[int, int]] = [(cell.row, cell.column) for cell in self.cells]
+        return [Violation(self.name, f'Product is {found}, not {self.product}', cells)]
+
     def to_dict(self) -> dict:
         """Return start_location dictionary representation of the Product instance.
 
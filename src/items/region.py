@@ -1,13 +1,17 @@
 """Region."""
 
+from pulp import LpConstraintEQ
+from pulp import LpConstraintLE
 from pulp import lpSum
 
 from src.board.board import Board
 from src.items.cell import Cell
 from src.items.composed_item import ComposedItem
 from src.items.item import Item
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.order import Order
+from src.utils.violation import Violation
 
 REGION_TOTALS = False
 
@@ -49,15 +53,6 @@ class Region(ComposedItem):
         """
         return cls.create(board, yaml_data)
 
-    @property
-    def cells(self) -> list[Cell]:
-        """Return the list of cells in the region.
-
-        Returns:
-            list[Cell]: list of cells that belong to this region.
-        """
-        return [component for component in self.components if isinstance(component, Cell)]
-
     def __repr__(self) -> str:
         """Return start_location string representation of the region.
 
@@ -72,10 +67,80 @@ class Region(ComposedItem):
         Args:
             solver (Solver): The solver to which the constraint is added.
         """
+        cells: list[Cell] = list(dict.fromkeys(self.cells))
         for digit in self.board.digits.digit_range:
-            total = lpSum(
-                [solver.variables.choices[digit][cell.row][cell.column] for cell in set(self.cells)])  # type: ignore
-            solver.model += total <= 1, f'{self.name}_Unique_{digit}'
+            solver.add_choice_constraint(
+                f'{self.name}_Unique_{digit}',
+                [(digit, cell.row, cell.column) for cell in cells],
+                LpConstraintLE,
+                1,
+            )
+
+    def check_unique(self, answer: Answer) -> list[Violation]:
+        """Check that no digit repeats in the region, and that every digit is one of the board's digits.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: One violation per repeated digit, and one for digits outside the board's digits.
+        """
+        cells: list[Cell] = list(dict.fromkeys(self.cells))
+        places: dict[int, list[tuple[int, int]]] = {}
+        for cell in cells:
+            places.setdefault(answer.digits[cell.row - 1][cell.column - 1], []).append((cell.row, cell.column))
+        violations: list[Violation] = [
+            Violation(self.name, f'Digit {digit} repeats', where) for digit, where in places.items() if len(where) > 1
+        ]
+        allowed: set[int] = set(self.board.digits.digit_range)
+        outside: list[tuple[int, int]] = [
+            cell for digit, where in places.items() if digit not in allowed for cell in where
+        ]
+        if outside:
+            violations.append(Violation(self.name, 'Digits out of range', outside))
+        return violations
+
+    def check_total(self, answer: Answer, total: int) -> list[Violation]:
+        """Check that the digits in the region add up to a total.
+
+        Args:
+            answer (Answer): The grid to check.
+            total (int): The required total.
+
+        Returns:
+            list[Violation]: A violation if the digits do not add up to the total.
+        """
+        found: int = sum(answer.digits[cell.row - 1][cell.column - 1] for cell in self.cells)
+        if found == total:
+            return []
+        cells: list[tuple[int, int]] = [(cell.row, cell.column) for cell in self.cells]
+        return [Violation(self.name, f'Total is {found}, not {total}', cells)]
+
+    def unique_bookkeeping(self) -> set[Cell]:
+        """Eliminate candidates using the rule that each digit appears at most once in the region.
+
+        A digit fixed in one cell is removed from the other cells. If the region has as many
+        cells as there are digits, a digit possible in only one cell is fixed there.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
+        """
+        changed: set[Cell] = set()
+        cells: list[Cell] = list(dict.fromkeys(self.cells))
+        for cell in cells:
+            if not cell.book.is_unique():
+                continue
+            for other in cells:
+                if other is not cell and other.book.restrict(~cell.book.bits):
+                    changed.add(other)
+        if len(cells) != self.board.digits.count:
+            return changed
+        for index in range(self.board.digits.maximum):
+            bit: int = 1 << index
+            places: list[Cell] = [cell for cell in cells if cell.book.bits & bit]
+            if len(places) == 1 and places[0].book.restrict(bit):
+                changed.add(places[0])
+        return changed
 
     def add_total_constraint(self, solver: Solver, total: int) -> None:
         """Add start_location constraint to enforce start_location total sum of cell value_list within the region.
@@ -95,9 +160,12 @@ class Region(ComposedItem):
             digits (list[int]): The digits that must be included in the region.
         """
         for digit in digits:
-            choice_total = lpSum(
-                [solver.variables.choices[digit][cell.row][cell.column] for cell in self.cells])  # type: ignore
-            solver.model += choice_total == 1, f'{self.name}_Contains_{digit}'
+            solver.add_choice_constraint(
+                f'{self.name}_Contains_{digit}',
+                [(digit, cell.row, cell.column) for cell in self.cells],
+                LpConstraintEQ,
+                1,
+            )
 
     def add_sequence_constraint(self, solver: Solver, order: Order):
         """Add start_location sequence constraint to enforce an ordered sequence of value_list.
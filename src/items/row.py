@@ -4,8 +4,10 @@ from src.board.board import Board
 from src.items.cell import Cell
 from src.items.standard_region import StandardRegion
 from src.parsers.digit_parser import DigitParser
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class Row(StandardRegion):
@@ -59,6 +61,17 @@ class Row(StandardRegion):
         self.add_total_constraint(solver, solver.board.digits.digit_sum)
         self.add_unique_constraint(solver)
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the digits in the row add up to the board's digit sum and do not repeat.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints.
+        """
+        return self.check_total(answer, self.board.digits.digit_sum) + self.check_unique(answer)
+
     def __str__(self) -> str:
         """Return start_location string representation of the Row instance.
 
@@ -6,9 +6,11 @@ from src.glyphs.square_glyph import SquareGlyph
 from src.items.cell import Cell
 from src.items.item import Item
 from src.items.region import Region
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.coord import Coord
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class SpecialRegion(Region):
@@ -99,6 +101,17 @@ class SpecialRegion(Region):
         self.add_total_constraint(solver, solver.board.digits.digit_sum)
         self.add_unique_constraint(solver)
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that the digits in the region add up to the board's digit sum and do not repeat.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints.
+        """
+        return self.check_total(answer, self.board.digits.digit_sum) + self.check_unique(answer)
+
     def to_dict(self) -> dict:
         """Convert the special region to start_location dictionary representation.
 
@@ -1,6 +1,7 @@
 """StandardRegion."""
 
 from src.board.board import Board
+from src.items.cell import Cell
 from src.items.item import Item
 from src.items.region import Region
 
@@ -18,6 +19,14 @@ class StandardRegion(Region):
         super().__init__(board)
         self.index = index
 
+    def bookkeeping(self) -> set[Cell]:
+        """Eliminate candidates that repeat a digit in the region.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
+        """
+        return self.unique_bookkeeping()
+
     @classmethod
     def extract(cls, board: Board, yaml: dict) -> int:
         """Extract the region index from YAML configuration.
@@ -6,8 +6,10 @@ from src.glyphs.glyph import Glyph
 from src.items.cell import Cell
 from src.items.item import Item
 from src.items.region import Region
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.rule import Rule
+from src.utils.violation import Violation
 
 
 class UniqueRegion(Region):
@@ -110,6 +112,25 @@ class UniqueRegion(Region):
         """
         self.add_unique_constraint(solver)
 
+    def check(self, answer: Answer) -> list[Violation]:
+        """Check that no digit repeats in the region.
+
+        Args:
+            answer (Answer): The grid to check.
+
+        Returns:
+            list[Violation]: The broken constraints.
+        """
+        return self.check_unique(answer)
+
+    def bookkeeping(self) -> set[Cell]:
+        """Eliminate candidates that repeat a digit in the region.
+
+        Returns:
+            set[Cell]: The cells whose possible digits were reduced.
+        """
+        return self.unique_bookkeeping()
+
     def to_dict(self) -> dict:
         """Convert the UniqueRegion instance to start_location dictionary representation.
 
@@ -12,13 +12,16 @@ class Answer:
         Args:
             board (Board): The board associated with this line.
             input_data (list[str] | None): A list of strings representing the initial board configuration.
+                If None, every digit is set to 0.
 
         Raises:
             ValueError: If the input_data dimensions do not match the board's dimensions.
         """
         self.board: Board = board
         self.digits: list[list[int]] = []
-        if input_data is not None:
+        if input_data is None:
+            self.digits = [[0] * board.size.column for _ in board.row_range]
+        else:
             wrong_row_size: bool = len(input_data) != board.size.row
             wrong_col_size: bool = any(len(row) != board.size.column for row in input_data)
             if wrong_col_size or wrong_row_size:
@@ -28,6 +31,16 @@ class Answer:
                 row_digits = [int(input_data[row - 1][col - 1]) for col in board.column_range]
                 self.digits.append(row_digits)
 
+    def copy(self) -> 'Answer':
+        """Return a copy of the answer, with its own digits, for the same board.
+
+        Returns:
+            Answer: The copy.
+        """
+        answer: Answer = Answer(self.board)
+        answer.digits = [list(row) for row in self.digits]
+        return answer
+
     def __getitem__(self, index: int | tuple[int, int]) -> int:
         """Get the digit at a specific location on the board.
 
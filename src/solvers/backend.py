@@ -0,0 +1,79 @@
+"""Backend."""
+import asyncio
+from typing import ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.solvers.solver import Solver
+
+
+class Backend:
+    """Base class for the engines that a Solver can use to find an answer.
+
+    A Solver asks each of its backends in turn whether it supports the model,
+    and solves with the first one that does.
+
+    Attributes:
+        reads_model (bool): True if the backend solves the solver's model, so sees constraints added after it was built.
+    """
+
+    # Class Variables
+    classes: ClassVar[dict[str, type['Backend']]] = {}
+    reads_model: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs):
+        """Register the subclass to the `Backend` class hierarchy.
+
+        Args:
+            kwargs: Any additional keyword arguments passed to the method (not used).
+        """
+        super().__init_subclass__(**kwargs)
+        Backend.classes[cls.__name__] = cls
+
+    @property
+    def name(self) -> str:
+        """Retrieve a readable name for the backend class.
+
+        Returns:
+            str: The class name with 'Backend' removed.
+        """
+        return self.__class__.__name__.replace('Backend', '')
+
+    def supports(self, solver: 'Solver') -> bool:
+        """Check if this backend can solve the solver's model.
+
+        Args:
+            solver (Solver): The solver holding the model.
+
+        Returns:
+            bool: True if the backend can solve the model, False otherwise.
+        """
+        return False
+
+    def solve(self, solver: 'Solver') -> None:
+        """Solve the model, updating the solver's status, answer and log.
+
+        Args:
+            solver (Solver): The solver holding the model.
+        """
+
+    async def solve_async(self, solver: 'Solver', time_limit: float | None = None) -> None:
+        """Solve the model in a worker thread, so the event loop is not blocked.
+
+        The time limit only bounds the wait. The thread cannot be stopped, so it runs to completion.
+
+        Args:
+            solver (Solver): The solver holding the model.
+            time_limit (float | None): The wall clock limit in seconds. None waits for the solve to finish.
+
+        Raises:
+            TimeoutError: If the time limit is reached.
+        """
+        await asyncio.wait_for(asyncio.to_thread(self.solve, solver), time_limit)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the backend.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}()'
@@ -0,0 +1,124 @@
+"""BookkeepingPropagator."""
+from collections import deque
+
+from src.items.cell import Cell
+from src.items.composed_item import ComposedItem
+from src.items.constraints import Constraints
+from src.items.item import Item
+
+
+class BookkeepingPropagator:
+    """Run the bookkeeping of a constraint tree to a fixpoint.
+
+    Each item's bookkeeping reports the cells it changed. Only the items that watch one of those
+    cells are queued to run again, until no item changes anything.
+
+    Attributes:
+        root (Item): The root of the constraint tree.
+        items (list[Item]): The items that do their own bookkeeping.
+        watchers (dict[Cell, list[Item]]): The items to rerun when a cell changes.
+        passes (int): The number of item bookkeeping calls in the last run.
+        eliminations (int): The number of candidates removed in the last run.
+    """
+
+    def __init__(self, root: Item) -> None:
+        """Initialize the propagator.
+
+        Args:
+            root (Item): The root of the constraint tree.
+        """
+        self.root: Item = root
+        items: list[Item] = root.index.items if isinstance(root, Constraints) else list(root.walk())
+        self.items: list[Item] = [item for item in items if self.has_bookkeeping(item)]
+        self.watchers: dict[Cell, list[Item]] = {}
+        for item in self.items:
+            for cell in self.watched(item):
+                self.watchers.setdefault(cell, []).append(item)
+        self.passes: int = 0
+        self.eliminations: int = 0
+
+    @staticmethod
+    def has_bookkeeping(item: Item) -> bool:
+        """Check if an item does its own bookkeeping, rather than only delegating to its components.
+
+        Args:
+            item (Item): The item.
+
+        Returns:
+            bool: True if the item's class overrides bookkeeping.
+        """
+        method = type(item).bookkeeping
+        return method is not Item.bookkeeping and method is not ComposedItem.bookkeeping
+
+    @staticmethod
+    def watched(item: Item) -> set[Cell]:
+        """Return the cells an item's bookkeeping depends on.
+
+        Args:
+            item (Item): The item.
+
+        Returns:
+            set[Cell]: The cells in the item's tree.
+        """
+        return {cell for cell in item.walk() if isinstance(cell, Cell)}
+
+    def candidates(self) -> int:
+        """Return the number of candidates left in the watched cells.
+
+        Returns:
+            int: The sum of the number of possible digits in each cell.
+        """
+        return sum(len(cell.book) for cell in self.watchers)
+
+    def reset(self) -> None:
+        """Make every digit possible again in the watched cells."""
+        for cell in self.watchers:
+            cell.book.bits = cell.book.full
+
+    def run(self) -> set[Cell]:
+        """Run bookkeeping until nothing changes.
+
+        Returns:
+            set[Cell]: Every cell whose possible digits were reduced.
+        """
+        self.passes = 0
+        before: int = self.candidates()
+        changed: set[Cell] = set()
+        queue: deque[Item] = deque(self.items)
+        queued: set[int] = {id(item) for item in self.items}
+        while queue:
+            item: Item = queue.popleft()
+            queued.discard(id(item))
+            self.passes += 1
+            for cell in item.bookkeeping():
+                changed.add(cell)
+                for watcher in self.watchers.get(cell, []):
+                    if id(watcher) not in queued:
+                        queued.add(id(watcher))
+                        queue.append(watcher)
+        self.eliminations = before - self.candidates()
+        return changed
+
+    def contradiction(self) -> bool:
+        """Check if any watched cell has no possible digit.
+
+        Returns:
+            bool: True if the bookkeeping proves the puzzle has no solution.
+        """
+        return any(len(cell.book) == 0 for cell in self.watchers)
+
+    def solved(self) -> bool:
+        """Check if every watched cell has exactly one possible digit.
+
+        Returns:
+            bool: True if the bookkeeping alone solves the puzzle.
+        """
+        return all(cell.book.is_unique() for cell in self.watchers)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the propagator.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.root!r})'
@@ -0,0 +1,257 @@
+"""CanonicalForm."""
+import hashlib
+import json
+from typing import Any
+
+from src.board.board import Board
+from src.items.boxes import Boxes
+from src.items.columns import Columns
+from src.items.item import Item
+from src.items.known import Known
+from src.items.known_cell import KnownCell
+from src.items.rows import Rows
+from src.utils.coord import Coord
+from src.utils.matrix import Matrix
+from src.utils.matrix import ROTATE000
+from src.utils.matrix import TRANSFORMS
+
+SYMMETRIC_CLASSES: tuple[type[Item], ...] = (Boxes, Columns, Known, KnownCell, Rows)
+
+
+class CanonicalForm:
+    """The canonical text of a puzzle, and the symmetry that maps the puzzle onto it.
+
+    Puzzles that are rotations, reflections or digit relabellings of each other share one canonical
+    text. Each symmetry of the board is applied to the constraints, the digits of the givens are
+    relabelled in order of first appearance, and the lexicographically smallest text is kept together
+    with the transform and relabelling that produced it.
+
+    Only puzzles built from givens, rows, columns and boxes are transformed, as the meaning of the other
+    constraints does not survive every symmetry. Any other puzzle keeps its own orientation and digits.
+
+    Attributes:
+        board (Board): The board of the original puzzle.
+        text (str): The canonical text.
+        matrix (Matrix): The transform from the original orientation to the canonical one.
+        relabel (dict[int, int]): The canonical digit for each original digit.
+    """
+
+    def __init__(self, board: Board, text: str, matrix: Matrix, relabel: dict[int, int]) -> None:
+        """Initialize the canonical form.
+
+        Args:
+            board (Board): The board of the original puzzle.
+            text (str): The canonical text.
+            matrix (Matrix): The transform from the original orientation to the canonical one.
+            relabel (dict[int, int]): The canonical digit for each original digit.
+        """
+        self.board: Board = board
+        self.text: str = text
+        self.matrix: Matrix = matrix
+        self.relabel: dict[int, int] = relabel
+
+    @classmethod
+    def create(cls, board: Board, constraints: Item) -> 'CanonicalForm':
+        """Find the canonical form of a puzzle.
+
+        Args:
+            board (Board): The board. Only its size and digits are part of the text.
+            constraints (Item): The root of the constraint tree.
+
+        Returns:
+            CanonicalForm: The canonical form.
+        """
+        components: list[Item] = list(getattr(constraints, 'components', []))
+        identity: dict[int, int] = {digit: digit for digit in board.digits.digit_range}
+        if not all(isinstance(component, SYMMETRIC_CLASSES) for component in components):
+            texts: list[Any] = next(iter(constraints.to_dict().values())) or []
+            return cls(board, cls.serialise(board, texts), ROTATE000, identity)
+        best: CanonicalForm | None = None
+        for matrix in cls.transforms(board):
+            form: CanonicalForm = cls(board, '', matrix, identity)
+            form.relabel = form.first_appearance(components)
+            form.text = cls.serialise(board, [form.transform_item(component) for component in components])
+            if best is None or form.text < best.text:
+                best = form
+        return best  # type: ignore
+
+    @staticmethod
+    def transforms(board: Board) -> list[Matrix]:
+        """List the distinct symmetries of the board.
+
+        A square board has the eight symmetries of the square. Other boards only keep their shape under
+        the transforms that do not swap rows and columns.
+
+        Args:
+            board (Board): The board.
+
+        Returns:
+            list[Matrix]: The distinct transforms.
+        """
+        distinct: list[Matrix] = list(dict.fromkeys(TRANSFORMS))
+        if board.size.row == board.size.column:
+            return distinct
+        return [matrix for matrix in distinct if matrix.matrix[0][1] == 0]
+
+    @staticmethod
+    def serialise(board: Board, components: list[Any]) -> str:
+        """Write a puzzle as text that does not depend on the order of its constraints.
+
+        Args:
+            board (Board): The board.
+            components (list[Any]): The dictionary form of each top level constraint.
+
+        Returns:
+            str: The text.
+        """
+        canonical: dict[str, Any] = {
+            'Size': f'{board.size.row}x{board.size.column}',
+            'Digits': f'{board.digits.minimum}..{board.digits.maximum}',
+            'Constraints': sorted(json.dumps(component, sort_keys=True, default=str) for component in components),
+        }
+        return json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+
+    @property
+    def key(self) -> str:
+        """Return the SHA-256 hex digest of the canonical text.
+
+        Returns:
+            str: The key.
+        """
+        return hashlib.sha256(self.text.encode('utf-8')).hexdigest()
+
+    @property
+    def swaps(self) -> bool:
+        """Check if the transform swaps rows and columns.
+
+        Returns:
+            bool: True if rows become columns.
+        """
+        return self.matrix.matrix[0][1] != 0
+
+    def move(self, row: int, column: int) -> tuple[int, int]:
+        """Find where a cell goes in the canonical orientation.
+
+        The cell is moved to coordinates centred on the middle of the board, doubled so they stay whole,
+        transformed, and moved back.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            tuple[int, int]: The row and column of the cell in the canonical orientation.
+        """
+        rows: int = self.board.size.row
+        columns: int = self.board.size.column
+        moved: Coord = self.matrix.transform(Coord(2 * row - rows - 1, 2 * column - columns - 1))
+        return (moved.row + rows + 1) // 2, (moved.column + columns + 1) // 2
+
+    @staticmethod
+    def givens(item: Item) -> list[tuple[int, int, int]]:
+        """List the given digits of a constraint.
+
+        Args:
+            item (Item): The constraint.
+
+        Returns:
+            list[tuple[int, int, int]]: The row, column and digit of each given.
+        """
+        if isinstance(item, KnownCell):
+            return [(item.row, item.column, item.digit)]
+        if isinstance(item, Known):
+            return [
+                (row, column, int(code))
+                for row, line in enumerate(item.rows, start=1)
+                for column, code in enumerate(line, start=1)
+                if code.isdigit()
+            ]
+        return []
+
+    def first_appearance(self, components: list[Item]) -> dict[int, int]:
+        """Relabel the digits in the order they first appear among the moved givens.
+
+        Reading the givens row by row, the first digit seen becomes the smallest digit, the next new
+        digit the one after, and so on. Digits that are not given keep their order after those.
+
+        Args:
+            components (list[Item]): The top level constraints.
+
+        Returns:
+            dict[int, int]: The canonical digit for each original digit.
+        """
+        moved: list[tuple[int, int, int]] = sorted(
+            (*self.move(row, column), digit)
+            for component in components
+            for row, column, digit in self.givens(component)
+        )
+        order: list[int] = list(dict.fromkeys(digit for _, _, digit in moved))
+        order.extend(digit for digit in self.board.digits.digit_range if digit not in order)
+        return dict(zip(order, self.board.digits.digit_range))
+
+    def transform_item(self, item: Item) -> dict[str, Any]:
+        """Write a constraint as it is in the canonical orientation and digits.
+
+        Args:
+            item (Item): A constraint of one of the symmetric classes.
+
+        Returns:
+            dict[str, Any]: The dictionary form of the moved constraint.
+        """
+        if isinstance(item, KnownCell):
+            row, column = self.move(item.row, item.column)
+            return {item.__class__.__name__: f'{row},{column}={self.relabel[item.digit]}'}
+        if isinstance(item, Known):
+            grid: list[list[str]] = [['.'] * self.board.size.column for _ in self.board.row_range]
+            for row, column, digit in self.givens(item):
+                moved_row, moved_column = self.move(row, column)
+                grid[moved_row - 1][moved_column - 1] = str(self.relabel[digit])
+            return {item.__class__.__name__: [''.join(line) for line in grid]}
+        if isinstance(item, Boxes) and self.swaps:
+            return {item.__class__.__name__: f'{item.size.column}x{item.size.row}'}
+        if isinstance(item, (Rows, Columns)) and self.swaps:
+            return {'Columns' if isinstance(item, Rows) else 'Rows': None}
+        return item.to_dict()
+
+    def to_canonical(self, digits: list[list[int]]) -> list[list[int]]:
+        """Move a grid of digits from the original orientation and digits to the canonical ones.
+
+        Args:
+            digits (list[list[int]]): The grid in the original orientation.
+
+        Returns:
+            list[list[int]]: The grid in the canonical orientation.
+        """
+        grid: list[list[int]] = [[0] * self.board.size.column for _ in self.board.row_range]
+        for row in self.board.row_range:
+            for column in self.board.column_range:
+                moved_row, moved_column = self.move(row, column)
+                grid[moved_row - 1][moved_column - 1] = self.relabel[digits[row - 1][column - 1]]
+        return grid
+
+    def to_original(self, digits: list[list[int]]) -> list[list[int]]:
+        """Move a grid of digits from the canonical orientation and digits back to the original ones.
+
+        Args:
+            digits (list[list[int]]): The grid in the canonical orientation.
+
+        Returns:
+            list[list[int]]: The grid in the original orientation.
+        """
+        original: dict[int, int] = {canonical: digit for digit, canonical in self.relabel.items()}
+        grid: list[list[int]] = []
+        for row in self.board.row_range:
+            line: list[int] = []
+            for column in self.board.column_range:
+                moved_row, moved_column = self.move(row, column)
+                line.append(original[digits[moved_row - 1][moved_column - 1]])
+            grid.append(line)
+        return grid
+
+    def __repr__(self) -> str:
+        """Return a string representation of the canonical form.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.board!r}, {self.text!r}, {self.matrix!r}, {self.relabel!r})'
@@ -1,7 +1,6 @@
 """Constraint Utilities."""
 from math import ceil
 from math import log10
-from typing import ClassVar
 
 from pulp import LpContinuous
 from pulp import lpSum
@@ -14,8 +13,6 @@ from src.solvers.solver import Solver
 class ConstraintUtilities:
     """Utility class for managing constraints in the Solver."""
 
-    variables: ClassVar[dict[str, LpVariable]] = {}
-
     @staticmethod
     def total_expression(solver: Solver, cell: Cell) -> lpSum:
         """Build the total expression for the log10 integer_value of a cell.
@@ -45,7 +42,7 @@ class ConstraintUtilities:
         """
         name: str = f'log10_{cell.row}_{cell.column}'
         # Return the variable if it already exists
-        existing_log_value: LpVariable = ConstraintUtilities.variables.get(name)
+        existing_log_value: LpVariable = solver.auxiliary_variables.get(name)
         if existing_log_value is not None:
             return existing_log_value
         # Define the limit for the variable's integer_value
@@ -56,6 +53,6 @@ class ConstraintUtilities:
         total_expression = ConstraintUtilities.total_expression(solver, cell)
         # Add the constraint to the solver's model
         solver.model += new_log_value == total_expression, name
-        # Cache the variable and return it
-        ConstraintUtilities.variables[name] = new_log_value
+        # Keep the variable with the solver and return it
+        solver.auxiliary_variables[name] = new_log_value
         return new_log_value
@@ -0,0 +1,242 @@
+"""DancingLinks."""
+from collections.abc import Hashable, Iterable, Iterator
+
+
+class DancingLinks:
+    """Knuth's Algorithm X for exact cover, using dancing links held in flat integer lists.
+
+    Node 0 is the root. Nodes 1 to primary + secondary are the column headers, and the
+    remaining nodes are the ones in the matrix. Primary columns must be covered exactly once,
+    secondary columns at most once.
+
+    Attributes:
+        primary (int): The number of primary columns.
+        secondary (int): The number of secondary columns.
+        rows (list[Hashable]): The name of each row, in the order added.
+        nodes (int): The number of search nodes visited by the last search.
+    """
+
+    def __init__(self, primary: int, secondary: int = 0) -> None:
+        """Initialize an empty matrix.
+
+        Args:
+            primary (int): The number of columns that must be covered exactly once.
+            secondary (int): The number of columns that may be covered at most once.
+        """
+        self.primary: int = primary
+        self.secondary: int = secondary
+        headers: int = primary + secondary + 1
+        self.left: list[int] = list(range(headers))
+        self.right: list[int] = list(range(headers))
+        self.up: list[int] = list(range(headers))
+        self.down: list[int] = list(range(headers))
+        self.column: list[int] = list(range(headers))
+        self.row: list[int] = [-1] * headers
+        self.size: list[int] = [0] * headers
+        for header in range(primary + 1):
+            self.left[header] = header - 1 if header > 0 else primary
+            self.right[header] = header + 1 if header < primary else 0
+        self.rows: list[Hashable] = []
+        self.index: dict[Hashable, int] = {}
+        self.heads: list[int] = []
+        self.covered: set[int] = set()
+        self.selected: list[Hashable] = []
+        self.nodes: int = 0
+
+    def add_row(self, name: Hashable, columns: Iterable[int]) -> None:
+        """Add a row to the matrix.
+
+        Args:
+            name (Hashable): The name reported for the row in solutions.
+            columns (Iterable[int]): The zero based columns covered by the row. Primary
+                columns come first, followed by the secondary columns.
+        """
+        index: int = len(self.rows)
+        self.rows.append(name)
+        self.index[name] = index
+        first: int = -1
+        for column in columns:
+            header: int = column + 1
+            node: int = len(self.column)
+            self.column.append(header)
+            self.row.append(index)
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.size[header] += 1
+            if first < 0:
+                first = node
+                self.heads.append(node)
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+
+    def cover(self, header: int) -> None:
+        """Remove a column and every row that uses it.
+
+        Args:
+            header (int): The header node of the column.
+        """
+        self.right[self.left[header]] = self.right[header]
+        self.left[self.right[header]] = self.left[header]
+        node: int = self.down[header]
+        while node != header:
+            other: int = self.right[node]
+            while other != node:
+                self.down[self.up[other]] = self.down[other]
+                self.up[self.down[other]] = self.up[other]
+                self.size[self.column[other]] -= 1
+                other = self.right[other]
+            node = self.down[node]
+
+    def uncover(self, header: int) -> None:
+        """Restore a column removed by cover.
+
+        Args:
+            header (int): The header node of the column.
+        """
+        node: int = self.up[header]
+        while node != header:
+            other: int = self.left[node]
+            while other != node:
+                self.size[self.column[other]] += 1
+                self.down[self.up[other]] = other
+                self.up[self.down[other]] = other
+                other = self.left[other]
+            node = self.up[node]
+        self.right[self.left[header]] = header
+        self.left[self.right[header]] = header
+
+    def select(self, name: Hashable) -> bool:
+        """Force a row into every solution, as for a given digit.
+
+        Args:
+            name (Hashable): The name of the row.
+
+        Returns:
+            bool: False if the row clashes with an earlier selection, True otherwise.
+        """
+        if name in self.selected:
+            return True
+        head: int = self.heads[self.index[name]]
+        headers: list[int] = [self.column[head]]
+        node: int = self.right[head]
+        while node != head:
+            headers.append(self.column[node])
+            node = self.right[node]
+        if any(header in self.covered for header in headers):
+            return False
+        for header in headers:
+            self.cover(header)
+            self.covered.add(header)
+        self.selected.append(name)
+        return True
+
+    def choose(self) -> int:
+        """Return the primary column with the fewest rows.
+
+        Returns:
+            int: The header node of the column.
+        """
+        best: int = self.right[0]
+        header: int = self.right[best]
+        while header != 0:
+            if self.size[header] < self.size[best]:
+                best = header
+            header = self.right[header]
+        return best
+
+    def search(self, partial: list[Hashable]) -> Iterator[list[Hashable]]:
+        """Yield every exact cover that extends the partial solution.
+
+        The matrix is restored when the generator finishes or is closed.
+
+        Args:
+            partial (list[Hashable]): The rows chosen so far, updated in place.
+
+        Yields:
+            list[Hashable]: The rows of each solution.
+        """
+        self.nodes += 1
+        if self.right[0] == 0:
+            yield self.selected + partial
+            return
+        header: int = self.choose()
+        if self.size[header] == 0:
+            return
+        self.cover(header)
+        try:
+            node: int = self.down[header]
+            while node != header:
+                partial.append(self.rows[self.row[node]])
+                other: int = self.right[node]
+                while other != node:
+                    self.cover(self.column[other])
+                    other = self.right[other]
+                try:
+                    yield from self.search(partial)
+                finally:
+                    other = self.left[node]
+                    while other != node:
+                        self.uncover(self.column[other])
+                        other = self.left[other]
+                    partial.pop()
+                node = self.down[node]
+        finally:
+            self.uncover(header)
+
+    def solutions(self, limit: int | None = None) -> Iterator[list[Hashable]]:
+        """Enumerate the exact covers.
+
+        Args:
+            limit (int | None): The maximum number of solutions to yield. None yields them all.
+
+        Yields:
+            list[Hashable]: The rows of each solution, including the selected rows.
+        """
+        self.nodes = 0
+        if limit is not None and limit <= 0:
+            return
+        found: int = 0
+        search: Iterator[list[Hashable]] = self.search([])
+        try:
+            for solution in search:
+                yield solution
+                found += 1
+                if limit is not None and found >= limit:
+                    return
+        finally:
+            search.close()  # type: ignore[attr-defined]
+
+    def first(self) -> list[Hashable] | None:
+        """Find the first exact cover.
+
+        Returns:
+            list[Hashable] | None: The rows of the solution, or None if there is none.
+        """
+        found: list[list[Hashable]] = list(self.solutions(1))
+        return found[0] if found else None
+
+    def count(self, limit: int | None = None) -> int:
+        """Count the exact covers.
+
+        Args:
+            limit (int | None): Stop counting at this number. None counts them all.
+
+        Returns:
+            int: The number of solutions found.
+        """
+        return sum(1 for _ in self.solutions(limit))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the matrix.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.primary!r}, {self.secondary!r})'
@@ -0,0 +1,119 @@
+"""DLXBackend."""
+from collections.abc import Iterator
+from itertools import product
+from typing import TYPE_CHECKING
+
+from src.solvers.answer import Answer
+from src.solvers.dancing_links import DancingLinks
+from src.solvers.region_backend import RegionBackend
+from src.solvers.solver_status import SolverStatus
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.solvers.solver import Solver
+
+
+class DLXBackend(RegionBackend):
+    """Solve, count or enumerate region and given puzzles as an exact cover problem.
+
+    Each row of the cover matrix is one of the solver's choice variables, a (digit, row, column) triple.
+    The primary columns say each cell holds exactly one digit, and each digit appears exactly once in each
+    region with as many cells as digits. Smaller regions add secondary columns, so a digit appears at most once.
+    """
+
+    def matrix(self, solver: 'Solver') -> DancingLinks | None:
+        """Build the cover matrix for the solver's constraint tree, with the given digits selected.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+
+        Returns:
+            DancingLinks | None: The matrix, or None if the given digits clash.
+        """
+        digits: list[int] = solver.board.digits.digit_range
+        cell_count: int = solver.board.size.row * solver.board.size.column
+        regions: list[list[int]] = self.regions(solver)
+        complete: list[list[int]] = [region for region in regions if len(region) == len(digits)]
+        partial: list[list[int]] = [region for region in regions if len(region) != len(digits)]
+        primary: int = cell_count + len(complete) * len(digits)
+        memberships: list[list[int]] = [[] for _ in range(cell_count)]
+        for number, region in enumerate(complete):
+            for cell in region:
+                memberships[cell].append(cell_count + number * len(digits))
+        for number, region in enumerate(partial):
+            for cell in region:
+                memberships[cell].append(primary + number * len(digits))
+        links: DancingLinks = DancingLinks(primary, len(partial) * len(digits))
+        for digit, rows in solver.variables.choices.items():
+            offset: int = digits.index(digit)
+            for row, columns in rows.items():
+                for column in columns:
+                    cell: int = solver.board.geometry.index(row, column)
+                    links.add_row((digit, row, column), [cell, *(base + offset for base in memberships[cell])])
+        for given in self.givens(solver):
+            if not links.select((given.digit, given.row, given.column)):
+                return None
+        return links
+
+    def answer(self, solver: 'Solver', rows: list) -> Answer:
+        """Convert the rows of an exact cover into an answer.
+
+        Args:
+            solver (Solver): The solver holding the board.
+            rows (list): The (digit, row, column) rows of the cover.
+
+        Returns:
+            Answer: The answer.
+        """
+        answer: Answer = Answer(solver.board)
+        for digit, row, column in rows:
+            answer[row, column] = digit
+        return answer
+
+    def answers(self, solver: 'Solver', limit: int | None = None) -> Iterator[Answer]:
+        """Enumerate the answers.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+            limit (int | None): The maximum number of answers. None enumerates them all.
+
+        Yields:
+            Answer: Each answer.
+        """
+        links: DancingLinks | None = self.matrix(solver)
+        if links is None:
+            return
+        for rows in links.solutions(limit):
+            yield self.answer(solver, rows)
+
+    def count(self, solver: 'Solver', limit: int | None = None) -> int:
+        """Count the answers.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+            limit (int | None): Stop counting at this number. None counts them all.
+
+        Returns:
+            int: The number of answers found.
+        """
+        links: DancingLinks | None = self.matrix(solver)
+        if links is None:
+            return 0
+        return links.count(limit)
+
+    def solve(self, solver: 'Solver') -> None:
+        """Find the first answer.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+        """
+        links: DancingLinks | None = self.matrix(solver)
+        rows: list | None = None if links is None else links.first()
+        nodes: int = 0 if links is None else links.nodes
+        solver.log = f'{self.name}: {nodes} nodes'
+        if rows is None:
+            solver.status = SolverStatus.infeasible
+            return
+        found: Answer = self.answer(solver, rows)
+        for row, column in product(solver.board.row_range, solver.board.column_range):
+            solver.answer[row, column] = found[row, column]
+        solver.status = SolverStatus.optimal
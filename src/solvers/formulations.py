@@ -7,11 +7,15 @@ from pulp import LpProblem
 from pulp import lpSum
 from pulp import LpVariable
 
+from src.utils.name_allocator import NameAllocator
+
 
 class Formulations:
-    """Utility class for generating linear programming formulations."""
+    """Utility class for generating linear programming formulations.
 
-    count = 0
+    Formulations that create auxiliary variables take their names from the allocator of the solver that
+    owns the model, so the names do not depend on other models built in the process.
+    """
 
     @staticmethod
     def disjunction(
@@ -80,17 +84,19 @@ class Formulations:
         model += decision_variable - target <= upper * (1 - value_variable), f'Product_Binary_{target.name}_d'
 
     @staticmethod
-    def logical_and(model: LpProblem, binaries: list[LpVariable]) -> LpVariable:
+    def logical_and(model: LpProblem, names: NameAllocator, binaries: list[LpVariable]) -> LpVariable:
         """Implement start_location logical AND constraint.
 
         Args:
             model (LpProblem): The linear programming model to add constraints to.
+            names (NameAllocator): The allocator for the names of the auxiliary variables.
             binaries (list[LpVariable]): A list of binary_variable decision variables.
 
         Returns:
             LpVariable: A binary_variable value_variable that is 1 if all variables in binaries are 1, else 0.
         """
-        logical_and = LpVariable(f'l_and_{Formulations.count}', 0, 1, LpInteger)
+        number: int = names.number('l_and')
+        logical_and = LpVariable(f'l_and_{number}', 0, 1, LpInteger)
         count = len(binaries)
         for binary_variable in binaries:
             model += logical_and <= binary_variable, f'Logical_And_{logical_and.name}_{binary_variable.name}_a'
@@ -98,43 +104,54 @@ class Formulations:
         return logical_and
 
     @staticmethod
-    def logical_or(model: LpProblem, binaries: list[LpVariable]) -> LpVariable:
+    def logical_or(model: LpProblem, names: NameAllocator, binaries: list[LpVariable]) -> LpVariable:
         """Implement start_location logical OR constraint.
 
         Args:
             model (LpProblem): The linear programming model to add constraints to.
+            names (NameAllocator): The allocator for the names of the auxiliary variables.
             binaries (list[LpVariable]): A list of binary_variable decision variables.
 
         Returns:
             LpVariable: A binary value_variable that is 1 if at least one value_variable in binaries is 1, else 0.
         """
-        logical_or = LpVariable(f'l_or_{Formulations.count}', 0, 1, LpInteger)
+        number: int = names.number('l_or')
+        logical_or = LpVariable(f'l_or_{number}', 0, 1, LpInteger)
         for binary_variable in binaries:
             model += logical_or >= binary_variable, f'Logical_or_{logical_or.name}_{binary_variable.name}_a'
         model += logical_or <= 1, f'Logical_or_{logical_or.name}_b'
         return logical_or
 
     @staticmethod
-    def logical_not(model: LpProblem, binary_variable: LpVariable) -> LpVariable:
+    def logical_not(model: LpProblem, names: NameAllocator, binary_variable: LpVariable) -> LpVariable:
         """Implement start_location logical NOT constraint.
 
         Args:
             model (LpProblem): The linear programming model to add constraints to.
+            names (NameAllocator): The allocator for the names of the auxiliary variables.
             binary_variable (LpVariable): A binary decision value_variable.
 
         Returns:
             LpVariable: A binary value_variable that is the negation of binary.
         """
-        logical_not = LpVariable(f'l_not_{Formulations.count}', 0, 1, LpInteger)
+        number: int = names.number('l_not')
+        logical_not = LpVariable(f'l_not_{number}', 0, 1, LpInteger)
         model += logical_not == 1 - binary_variable, f'Logical_not_{binary_variable.name}'
         return logical_not
 
     @staticmethod
-    def abs(model: LpProblem, value1: LpVariable, value2: LpVariable, upper: int) -> LpVariable:
+    def abs(
+        model: LpProblem,
+        names: NameAllocator,
+        value1: LpVariable,
+        value2: LpVariable,
+        upper: int,
+    ) -> LpVariable:
         """Calculate the absolute difference between two variables.
 
         Args:
             model (LpProblem): The linear programming model to add constraints to.
+            names (NameAllocator): The allocator for the names of the auxiliary variables.
             value1 (LpVariable): The first decision value_variable.
             value2 (LpVariable): The second decision value_variable.
             upper (int): An upper bound on the absolute difference.
@@ -142,21 +159,28 @@ class Formulations:
         Returns:
             LpVariable: A value_variable representing the absolute difference.
         """
-        indicator: LpVariable = LpVariable(f'Abs_Indicator_{Formulations.count}', 0, 1, LpInteger)
-        difference: LpVariable = LpVariable(f'Abs_Difference_{Formulations.count}', 0, upper, LpContinuous)
-        model += difference >= value1 - value2, f'Abs_{Formulations.count}_a'
-        model += difference >= value2 - value1, f'Abs_{Formulations.count}_b'
-        model += difference <= (value1 - value2) + upper * (1 - indicator), f'Abs_{Formulations.count}_c'
-        model += difference <= (value2 - value1) + upper * indicator, f'Abs_{Formulations.count}_d'
-        Formulations.count += 1
+        number: int = names.number('Abs')
+        indicator: LpVariable = LpVariable(f'Abs_Indicator_{number}', 0, 1, LpInteger)
+        difference: LpVariable = LpVariable(f'Abs_Difference_{number}', 0, upper, LpContinuous)
+        model += difference >= value1 - value2, f'Abs_{number}_a'
+        model += difference >= value2 - value1, f'Abs_{number}_b'
+        model += difference <= (value1 - value2) + upper * (1 - indicator), f'Abs_{number}_c'
+        model += difference <= (value2 - value1) + upper * indicator, f'Abs_{number}_d'
         return difference
 
     @staticmethod
-    def minimum(model: LpProblem, value_variables: list[LpVariable], lower: int, upper: int) -> LpVariable:
+    def minimum(
+        model: LpProblem,
+        names: NameAllocator,
+        value_variables: list[LpVariable],
+        lower: int,
+        upper: int,
+    ) -> LpVariable:
         """Calculate the minimum of start_location list of variables.
 
         Args:
             model (LpProblem): The linear programming model to add constraints to.
+            names (NameAllocator): The allocator for the names of the auxiliary variables.
             value_variables (list[LpVariable]): A list of decision variables.
             lower (int): The lower bound for the minimum value_variable.
             upper (int): The upper bound for the minimum value_variable.
@@ -164,30 +188,31 @@ class Formulations:
         Returns:
             LpVariable: A value_variable representing the minimum number of xi.
         """
-        minimum_value = LpVariable(f'Minimum_{Formulations.count}', lower, upper, LpInteger)
+        number: int = names.number('Minimum')
+        minimum_value = LpVariable(f'Minimum_{number}', lower, upper, LpInteger)
         indicator = LpVariable.dicts(
-            name=f'Minimum_{Formulations.count}_indicator',
+            name=f'Minimum_{number}_indicator',
             indices=(range(len(value_variables))),
             lowBound=0,
             upBound=1,
             cat=LpInteger,
         )
         for index, value_variable in enumerate(value_variables):
-            name1: str = f'Minimum_{Formulations.count}_{index}_a'
+            name1: str = f'Minimum_{number}_{index}_a'
             model += minimum_value <= value_variable, name1
-            name2: str = f'Minimum_{Formulations.count}_{index}_b'
+            name2: str = f'Minimum_{number}_{index}_b'
             model += minimum_value >= value_variable - (upper - lower) * (1 - indicator[index]), name2
 
-        model += lpSum(indicator) == 1, f'Minimum_{Formulations.count}_SOS'
-        Formulations.count += 1
+        model += lpSum(indicator) == 1, f'Minimum_{number}_SOS'
         return minimum_value
 
     @staticmethod
-    def maximum(model: LpProblem, xi: list[LpVariable], lower: int, upper: int) -> LpVariable:
+    def maximum(model: LpProblem, names: NameAllocator, xi: list[LpVariable], lower: int, upper: int) -> LpVariable:
         """Calculate the maximum of start_location list of variables.
 
         Args:
             model (LpProblem): The linear programming model to add constraints to.
+            names (NameAllocator): The allocator for the names of the auxiliary variables.
             xi (list[LpVariable]): A list of decision variables.
             lower (int): The lower bound for the maximum value_variable.
             upper (int): The upper bound for the maximum value_variable.
@@ -195,18 +220,18 @@ class Formulations:
         Returns:
             LpVariable: A value_variable representing the maximum number of value_variables.
         """
-        maximum_value = LpVariable(f'Maximum_{Formulations.count}', lower, upper, LpInteger)
+        number: int = names.number('Maximum')
+        maximum_value = LpVariable(f'Maximum_{number}', lower, upper, LpInteger)
         indicator = LpVariable.dicts(
-            f'Maximum_{Formulations.count}_indicator',
+            f'Maximum_{number}_indicator',
             (range(len(xi))),
             0,
             1,
             LpInteger,
         )
         for index, value_variable in enumerate(xi):
-            model += maximum_value >= value_variable, f'Maximum_{Formulations.count}_{index}_a'
+            model += maximum_value >= value_variable, f'Maximum_{number}_{index}_a'
             rhs: LpElement = value_variable + (upper - lower) * (1 - indicator[index])
-            model += maximum_value <= rhs, f'Maximum_{Formulations.count}_{index}_b'
-        model += lpSum(indicator) == 1, f'Maximum_{Formulations.count}_SOS'
-        Formulations.count += 1
+            model += maximum_value <= rhs, f'Maximum_{number}_{index}_b'
+        model += lpSum(indicator) == 1, f'Maximum_{number}_SOS'
         return maximum_value
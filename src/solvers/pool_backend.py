@@ -0,0 +1,51 @@
+"""PoolBackend."""
+from typing import TYPE_CHECKING
+
+from src.solvers.backend import Backend
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.solvers.solver import Solver
+    from src.solvers.solver_pool import SolverPool
+
+
+class PoolBackend(Backend):
+    """Solve the model on a SolverPool, so a Solver can use the pool like any other backend.
+
+    Attributes:
+        pool (SolverPool): The pool.
+    """
+
+    def __init__(self, pool: 'SolverPool') -> None:
+        """Initialize the backend.
+
+        Args:
+            pool (SolverPool): The pool.
+        """
+        self.pool: SolverPool = pool
+
+    def supports(self, solver: 'Solver') -> bool:
+        """Check if this backend can solve the solver's model. The MIP solver handles any model.
+
+        Args:
+            solver (Solver): The solver holding the model.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def solve(self, solver: 'Solver') -> None:
+        """Solve the model on the pool.
+
+        Args:
+            solver (Solver): The solver holding the model.
+        """
+        self.pool.solve(solver)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the backend.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.pool!r})'
@@ -0,0 +1,153 @@
+"""Presolve."""
+from pulp import LpConstraint
+from pulp import LpConstraintEQ
+from pulp import LpConstraintGE
+from pulp import LpConstraintLE
+from pulp import LpInteger
+from pulp import LpProblem
+from pulp import LpVariable
+
+from src.solvers.solver import Solver
+
+TOLERANCE: float = 1e-9
+
+
+class Presolve:
+    """Shrink a solver's model by substituting fixed variables into its constraints.
+
+    A variable is fixed when its lower and upper bounds are equal, for example a choice
+    ruled out by bookkeeping. Fixed variables are replaced by constants. Constraints left
+    with no variables are dropped when they hold. Two rules fix further variables:
+
+    - an equality with a single variable left fixes that variable, and
+    - a constraint that forces a sum of non-negative terms to zero fixes all its variables to zero.
+
+    The reduced model only holds the rows and columns still needed.
+
+    Attributes:
+        solver (Solver): The solver whose model is reduced.
+        rows (int): The number of constraints before the reduction.
+        columns (int): The number of variables before the reduction.
+    """
+
+    def __init__(self, solver: Solver) -> None:
+        """Initialize the presolve.
+
+        Args:
+            solver (Solver): The solver whose model is reduced.
+        """
+        self.solver: Solver = solver
+        self.rows: int = 0
+        self.columns: int = 0
+
+    @staticmethod
+    def is_fixed(variable: LpVariable) -> bool:
+        """Check if a variable's bounds leave it a single value.
+
+        Args:
+            variable (LpVariable): The variable.
+
+        Returns:
+            bool: True if the variable is fixed.
+        """
+        return variable.lowBound is not None and variable.lowBound == variable.upBound
+
+    @staticmethod
+    def fix(variable: LpVariable, value: float) -> bool:
+        """Fix a variable to a value, if the value is allowed by its bounds and category.
+
+        Args:
+            variable (LpVariable): The variable.
+            value (float): The value.
+
+        Returns:
+            bool: True if the variable was fixed.
+        """
+        if variable.cat == LpInteger:
+            if abs(value - round(value)) > TOLERANCE:
+                return False
+            value = round(value)
+        if variable.lowBound is not None and value < variable.lowBound - TOLERANCE:
+            return False
+        if variable.upBound is not None and value > variable.upBound + TOLERANCE:
+            return False
+        variable.lowBound = value
+        variable.upBound = value
+        return True
+
+    @staticmethod
+    def holds(constraint: LpConstraint) -> bool:
+        """Check if a constraint with no variables left holds.
+
+        Args:
+            constraint (LpConstraint): The constraint.
+
+        Returns:
+            bool: True if the constant satisfies the constraint's sense.
+        """
+        if constraint.sense == LpConstraintEQ:
+            return abs(constraint.constant) <= TOLERANCE
+        if constraint.sense == LpConstraintLE:
+            return constraint.constant <= TOLERANCE
+        return constraint.constant >= -TOLERANCE
+
+    def substitute(self, constraint: LpConstraint) -> None:
+        """Replace the fixed variables of a constraint by constants.
+
+        Args:
+            constraint (LpConstraint): The constraint, updated in place.
+        """
+        for variable in [variable for variable in constraint if self.is_fixed(variable)]:
+            constraint.constant += constraint[variable] * variable.lowBound
+            del constraint[variable]
+
+    def propagate(self, constraint: LpConstraint) -> bool:
+        """Fix the variables that a constraint forces to a single value.
+
+        Args:
+            constraint (LpConstraint): The constraint, after substitution.
+
+        Returns:
+            bool: True if any variable was fixed.
+        """
+        if constraint.sense == LpConstraintEQ and len(constraint) == 1:
+            variable, coefficient = next(iter(constraint.items()))
+            return self.fix(variable, -constraint.constant / coefficient)
+        if abs(constraint.constant) > TOLERANCE or constraint.sense not in (LpConstraintLE, LpConstraintGE):
+            return False
+        sign: int = 1 if constraint.sense == LpConstraintLE else -1
+        for variable, coefficient in constraint.items():
+            if sign * coefficient <= 0 or variable.lowBound != 0:
+                return False
+        return all(self.fix(variable, 0) for variable in list(constraint))
+
+    def run(self) -> None:
+        """Reduce the solver's model until no more variables can be fixed."""
+        model: LpProblem = self.solver.model
+        self.rows = len(model.constraints)
+        self.columns = len(model.variables())
+        constraints: dict[str, LpConstraint] = dict(model.constraints)
+        changed: bool = True
+        while changed:
+            changed = False
+            for name, constraint in list(constraints.items()):
+                self.substitute(constraint)
+                if len(constraint) == 0:
+                    if self.holds(constraint):
+                        del constraints[name]
+                    continue
+                if self.propagate(constraint):
+                    changed = True
+        reduced: LpProblem = LpProblem(model.name, model.sense)
+        reduced.objective = model.objective
+        for name, constraint in constraints.items():
+            reduced.addConstraint(constraint, name)
+        self.solver.model = reduced
+
+    def __repr__(self) -> str:
+        """Return a string representation of the presolve.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.solver.name!r})'
@@ -0,0 +1,62 @@
+"""PropagationBackend."""
+from itertools import product
+from typing import TYPE_CHECKING
+
+from src.solvers.propagation_engine import PropagationEngine
+from src.solvers.region_backend import RegionBackend
+from src.solvers.solver_status import SolverStatus
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.solvers.solver import Solver
+
+
+class PropagationBackend(RegionBackend):
+    """Solve region and given puzzles natively by constraint propagation, without building or running a MIP."""
+
+    def engine(self, solver: 'Solver') -> PropagationEngine:
+        """Build the engine for the solver's constraint tree.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+
+        Returns:
+            PropagationEngine: The engine with one region per region item.
+        """
+        return PropagationEngine(
+            solver.board.digits.count,
+            solver.board.size.row * solver.board.size.column,
+            self.regions(solver),
+        )
+
+    def candidates(self, solver: 'Solver', engine: PropagationEngine) -> list[int]:
+        """Return the starting candidates, with each given digit fixed.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+            engine (PropagationEngine): The engine.
+
+        Returns:
+            list[int]: The candidate bitmask of each cell.
+        """
+        candidates: list[int] = engine.start()
+        minimum: int = solver.board.digits.minimum
+        for given in self.givens(solver):
+            candidates[self.index(solver, given.cell)] &= 1 << (given.digit - minimum)
+        return candidates
+
+    def solve(self, solver: 'Solver') -> None:
+        """Solve the constraint tree by propagation and search.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+        """
+        engine: PropagationEngine = self.engine(solver)
+        solution: list[int] | None = engine.solve(self.candidates(solver, engine))
+        solver.log = f'{self.name}: {engine.nodes} nodes, {engine.eliminations} eliminations'
+        if solution is None:
+            solver.status = SolverStatus.infeasible
+            return
+        minimum: int = solver.board.digits.minimum
+        for row, column in product(solver.board.row_range, solver.board.column_range):
+            solver.answer[row, column] = solution[solver.board.geometry.index(row, column)] + minimum
+        solver.status = SolverStatus.optimal
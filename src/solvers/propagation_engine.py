@@ -0,0 +1,181 @@
+"""PropagationEngine."""
+from collections.abc import Iterator, Sequence
+
+
+class PropagationEngine:
+    """Constraint propagation and backtracking over regions of mutually distinct cells.
+
+    Cells are numbered 0 to cell_count - 1. The candidates of each cell are an int bitmask,
+    where bit i set means the i-th digit is still possible. Propagation applies naked singles
+    (a cell with one candidate removes it from its peers) and hidden singles (in a region with
+    as many cells as digits, a digit possible in only one cell must go there).
+
+    Attributes:
+        digit_count (int): The number of digits.
+        cell_count (int): The number of cells.
+        regions (list[tuple[int, ...]]): The cells of each region.
+        nodes (int): The number of search nodes visited by the last solve.
+        eliminations (int): The number of candidates removed by the last solve.
+    """
+
+    def __init__(self, digit_count: int, cell_count: int, regions: Sequence[Sequence[int]]) -> None:
+        """Initialize the engine.
+
+        Args:
+            digit_count (int): The number of digits.
+            cell_count (int): The number of cells.
+            regions (Sequence[Sequence[int]]): The cells of each region. All cells in a region must differ.
+        """
+        self.digit_count: int = digit_count
+        self.cell_count: int = cell_count
+        self.full: int = (1 << digit_count) - 1
+        self.regions: list[tuple[int, ...]] = [tuple(sorted(set(region))) for region in regions]
+        self.complete_regions: list[tuple[int, ...]] = [
+            region for region in self.regions if len(region) == digit_count
+        ]
+        peers: list[set[int]] = [set() for _ in range(cell_count)]
+        for region in self.regions:
+            for cell in region:
+                peers[cell].update(region)
+        self.peers: list[tuple[int, ...]] = [tuple(sorted(peers[cell] - {cell})) for cell in range(cell_count)]
+        self.nodes: int = 0
+        self.eliminations: int = 0
+
+    def start(self) -> list[int]:
+        """Return the candidates of an empty grid.
+
+        Returns:
+            list[int]: Every digit possible in every cell.
+        """
+        return [self.full] * self.cell_count
+
+    def eliminate(self, candidates: list[int], singles: list[int]) -> bool:
+        """Remove the digit of each single from its peers, following any new singles.
+
+        Args:
+            candidates (list[int]): The candidates of each cell, updated in place.
+            singles (list[int]): The cells with a single candidate still to process.
+
+        Returns:
+            bool: False if a cell has no candidates left, True otherwise.
+        """
+        while singles:
+            cell: int = singles.pop()
+            bit: int = candidates[cell]
+            for peer in self.peers[cell]:
+                if candidates[peer] & bit:
+                    candidates[peer] &= ~bit
+                    self.eliminations += 1
+                    remaining: int = candidates[peer]
+                    if remaining == 0:
+                        return False
+                    if remaining & (remaining - 1) == 0:
+                        singles.append(peer)
+        return True
+
+    def hidden_singles(self, candidates: list[int]) -> list[int] | None:
+        """Place each digit that has only one possible cell in a complete region.
+
+        Args:
+            candidates (list[int]): The candidates of each cell, updated in place.
+
+        Returns:
+            list[int] | None: The cells that became singles, or None if a digit has no possible cell.
+        """
+        singles: list[int] = []
+        for region in self.complete_regions:
+            for digit in range(self.digit_count):
+                bit: int = 1 << digit
+                places: list[int] = [cell for cell in region if candidates[cell] & bit]
+                if not places:
+                    return None
+                if len(places) == 1 and candidates[places[0]] != bit:
+                    candidates[places[0]] = bit
+                    singles.append(places[0])
+        return singles
+
+    def propagate(self, candidates: list[int]) -> bool:
+        """Apply naked and hidden singles until nothing changes.
+
+        Args:
+            candidates (list[int]): The candidates of each cell, updated in place.
+
+        Returns:
+            bool: False if the candidates are contradictory, True otherwise.
+        """
+        singles: list[int] | None = [
+            cell for cell, bits in enumerate(candidates) if bits & (bits - 1) == 0
+        ]
+        if any(candidates[cell] == 0 for cell in singles):
+            return False
+        while singles:
+            if not self.eliminate(candidates, singles):
+                return False
+            singles = self.hidden_singles(candidates)
+            if singles is None:
+                return False
+        return True
+
+    def search(self, candidates: list[int]) -> Iterator[list[int]]:
+        """Yield every solution reachable from the candidates.
+
+        Args:
+            candidates (list[int]): The candidates of each cell. Not modified.
+
+        Yields:
+            list[int]: The single-bit candidates of each cell in a solution.
+        """
+        self.nodes += 1
+        state: list[int] = list(candidates)
+        if not self.propagate(state):
+            return
+        open_cells: list[int] = [cell for cell, bits in enumerate(state) if bits & (bits - 1)]
+        if not open_cells:
+            yield state
+            return
+        cell: int = min(open_cells, key=lambda index: state[index].bit_count())
+        bits: int = state[cell]
+        while bits:
+            bit: int = bits & -bits
+            bits ^= bit
+            state[cell] = bit
+            yield from self.search(state)
+
+    def solutions(self, candidates: list[int], limit: int | None = None) -> list[list[int]]:
+        """Find up to limit solutions.
+
+        Args:
+            candidates (list[int]): The starting candidates of each cell.
+            limit (int | None): The maximum number of solutions to find. None finds them all.
+
+        Returns:
+            list[list[int]]: The solutions found, as digit indexes (0 based) for each cell.
+        """
+        self.nodes = 0
+        self.eliminations = 0
+        found: list[list[int]] = []
+        for solution in self.search(candidates):
+            found.append([bits.bit_length() - 1 for bits in solution])
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    def solve(self, candidates: list[int]) -> list[int] | None:
+        """Find the first solution.
+
+        Args:
+            candidates (list[int]): The starting candidates of each cell.
+
+        Returns:
+            list[int] | None: The digit index (0 based) of each cell, or None if there is no solution.
+        """
+        found: list[list[int]] = self.solutions(candidates, 1)
+        return found[0] if found else None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the engine.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.digit_count!r}, {self.cell_count!r}, {self.regions!r})'
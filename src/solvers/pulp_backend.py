@@ -0,0 +1,206 @@
+"""PulpBackend."""
+import asyncio
+import logging
+import re
+from contextlib import suppress
+from subprocess import DEVNULL
+from typing import TYPE_CHECKING
+
+from pulp import getSolver
+from pulp import LpProblem
+from pulp import LpSolver
+from pulp import LpStatus
+
+from src.solvers.backend import Backend
+from src.solvers.solver_status import SolverStatus
+from src.utils.temporary_file import TemporaryFile
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.solvers.solver import Solver
+
+SOLUTION_STATUSES: dict[str, SolverStatus] = {
+    'Optimal': SolverStatus.optimal,
+    'Infeasible': SolverStatus.infeasible,
+    'Integer infeasible': SolverStatus.infeasible,
+    'Unbounded': SolverStatus.unbounded,
+}
+MIP_START_ACCEPTED: str = 'MIPStart provided solution'
+MIP_START_REJECTED: str = 'mipstart values could not be used'
+ENUMERATED_NODES: re.Pattern = re.compile(r'^Enumerated nodes:\s+(\d+)', re.MULTILINE)
+
+
+class PulpBackend(Backend):
+    """Solve the PuLP model with an external MIP solver such as CBC."""
+
+    def supports(self, solver: 'Solver') -> bool:
+        """Check if this backend can solve the solver's model. The MIP solver handles any model.
+
+        Args:
+            solver (Solver): The solver holding the model.
+
+        Returns:
+            bool: Always True.
+        """
+        return True
+
+    def solve(self, solver: 'Solver') -> None:
+        """Solve the model using the solver's MIP application and extract the answer.
+
+        The application writes its log to a file of its own, so solves in different threads do not mix their logs.
+        If the solver has a start, it is passed to the application as a MIP start.
+
+        Args:
+            solver (Solver): The solver holding the model.
+        """
+        model: LpProblem = solver.lp_problem()
+        with TemporaryFile() as log_file:
+            application: LpSolver = getSolver(
+                solver.solver_name,
+                msg=0,
+                logPath=str(log_file.path),
+                warmStart=solver.start is not None,
+            )
+            try:
+                model.solve(application)
+            except Exception as exp:
+                # Log the exception for better traceability
+                logging.error(f'Error occurred during solving: {exp!s}', exc_info=True)
+                solver.status = SolverStatus.infeasible
+                solver.log = f'Error occurred: {exp!s}'
+                return  # Exit early if there's an error
+            solver.log = log_file.path.read_text(encoding='utf-8') if log_file.path.exists() else ''
+        self.read_log(solver)
+        solver.status = SolverStatus(LpStatus[model.status])
+        if solver.status != SolverStatus.optimal:
+            return
+        self.extract(solver, {variable.name: variable.varValue for variable in model.variables()})
+
+    @staticmethod
+    def extract(solver: 'Solver', values: dict[str, float | None]) -> None:
+        """Fill the solver's answer from the values of the choice variables.
+
+        The values are kept on the choice variables, so cuts can be built from them. Each cell takes the
+        digit whose choice is one.
+
+        Args:
+            solver (Solver): The solver holding the variables and the answer.
+            values (dict[str, float | None]): The value of each variable, by name.
+        """
+        for rows in solver.variables.choices.values():
+            for columns in rows.values():
+                for choice in columns.values():
+                    choice.varValue = values.get(choice.name)
+        for digit, row, column in solver.chosen():
+            solver.answer[row, column] = digit
+
+    @staticmethod
+    def read_log(solver: 'Solver') -> None:
+        """Read whether the MIP start was accepted, and how many nodes were searched, from a CBC log.
+
+        Args:
+            solver (Solver): The solver holding the log.
+        """
+        log: str = solver.log or ''
+        solver.start_accepted = None
+        if MIP_START_ACCEPTED in log:
+            solver.start_accepted = True
+        elif MIP_START_REJECTED in log:
+            solver.start_accepted = False
+        match: re.Match | None = ENUMERATED_NODES.search(log)
+        solver.nodes = int(match.group(1)) if match else None
+
+    @staticmethod
+    def read_solution(text: str) -> tuple[SolverStatus, dict[str, float]]:
+        """Read a CBC solution file.
+
+        The first line holds the status. Each following line holds the index, name, value and
+        reduced cost of a variable, prefixed by '**' if the value breaks a bound.
+
+        Args:
+            text (str): The text of the solution file.
+
+        Returns:
+            tuple[SolverStatus, dict[str, float]]: The status and the value of each variable, by name.
+        """
+        lines: list[str] = text.splitlines()
+        status: SolverStatus = SolverStatus.not_solved
+        if lines:
+            for prefix, candidate in SOLUTION_STATUSES.items():
+                if lines[0].startswith(prefix):
+                    status = candidate
+        values: dict[str, float] = {}
+        for line in lines[1:]:
+            fields: list[str] = line.split()
+            if fields and fields[0] == '**':
+                fields = fields[1:]
+            if len(fields) >= 3:
+                values[fields[1]] = float(fields[2])
+        return status, values
+
+    @staticmethod
+    def arguments(path: str, model_path: str, solution_path: str) -> list[str]:
+        """Return the command line that runs CBC on an MPS file.
+
+        Args:
+            path (str): The path of the CBC executable.
+            model_path (str): The path of the MPS file.
+            solution_path (str): The path the solution file is written to.
+
+        Returns:
+            list[str]: The executable and its arguments.
+        """
+        return [path, model_path, '-solve', '-printingOptions', 'all', '-solution', solution_path]
+
+    @staticmethod
+    async def kill(process: asyncio.subprocess.Process) -> None:
+        """Kill a child process if it is still running, and wait for it to exit.
+
+        Args:
+            process (asyncio.subprocess.Process): The child process.
+        """
+        if process.returncode is None:
+            with suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+
+    async def solve_async(self, solver: 'Solver', time_limit: float | None = None) -> None:
+        """Solve the model with CBC as a child process, without blocking the event loop.
+
+        The model is written in MPS format and the CBC output is captured as the solver's log. The child
+        is killed if the time limit is reached or the solve is cancelled. Other MIP applications, and solves
+        with a MIP start, are run through PuLP in a worker thread.
+
+        Args:
+            solver (Solver): The solver holding the model.
+            time_limit (float | None): The wall clock limit in seconds. None waits for the solve to finish.
+
+        Raises:
+            TimeoutError: If the time limit is reached.
+            asyncio.CancelledError: If the solve is cancelled.
+        """
+        if solver.application_name != 'CBC' or solver.start is not None:
+            await super().solve_async(solver, time_limit)
+            return
+        application: LpSolver = getSolver(solver.solver_name)
+        with TemporaryFile() as model_file, TemporaryFile() as solution_file:
+            solver.save_mps(model_file.path)
+            process: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(
+                *self.arguments(application.path, str(model_file.path), str(solution_file.path)),
+                stdin=DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+            try:
+                output, _ = await asyncio.wait_for(process.communicate(), time_limit)
+            except (TimeoutError, asyncio.CancelledError):
+                await self.kill(process)
+                raise
+            solver.log = output.decode('utf-8', errors='replace')
+            self.read_log(solver)
+            if process.returncode != 0 or not solution_file.path.exists():
+                solver.status = SolverStatus.infeasible
+                solver.log += f'\nError occurred: CBC exited with code {process.returncode}'
+                return
+            solver.status, values = self.read_solution(solution_file.path.read_text(encoding='utf-8'))
+        if solver.status == SolverStatus.optimal:
+            self.extract(solver, values)
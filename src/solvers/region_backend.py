@@ -0,0 +1,117 @@
+"""RegionBackend."""
+from typing import ClassVar, TYPE_CHECKING
+
+from src.items.box import Box
+from src.items.boxes import Boxes
+from src.items.cell import Cell
+from src.items.column import Column
+from src.items.columns import Columns
+from src.items.constraints import Constraints
+from src.items.disjoint_group import DisjointGroup
+from src.items.disjoint_groups import DisjointGroups
+from src.items.item import Item
+from src.items.known import Known
+from src.items.known_cell import KnownCell
+from src.items.region import Region
+from src.items.row import Row
+from src.items.rows import Rows
+from src.items.simple_cell_reference import SimpleCellReference
+from src.items.solution import Solution
+from src.items.unique_region import UniqueRegion
+from src.solvers.backend import Backend
+
+if TYPE_CHECKING:  # pragma: no cover
+    from src.solvers.solver import Solver
+
+
+class RegionBackend(Backend):
+    """Base class for native backends of puzzles made only of distinct-digit regions and given digits.
+
+    Any other item in the constraint tree makes the solver fall through to the next backend.
+    These backends work from the constraint tree, not the model.
+    """
+
+    reads_model: ClassVar[bool] = False
+    supported: ClassVar[tuple[type[Item], ...]] = (
+        Constraints,
+        Rows,
+        Columns,
+        Boxes,
+        DisjointGroups,
+        Row,
+        Column,
+        Box,
+        DisjointGroup,
+        UniqueRegion,
+        Known,
+        Solution,
+        KnownCell,
+        SimpleCellReference,
+        Cell,
+    )
+
+    def supports(self, solver: 'Solver') -> bool:
+        """Check if every item in the solver's constraint tree is a supported item.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+
+        Returns:
+            bool: True if the tree only holds supported items, False otherwise.
+        """
+        if solver.constraints is None:
+            return False
+        if isinstance(solver.constraints, Constraints):
+            return all(class_type in self.supported for class_type in solver.constraints.index.classes)
+        return all(type(item) in self.supported for item in solver.constraints.walk())
+
+    @staticmethod
+    def instances(solver: 'Solver', class_type: type[Item]) -> list[Item]:
+        """Return the items of a class in the constraint tree, from its index when it has one.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+            class_type (type[Item]): The class, including its subclasses.
+
+        Returns:
+            list[Item]: The items.
+        """
+        if isinstance(solver.constraints, Constraints):
+            return solver.constraints.index.instances(class_type)
+        return [item for item in solver.constraints.walk() if isinstance(item, class_type)]
+
+    @staticmethod
+    def index(solver: 'Solver', cell: Cell) -> int:
+        """Return the index of a cell.
+
+        Args:
+            solver (Solver): The solver holding the board.
+            cell (Cell): The cell.
+
+        Returns:
+            int: The zero based index of the cell in row major order.
+        """
+        return solver.board.geometry.index(cell.row, cell.column)
+
+    def regions(self, solver: 'Solver') -> list[list[int]]:
+        """Return the cell indexes of each region in the constraint tree.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+
+        Returns:
+            list[list[int]]: The cells of each region.
+        """
+        return [[self.index(solver, cell) for cell in item.cells] for item in self.instances(solver, Region)]
+
+    @staticmethod
+    def givens(solver: 'Solver') -> list[KnownCell]:
+        """Return the given digits in the constraint tree.
+
+        Args:
+            solver (Solver): The solver holding the constraint tree.
+
+        Returns:
+            list[KnownCell]: The given cells.
+        """
+        return RegionBackend.instances(solver, KnownCell)  # type: ignore
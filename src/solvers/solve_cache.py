@@ -0,0 +1,187 @@
+"""SolveCache."""
+import json
+import re
+import sqlite3
+from pathlib import Path
+from types import TracebackType
+
+from src.board.board import Board
+from src.items.item import Item
+from src.solvers.answer import Answer
+from src.solvers.canonical_form import CanonicalForm
+from src.solvers.solver_status import SolverStatus
+from src.utils.config import Config
+
+config = Config()
+
+
+class SolveCache:
+    """Remember the results of solves on disk, keyed by the content of the puzzle.
+
+    The key is a hash of the puzzle's canonical form, so a puzzle gets the same key however its
+    file is named, its constraints are ordered, or it is rotated, reflected or relabelled. Each
+    entry holds the status, the answer's digits in the canonical orientation and the solver
+    statistics. When the cache is full, the least recently used entries are evicted.
+
+    Attributes:
+        path (Path): The SQLite database file.
+        capacity (int): The maximum number of entries.
+        hits (int): The number of lookups that found an entry.
+        misses (int): The number of lookups that did not.
+    """
+
+    def __init__(self, path: Path | str | None = None, capacity: int | None = None) -> None:
+        """Open the cache, creating its table if needed.
+
+        Args:
+            path (Path | str | None): The SQLite database file. Defaults to the configured statistic database.
+            capacity (int | None): The maximum number of entries. Defaults to the configured solve cache size.
+        """
+        self.path: Path = Path(config.statistic_database if path is None else path)
+        self.capacity: int = int(config.solve_cache_size if capacity is None else capacity)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.connection: sqlite3.Connection = sqlite3.connect(self.path, timeout=30)
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS SolveCache (
+                key TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                answer TEXT,
+                statistics TEXT NOT NULL,
+                used INTEGER NOT NULL
+                )
+                """,
+            )
+
+    @staticmethod
+    def key(board: Board, constraints: Item) -> str:
+        """Compute the content key of a puzzle.
+
+        The key is taken from the puzzle's canonical form, so rotations, reflections and digit
+        relabellings of a puzzle share it.
+
+        Args:
+            board (Board): The board. Only its size and digits are part of the key.
+            constraints (Item): The root of the constraint tree.
+
+        Returns:
+            str: The SHA-256 hex digest of the canonical puzzle text.
+        """
+        return CanonicalForm.create(board, constraints).key
+
+    @staticmethod
+    def statistics(log: str | None) -> dict[str, str]:
+        """Extract the configured statistic elements from a solver log.
+
+        Args:
+            log (str | None): The solver log.
+
+        Returns:
+            dict[str, str]: The value of each statistic found in the log.
+        """
+        found: dict[str, str] = {}
+        for name, pattern in dict(config.statistic_elements).items():
+            match: re.Match | None = re.search(pattern, log or '')
+            if match is not None:
+                found[name] = match.group(1)
+        return found
+
+    def get(self, key: str) -> tuple[SolverStatus, list[list[int]] | None, dict[str, str]] | None:
+        """Look up an entry, marking it as the most recently used.
+
+        Args:
+            key (str): The content key.
+
+        Returns:
+            tuple[SolverStatus, list[list[int]] | None, dict[str, str]] | None: The status, the answer's
+                digits and the statistics, or None if the key is not cached.
+        """
+        row: tuple | None = self.connection.execute(
+            'SELECT status, answer, statistics FROM SolveCache WHERE key = ?',
+            (key,),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        with self.connection:
+            self.connection.execute(
+                'UPDATE SolveCache SET used = (SELECT COALESCE(MAX(used), 0) + 1 FROM SolveCache) WHERE key = ?',
+                (key,),
+            )
+        status, answer, statistics = row
+        digits: list[list[int]] | None = None if answer is None else json.loads(answer)
+        return SolverStatus(status), digits, json.loads(statistics)
+
+    def put(
+        self,
+        key: str,
+        status: SolverStatus,
+        answer: Answer | None,
+        statistics: dict[str, str],
+    ) -> None:
+        """Store an entry as the most recently used, evicting the least recently used entries beyond the capacity.
+
+        Args:
+            key (str): The content key.
+            status (SolverStatus): The status of the solve.
+            answer (Answer | None): The answer, if one was found.
+            statistics (dict[str, str]): The solver statistics.
+        """
+        digits: str | None = None if answer is None else json.dumps(answer.digits)
+        with self.connection:
+            self.connection.execute(
+                """
+                INSERT OR REPLACE INTO SolveCache (key, status, answer, statistics, used)
+                VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(used), 0) + 1 FROM SolveCache))
+                """,
+                (key, status.value, digits, json.dumps(statistics)),
+            )
+            self.connection.execute(
+                'DELETE FROM SolveCache WHERE key NOT IN (SELECT key FROM SolveCache ORDER BY used DESC LIMIT ?)',
+                (self.capacity,),
+            )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self.connection:
+            self.connection.execute('DELETE FROM SolveCache')
+
+    def __len__(self) -> int:
+        """Return the number of entries.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self.connection.execute('SELECT COUNT(*) FROM SolveCache').fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> 'SolveCache':
+        """Enter the runtime context.
+
+        Returns:
+            SolveCache: The cache.
+        """
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context, closing the database connection."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({str(self.path)!r}, {self.capacity!r})'
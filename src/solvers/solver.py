@@ -1,21 +1,32 @@
 """Solver."""
-import logging
-from contextlib import redirect_stdout
-from io import StringIO
+import asyncio
+import os
+from collections.abc import Iterable
+from itertools import islice
+from itertools import product
 from pathlib import Path
+from typing import Any
+from typing import TextIO
 
-from pulp import getSolver
+from pulp import LpConstraint
+from pulp import LpConstraintEQ
+from pulp import LpConstraintLE
 from pulp import LpMinimize
 from pulp import LpProblem
-from pulp import LpSolver
-from pulp import LpStatus
+from pulp import LpVariable
+from pulp import lpSum
 
 from src.board.board import Board
 from src.solvers.answer import Answer
+from src.solvers.backend import Backend
+from src.solvers.pulp_backend import PulpBackend
 from src.solvers.solver_status import SolverStatus
+from src.solvers.sparse_model import SparseModel
 from src.solvers.variables import Variables
 from src.solvers.variables import VariableSet
 from src.utils.config import Config
+from src.utils.name_allocator import NameAllocator
+from src.utils.sudoku_exception import SudokuError
 
 config = Config()
 
@@ -23,63 +34,380 @@ config = Config()
 class Solver:
     """Solver class that manages the solving of a puzzle using a given board and line representation."""
 
-    def __init__(self, board: Board, name: str, solver_name: str = 'PULP_CBC_CMD'):
+    def __init__(
+        self,
+        board: Board,
+        name: str,
+        solver_name: str = 'PULP_CBC_CMD',
+        backends: list[Backend] | None = None,
+        sparse: bool = False,
+    ):
         """Initialize the Solver with the given board, solver name, and application name.
 
         Args:
             board (Board): The board object representing the puzzle layout.
             name (str): Name for the solver instance.
             solver_name (str): Solver name, default is 'PULP_CBC_CMD'.
+            backends (list[Backend] | None): Backends to try, in order. Defaults to the PuLP backend only.
+            sparse (bool): Build the model as a sparse matrix rather than a PuLP problem.
         """
         self.board: Board = board
         self.answer: Answer = Answer(self.board)
         self.name: str = name
         self.solver_name: str = solver_name
         self.application_name = 'CBC' if solver_name == 'PULP_CBC_CMD' else solver_name
+        self.backends: list[Backend] = [PulpBackend()] if backends is None else backends
+        self.backend: Backend | None = None
+        self.constraints: Any = None
+        # Rows and variables each item added to a PuLP model, by item name, so items can be removed again
+        self.item_rows: dict[str, list[str]] = {}
+        self.item_variables: dict[str, list[LpVariable]] = {}
+        # Names of the variables some recorded item or cell row has used, so each variable has one owner
+        self.used_variables: set[str] = set()
 
         self.status: SolverStatus = SolverStatus.not_solved
         self.log: str | None = None
 
+        # MIP start, and what the MIP application made of it
+        self.start: Answer | None = None
+        self.start_accepted: bool | None = None
+        self.nodes: int | None = None
+
         # TODO: get the types of variables from the constraints
         self.variables: Variables = Variables(board, [VariableSet.choice, VariableSet.number])
+        # Names and auxiliary variables belong to this solver, so models built side by side do not share them
+        self.names: NameAllocator = NameAllocator()
+        self.auxiliary_variables: dict[str, LpVariable] = {}
+
+        self.model: LpProblem | SparseModel
+        if sparse:
+            self.model = SparseModel(self.name, self.variables)
+        else:
+            self.model = LpProblem(self.name, LpMinimize)
+            self.model += 0, 'DummyObjective'
+
+    def add_constraints(self, constraints: Any) -> None:
+        """Add the constraints of an item tree to the model, keeping the tree for native backends.
+
+        Every cell of the board gets its own rows first. For a PuLP model, the rows and variables added by
+        each top level item are recorded, so the item can be removed later.
+
+        Args:
+            constraints (Any): The root item of the constraint tree.
+        """
+        self.constraints = constraints
+        for row, column in product(self.board.row_range, self.board.column_range):
+            self.add_cell_constraint(row, column)
+        if isinstance(self.model, SparseModel):
+            constraints.add_constraint(self)
+            return
+        for constraint in self.model.constraints.values():
+            self.used_variables.update(variable.name for variable in constraint)
+        for item in getattr(constraints, 'components', [constraints]):
+            self.record(item)
+
+    def record(self, item: Any) -> None:
+        """Add an item's constraints to the PuLP model, recording the rows and variables it adds.
+
+        PuLP keeps rows in the order they are added, so the new ones are found at the end, in time
+        proportional to their number. The variables recorded are those the item's rows used first.
+
+        Args:
+            item (Any): The item.
+        """
+        model: LpProblem = self.model  # type: ignore
+        rows: int = len(model.constraints)
+        item.add_constraint(self)
+        added: list[str] = list(islice(reversed(model.constraints), len(model.constraints) - rows))
+        added.reverse()
+        self.item_rows.setdefault(item.name, []).extend(added)
+        owned: list[LpVariable] = self.item_variables.setdefault(item.name, [])
+        for row in added:
+            for variable in model.constraints[row]:
+                if variable.name not in self.used_variables:
+                    self.used_variables.add(variable.name)
+                    owned.append(variable)
+
+    def add_item(self, item: Any) -> None:
+        """Add an item to a model that is already built, without rebuilding the rest of it.
+
+        The item also joins the constraint tree, so backends that work from the tree see it.
+
+        Args:
+            item (Any): The item.
+
+        Raises:
+            SudokuError: If the model is a sparse model, or an item with the same name is in the model.
+        """
+        if isinstance(self.model, SparseModel):
+            raise SudokuError('Items can only be added to a PuLP model.')
+        if item.name in self.item_rows:
+            raise SudokuError(f'Item {item.name!r} is already in the model.')
+        self.record(item)
+        if self.constraints is not None and hasattr(self.constraints, 'components'):
+            self.constraints.add(item)
+        self.status = SolverStatus.not_solved
+
+    def remove_item(self, name: str) -> None:
+        """Remove an item's rows and variables from the model, keeping the rows of the rest of it.
+
+        The model is rebuilt from the rows left, so it only lists the variables they use. The rows are
+        not built again. Rows that presolve has already dropped are skipped. Bounds fixed by presolve or
+        bookkeeping because of the item are not undone.
+
+        Args:
+            name (str): The name of the item.
+
+        Raises:
+            SudokuError: If the model is a sparse model, or no item with the name is in the model.
+        """
+        if isinstance(self.model, SparseModel):
+            raise SudokuError('Items can only be removed from a PuLP model.')
+        if name not in self.item_rows:
+            raise SudokuError(f'Item {name!r} is not in the model.')
+        model: LpProblem = self.model
+        removed: set[str] = set(self.item_rows.pop(name))
+        for variable in self.item_variables.pop(name, []):
+            self.used_variables.discard(variable.name)
+        rebuilt: LpProblem = LpProblem(model.name, model.sense)
+        rebuilt.objective = model.objective
+        for row, constraint in model.constraints.items():
+            if row not in removed:
+                rebuilt.addConstraint(constraint, row)
+        self.model = rebuilt
+        if self.constraints is not None and hasattr(self.constraints, 'components'):
+            self.constraints.remove(name)
+        self.status = SolverStatus.not_solved
+
+    def add_choice_constraint(
+        self,
+        name: str,
+        choices: Iterable[tuple[int, int, int]],
+        sense: int,
+        rhs: int,
+    ) -> None:
+        """Add a constraint on the sum of some choice variables.
+
+        A sparse model takes the row as column ids, without building a PuLP expression.
+
+        Args:
+            name (str): The name of the constraint.
+            choices (Iterable[tuple[int, int, int]]): The (digit, row, column) of each choice in the sum.
+            sense (int): The PuLP sense of the constraint.
+            rhs (int): The right hand side.
+        """
+        if isinstance(self.model, SparseModel):
+            columns: list[int] = [self.model.choice(digit, row, column) for digit, row, column in choices]
+            self.model.add_row(name, columns, [1] * len(columns), sense, rhs)
+            return
+        total = lpSum(
+            self.variables.choices[digit][row][column] for digit, row, column in choices  # type: ignore
+        )
+        self.model += LpConstraint(total, sense, name, rhs)
+
+    def add_cell_constraint(self, row: int, column: int) -> None:
+        """Add the rows that make a cell hold exactly one digit, and tie its number variable to that digit.
+
+        Items constrain either the choice or the number variables, so both rows are needed for the two to
+        describe the same grid. A cell whose rows are already in the model is left alone.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+        """
+        unique: str = f'Unique_digit_{row}_{column}'
+        names = self.model.row_index if isinstance(self.model, SparseModel) else self.model.constraints
+        if unique in names:
+            return
+        digits: list[int] = list(self.board.digits.digit_range)
+        self.add_choice_constraint(unique, [(digit, row, column) for digit in digits], LpConstraintEQ, 1)
+        name: str = f'Number_{row}_{column}'
+        if isinstance(self.model, SparseModel):
+            columns: list[int] = [self.model.choice(digit, row, column) for digit in digits]
+            columns.append(self.model.number(row, column))
+            self.model.add_row(name, columns, [*digits, -1], LpConstraintEQ, 0)
+            return
+        total = lpSum(digit * self.variables.choices[digit][row][column] for digit in digits)  # type: ignore
+        self.model += LpConstraint(total - self.variables.numbers[row][column], LpConstraintEQ, name, 0)  # type: ignore
+
+    def warm_start(self, answer: Answer | None) -> None:
+        """Give the MIP application an initial assignment to start from.
+
+        The choice and number variables take the values of the answer, such as a known solution or the answer
+        found before a small edit. The values are not checked against the bounds set by presolve, so a start
+        that breaks them is passed on and rejected by the MIP application.
+
+        Args:
+            answer (Answer | None): The initial assignment, or None to start cold.
+        """
+        self.start = answer
+        if answer is None:
+            return
+        for row, column in product(self.board.row_range, self.board.column_range):
+            digit: int = answer[row, column]
+            for candidate in self.board.digits.digit_range:
+                self.variables.choices[candidate][row][column].setInitialValue(  # type: ignore
+                    int(candidate == digit),
+                    check=False,
+                )
+            self.variables.numbers[row][column].setInitialValue(digit, check=False)  # type: ignore
 
-        self.model: LpProblem = LpProblem(self.name, LpMinimize)
-        self.model += 0, 'DummyObjective'
+    def lp_problem(self) -> LpProblem:
+        """Return the model as a PuLP problem.
+
+        Returns:
+            LpProblem: The model, converted if it is a sparse model.
+        """
+        if isinstance(self.model, SparseModel):
+            return self.model.to_pulp()
+        return self.model
+
+    def sparse_model(self) -> SparseModel:
+        """Return the model as a sparse model.
+
+        Returns:
+            SparseModel: The model, converted if it is a PuLP problem.
+        """
+        if isinstance(self.model, SparseModel):
+            return self.model
+        return SparseModel.from_problem(self.model, self.variables)
+
+    def write_lp(self, stream: TextIO) -> None:
+        """Write the puzzle model in LP (Linear Programming) format to a stream.
+
+        Args:
+            stream (TextIO): The stream to write to, such as an open file or a StringIO.
+        """
+        self.sparse_model().write_lp(stream)
+
+    def write_mps(self, stream: TextIO) -> None:
+        """Write the puzzle model in MPS (Mathematical Programming System) format to a stream.
+
+        Args:
+            stream (TextIO): The stream to write to, such as an open file or a StringIO.
+        """
+        self.sparse_model().write_mps(stream)
 
     def save_lp(self, filename: Path | str) -> None:
         """Save the puzzle model in LP (Linear Programming) format.
 
         Args:
-            filename (Path | str): The config_file or name of the file_path to save the LP format.
+            filename (Path | str): The path of the file to save the LP format to.
         """
-        if isinstance(filename, Path):
-            self.model.writeLP(filename.name)
-        else:
-            self.model.writeLP(filename)
+        with Path(filename).open(mode='w', encoding='utf-8') as file:
+            self.write_lp(file)
 
     def save_mps(self, filename: Path | str) -> None:
         """Save the puzzle model in MPS (Mathematical Programming System) format.
 
         Args:
-            filename (Path | str): The config_file or name of the file_path to save the MPS format.
+            filename (Path | str): The path of the file to save the MPS format to.
         """
-        if isinstance(filename, Path):
-            self.model.writeMPS(filename.name)
-        else:
-            self.model.writeMPS(filename)
+        with Path(filename).open(mode='w', encoding='utf-8') as file:
+            self.write_mps(file)
+
+    def select_backend(self) -> Backend | None:
+        """Select the first backend that supports the model.
+
+        Returns:
+            Backend | None: The backend, or None if no backend supports the model.
+        """
+        for backend in self.backends:
+            if backend.supports(self):
+                self.backend = backend
+                return backend
+        self.status = SolverStatus.undefined
+        self.log = 'No backend supports this model.'
+        return None
 
     def solve(self) -> None:
-        """Solve the puzzle using the specified solver and update the solution status."""
-        application: LpSolver = getSolver(self.solver_name, msg=1)
-        log_output = StringIO()
+        """Solve the puzzle with the first backend that supports it and update the solution status."""
+        backend: Backend | None = self.select_backend()
+        if backend is not None:
+            backend.solve(self)
+
+    def chosen(self) -> list[tuple[int, int, int]]:
+        """Return the choices that are one in the last solve.
+
+        A choice fixed by presolve is not in the model, so its bounds give its value.
+
+        Returns:
+            list[tuple[int, int, int]]: The (digit, row, column) of each choice that is one.
+        """
+        chosen: list[tuple[int, int, int]] = []
+        for digit, row, column in product(self.board.digits.digit_range, self.board.row_range, self.board.column_range):
+            choice: LpVariable = self.variables.choices[digit][row][column]  # type: ignore
+            value: float | None = choice.varValue
+            if value is None and choice.lowBound is not None and choice.lowBound == choice.upBound:
+                value = choice.lowBound
+            if value is not None and value > 0.5:
+                chosen.append((digit, row, column))
+        return chosen
+
+    def exclude(self, name: str) -> None:
+        """Add a no-good cut to the model that rules out the choices of the last solve.
+
+        At most all but one of those choices can be chosen again, so any other answer still fits.
+
+        Args:
+            name (str): The name of the cut.
+
+        Raises:
+            SudokuError: If no choice is one, as the model has not been solved.
+        """
+        choices: list[tuple[int, int, int]] = self.chosen()
+        if not choices:
+            raise SudokuError(f'No solve to cut off with {name!r}.')
+        self.add_choice_constraint(name, choices, LpConstraintLE, len(choices) - 1)
+
+    def resolve(self) -> None:
+        """Solve the model again, after cuts have been added, reusing the model already built.
+
+        Backends that work from the constraint tree do not see the cuts, so the first backend that reads
+        the model and supports it is used.
+        """
+        for backend in self.backends:
+            if backend.reads_model and backend.supports(self):
+                self.backend = backend
+                backend.solve(self)
+                return
+        self.status = SolverStatus.undefined
+        self.log = 'No backend reads the model.'
+
+    async def solve_async(self, time_limit: float | None = None, semaphore: asyncio.Semaphore | None = None) -> None:
+        """Solve the puzzle without blocking the event loop.
+
+        Cancelling the task stops the solve, killing any child process.
+
+        Args:
+            time_limit (float | None): The wall clock limit in seconds. None waits for the solve to finish.
+            semaphore (asyncio.Semaphore | None): Held while solving, to bound the number of concurrent solves.
+        """
+        if semaphore is not None:
+            async with semaphore:
+                await self.solve_async(time_limit)
+            return
+        backend: Backend | None = self.select_backend()
+        if backend is None:
+            return
         try:
-            with redirect_stdout(log_output):
-                self.model.solve(application)
-        except Exception as exp:
-            # Log the exception for better traceability
-            logging.error(f'Error occurred during solving: {exp!s}', exc_info=True)
-            self.status = SolverStatus(LpStatus.INFEASIBLE)  # or another status
-            self.log = f'Error occurred: {exp!s}'
-            return  # Exit early if there's an error
-        self.status = SolverStatus(LpStatus[self.model.status])
-        self.log = log_output.getvalue()
+            await backend.solve_async(self, time_limit)
+        except TimeoutError:
+            self.status = SolverStatus.not_solved
+            self.log = f'Time limit of {time_limit} seconds reached.'
+
+    @staticmethod
+    async def solve_all(
+        solvers: Iterable['Solver'],
+        concurrency: int | None = None,
+        time_limit: float | None = None,
+    ) -> None:
+        """Solve many puzzles concurrently.
+
+        Args:
+            solvers (Iterable[Solver]): The solvers.
+            concurrency (int | None): The maximum number of concurrent solves. Defaults to the number of CPUs.
+            time_limit (float | None): The wall clock limit in seconds for each solve.
+        """
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency or os.cpu_count() or 1)
+        await asyncio.gather(*(solver.solve_async(time_limit, semaphore) for solver in solvers))
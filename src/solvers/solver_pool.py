@@ -0,0 +1,463 @@
+"""SolverPool."""
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from queue import Queue
+from types import TracebackType
+
+from pulp import getSolver
+
+from src.solvers.pulp_backend import PulpBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.sudoku_exception import SudokuError
+
+POLL_SECONDS: float = 0.1
+GRACE_SECONDS: float = 10
+MEMORY_DIRECTORY: Path = Path('/dev/shm')  # noqa: S108
+MARKER: str = 'zzreply'
+NO_TIME_LIMIT: str = '1e100'
+IMPORTED: re.Pattern = re.compile(r'^Problem \S* has \d+ rows', re.MULTILINE)
+
+
+class CbcProcess:
+    """An interactive CBC process, started ahead of the model it solves.
+
+    CBC reads commands from its standard input and writes its log and solutions to its standard output. Each batch
+    of commands ends with a marker CBC does not know, so the reply ends where CBC complains about the marker.
+
+    CBC has some limits here. It cannot import a model from its standard input or from a pipe, as it opens the
+    model file several times, so each model is written to a file in the worker's directory, which is memory-backed
+    where the platform allows. When an import fails CBC keeps the model it read before, so a failed import is an
+    error rather than a solve of the old model. CBC also keeps its best solution, cutoff and basis from one model to
+    the next, which gives wrong answers, so a process solves one model and the worker starts the next process while
+    the current model solves. Time limits use CBC's seconds option, measured in elapsed time. MIP starts are not
+    passed to CBC.
+
+    Attributes:
+        path (str): The path of the CBC executable.
+        process (subprocess.Popen | None): The CBC process, or None if it is not started.
+        replies (int): The number of command batches sent, used to make each marker unique.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the process, without starting CBC.
+
+        Args:
+            path (str): The path of the CBC executable.
+        """
+        self.path: str = path
+        self.process: subprocess.Popen | None = None
+        self.replies: int = 0
+
+    def start(self) -> None:
+        """Start CBC in interactive mode, without waiting for it to be ready."""
+        self.process = subprocess.Popen(  # noqa: S603  # pylint: disable=consider-using-with
+            [self.path, '-timeMode', 'elapsed', '-printingOptions', 'all', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+
+    def stop(self) -> None:
+        """Ask CBC to quit, and kill it if it does not."""
+        if self.process is None:
+            return
+        try:
+            self.process.communicate('quit\n', timeout=1)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+    def is_alive(self) -> bool:
+        """Check if CBC is running.
+
+        Returns:
+            bool: True if CBC is running.
+        """
+        return self.process is not None and self.process.poll() is None
+
+    def command(self, *commands: str) -> list[str]:
+        """Send commands to CBC and read its reply.
+
+        Args:
+            *commands (str): The commands.
+
+        Returns:
+            list[str]: The lines CBC wrote since the last reply, without CBC's 'Coin:' prefix.
+
+        Raises:
+            SudokuError: If CBC is not running, or exits before replying.
+        """
+        if self.process is None or self.process.stdin is None or self.process.stdout is None:
+            raise SudokuError('CBC is not running.')
+        self.replies += 1
+        marker: str = f'{MARKER}{self.replies}'
+        try:
+            self.process.stdin.write('\n'.join((*commands, marker)) + '\n')
+            self.process.stdin.flush()
+        except OSError as exc:
+            raise SudokuError(f'CBC failed: {exc}') from exc
+        lines: list[str] = []
+        for line in self.process.stdout:
+            if marker in line:
+                return lines
+            lines.append(line.rstrip('\n').removeprefix('Coin:'))
+        raise SudokuError('CBC exited.')
+
+    def solve(self, model_path: Path, time_limit: float | None) -> tuple[SolverStatus, dict[str, float], str]:
+        """Solve a model held in an MPS file.
+
+        Args:
+            model_path (Path): The path of the MPS file.
+            time_limit (float | None): The wall clock limit in seconds. None waits for the solve to finish.
+
+        Returns:
+            tuple[SolverStatus, dict[str, float], str]: The status, the value of each variable by name, and the log.
+
+        Raises:
+            SudokuError: If CBC cannot read the model, or fails.
+        """
+        log: list[str] = self.command(f'import {model_path}')
+        if not IMPORTED.search('\n'.join(log)):
+            raise SudokuError('CBC could not read the model.')
+        seconds: str = NO_TIME_LIMIT if time_limit is None else str(time_limit)
+        log += self.command(f'seconds {seconds}', 'solve')
+        status, values = PulpBackend.read_solution('\n'.join(self.command('solution stdout')))
+        return status, values, '\n'.join(log)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the process.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.path!r})'
+
+
+def serve(connection: Connection, path: str, directory: Path) -> None:
+    """Answer requests from the pool until told to stop or the pipe closes.
+
+    The worker always holds a started CBC process for the next model, and replaces it once it has solved a model
+    or failed. Requests are tuples. ('ping',) checks that the next CBC process replies and is answered with
+    ('pong', pid). ('solve', mps, names, time_limit) is answered with ('solved', status, values, log), where values
+    only holds the named variables. Failures are answered with ('error', message).
+
+    Args:
+        connection (Connection): The worker's end of the pipe.
+        path (str): The path of the CBC executable.
+        directory (Path): The directory holding the model file.
+    """
+    model_path: Path = directory / 'model.mps'
+    spare: CbcProcess = CbcProcess(path)
+    spare.start()
+    try:
+        while True:
+            try:
+                request: tuple = connection.recv()
+            except EOFError:
+                return
+            match request:
+                case ('ping',):
+                    try:
+                        spare.command()
+                    except SudokuError:
+                        spare.stop()
+                        spare.start()
+                    connection.send(('pong', os.getpid()))
+                case ('solve', mps, names, time_limit):
+                    cbc, spare = spare, CbcProcess(path)
+                    spare.start()
+                    try:
+                        model_path.write_text(mps, encoding='utf-8')
+                        status, values, log = cbc.solve(model_path, time_limit)
+                        connection.send(('solved', status.value, {name: values.get(name) for name in names}, log))
+                    except (SudokuError, OSError) as exc:
+                        connection.send(('error', str(exc)))
+                    finally:
+                        cbc.stop()
+                case ('stop',):
+                    return
+                case _:
+                    connection.send(('error', f'Unknown request {request!r}'))
+    finally:
+        spare.stop()
+
+
+class PoolWorker:
+    """A long-lived worker process and the pool's end of its pipe.
+
+    The worker's model directory belongs to the pool side, so it is removed even if the worker is killed.
+    A killed worker's CBC quits when it reads the end of its input.
+
+    Attributes:
+        path (str): The path of the CBC executable.
+        directory (Path | None): The directory holding the worker's model file, or None if the worker is not started.
+        process (BaseProcess | None): The worker process, or None if it is not started.
+        connection (Connection | None): The pool's end of the pipe, or None if the worker is not started.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the worker, without starting it.
+
+        Args:
+            path (str): The path of the CBC executable.
+        """
+        self.path: str = path
+        self.directory: Path | None = None
+        self.process: BaseProcess | None = None
+        self.connection: Connection | None = None
+
+    def start(self) -> None:
+        """Start the worker process, with a new model directory."""
+        memory: str | None = str(MEMORY_DIRECTORY) if MEMORY_DIRECTORY.is_dir() else None
+        self.directory = Path(tempfile.mkdtemp(prefix='cbc-', dir=memory))
+        context = multiprocessing.get_context('spawn')
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=serve, args=(child, self.path, self.directory), daemon=True)
+        self.process.start()
+        child.close()
+
+    def stop(self) -> None:
+        """Ask the worker process to stop, kill it if it does not, and remove its model directory."""
+        if self.process is not None and self.connection is not None:
+            try:
+                if self.process.is_alive():
+                    self.connection.send(('stop',))
+            except OSError:
+                pass
+            self.process.join(1)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+            self.connection.close()
+            self.process = None
+            self.connection = None
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+    def restart(self) -> None:
+        """Replace the worker process with a new one."""
+        self.stop()
+        self.start()
+
+    def is_alive(self) -> bool:
+        """Check if the worker process is running.
+
+        Returns:
+            bool: True if the worker process is running.
+        """
+        return self.process is not None and self.process.is_alive()
+
+    def request(self, message: tuple, timeout: float | None = None) -> tuple:
+        """Send a request to the worker and wait for the reply.
+
+        Args:
+            message (tuple): The request.
+            timeout (float | None): The longest time to wait, in seconds. None waits while the worker is alive.
+
+        Returns:
+            tuple: The reply.
+
+        Raises:
+            SudokuError: If the worker dies, or does not reply in time.
+        """
+        if self.connection is None or not self.is_alive():
+            raise SudokuError('Worker is not running.')
+        try:
+            self.connection.send(message)
+            waited: float = 0
+            while not self.connection.poll(POLL_SECONDS):
+                waited += POLL_SECONDS
+                if not self.is_alive():
+                    raise SudokuError('Worker died.')
+                if timeout is not None and waited >= timeout:
+                    raise SudokuError('Worker did not reply in time.')
+            reply: tuple = self.connection.recv()
+        except (EOFError, OSError) as exc:
+            raise SudokuError(f'Worker failed: {exc}') from exc
+        return reply
+
+    def __repr__(self) -> str:
+        """Return a string representation of the worker.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.path!r})'
+
+
+class SolverPool:
+    """Solve models in a pool of long-lived worker processes.
+
+    Each worker starts once, with the solver stack already imported, and then solves model after model, always
+    holding a started CBC process for the next model. The models stream to the workers as MPS text over a pipe,
+    written in memory by the solver, and the values of the choice variables come back to fill the answer grid.
+    See CbcProcess for the limits of driving CBC this way.
+
+    A worker that dies, or does not reply within the time limit and a grace period, is restarted, and its
+    model is retried once on the new worker.
+
+    Attributes:
+        size (int): The number of workers.
+        path (str): The path of the CBC executable.
+        workers (list[PoolWorker]): The workers.
+        restarts (int): The number of workers restarted.
+    """
+
+    def __init__(self, size: int | None = None, solver_name: str = 'PULP_CBC_CMD') -> None:
+        """Initialize the pool and start its workers.
+
+        Args:
+            size (int | None): The number of workers. Defaults to the number of CPUs.
+            solver_name (str): The name of the PuLP solver whose executable the workers run.
+        """
+        self.size: int = size or os.cpu_count() or 1
+        self.path: str = getSolver(solver_name).path
+        self.workers: list[PoolWorker] = [PoolWorker(self.path) for _ in range(self.size)]
+        self.idle: Queue[PoolWorker] = Queue()
+        self.restarts: int = 0
+        for worker in self.workers:
+            worker.start()
+            self.idle.put(worker)
+
+    def restart(self, worker: PoolWorker) -> None:
+        """Replace a worker's process with a new one.
+
+        Args:
+            worker (PoolWorker): The worker.
+        """
+        worker.restart()
+        self.restarts += 1
+
+    def check(self, timeout: float = 10) -> int:
+        """Ping each worker, restarting any that does not answer. Busy workers are checked once they finish.
+
+        Args:
+            timeout (float): The longest time to wait for each worker, in seconds.
+
+        Returns:
+            int: The number of workers restarted.
+        """
+        restarted: int = 0
+        workers: list[PoolWorker] = [self.idle.get() for _ in range(self.size)]
+        for worker in workers:
+            try:
+                worker.request(('ping',), timeout)
+            except SudokuError:
+                self.restart(worker)
+                restarted += 1
+            self.idle.put(worker)
+        return restarted
+
+    def submit(self, message: tuple, timeout: float | None = None) -> tuple:
+        """Send a request to an idle worker, restarting the worker and retrying once if it fails.
+
+        Args:
+            message (tuple): The request.
+            timeout (float | None): The longest time to wait for each try, in seconds. None waits while the worker
+                is alive.
+
+        Returns:
+            tuple: The reply.
+
+        Raises:
+            SudokuError: If the request fails on the restarted worker too.
+        """
+        worker: PoolWorker = self.idle.get()
+        try:
+            try:
+                return worker.request(message, timeout)
+            except SudokuError:
+                self.restart(worker)
+            try:
+                return worker.request(message, timeout)
+            except SudokuError:
+                self.restart(worker)
+                raise
+        finally:
+            self.idle.put(worker)
+
+    def solve(self, solver: Solver, time_limit: float | None = None) -> None:
+        """Solve a solver's model on a worker, updating the solver's status, answer and log.
+
+        Args:
+            solver (Solver): The solver holding the model.
+            time_limit (float | None): The wall clock limit in seconds. None waits for the solve to finish.
+        """
+        stream: StringIO = StringIO()
+        solver.write_mps(stream)
+        names: list[str] = [
+            choice.name
+            for rows in solver.variables.choices.values()
+            for columns in rows.values()
+            for choice in columns.values()
+        ]
+        timeout: float | None = None if time_limit is None else time_limit + GRACE_SECONDS
+        try:
+            reply: tuple = self.submit(('solve', stream.getvalue(), names, time_limit), timeout)
+        except SudokuError as exc:
+            solver.status = SolverStatus.undefined
+            solver.log = str(exc)
+            return
+        if reply[0] != 'solved':
+            solver.status = SolverStatus.infeasible
+            solver.log = f'Error occurred: {reply[1]}'
+            return
+        _, status, values, solver.log = reply
+        PulpBackend.read_log(solver)
+        solver.status = SolverStatus(status)
+        if solver.status == SolverStatus.optimal:
+            PulpBackend.extract(solver, values)
+
+    def solve_all(self, solvers: list[Solver], time_limit: float | None = None) -> None:
+        """Solve many solvers' models, using every worker at once.
+
+        Args:
+            solvers (list[Solver]): The solvers.
+            time_limit (float | None): The wall clock limit in seconds for each solve.
+        """
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            list(executor.map(lambda solver: self.solve(solver, time_limit), solvers))
+
+    def close(self) -> None:
+        """Stop every worker."""
+        for worker in self.workers:
+            worker.stop()
+
+    def __enter__(self) -> 'SolverPool':
+        """Enter the runtime context.
+
+        Returns:
+            SolverPool: The pool.
+        """
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context, stopping every worker."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the pool.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.size!r})'
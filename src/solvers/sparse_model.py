@@ -0,0 +1,459 @@
+"""SparseModel."""
+from array import array
+from collections.abc import Iterable
+from typing import Self
+from typing import TextIO
+
+from pulp import LpAffineExpression
+from pulp import LpConstraint
+from pulp import LpConstraintEQ
+from pulp import LpConstraintGE
+from pulp import LpConstraintLE
+from pulp import LpInteger
+from pulp import LpMinimize
+from pulp import LpProblem
+from pulp import LpVariable
+
+from src.solvers.variables import Variables
+from src.utils.sudoku_exception import SudokuError
+
+LP_SENSES: dict[int, str] = {LpConstraintEQ: '=', LpConstraintLE: '<=', LpConstraintGE: '>='}
+MPS_SENSES: dict[int, str] = {LpConstraintEQ: 'E', LpConstraintLE: 'L', LpConstraintGE: 'G'}
+
+
+def number_text(number: float) -> str:
+    """Format a coefficient or bound for LP and MPS files.
+
+    Args:
+        number (float): The number.
+
+    Returns:
+        str: The number with up to twelve significant digits.
+    """
+    return f'{number:.12g}'
+
+
+class SparseModel:
+    """A linear model held as a sparse matrix in coordinate (COO) form.
+
+    Each variable is a column with an integer id. The choice variables come first, in
+    (digit, row, column) order, followed by the number variables, so their ids are computed
+    rather than looked up. Any other variable gets the next free id when a constraint uses it.
+    Each constraint is a row, with its entries appended to three parallel arrays.
+
+    The model accepts `model += constraint, name` like a PuLP problem, so items that build
+    PuLP expressions still work. Items on the hot path add rows of ids directly with `add_row`.
+
+    Attributes:
+        name (str): The name of the model.
+        variables (Variables): The variables the fixed columns are taken from.
+        columns (list[LpVariable]): The variable for each column id.
+        index (dict[str, int]): The column id for each variable name.
+        entry_rows (array): The row id of each matrix entry.
+        entry_columns (array): The column id of each matrix entry.
+        entry_values (array): The coefficient of each matrix entry.
+        row_names (list[str]): The name of each row.
+        senses (list[int]): The PuLP sense of each row.
+        rhs (array): The right hand side of each row.
+        objective (dict[int, float]): The objective coefficient of each column that has one.
+    """
+
+    def __init__(self, name: str, variables: Variables) -> None:
+        """Initialize an empty model over the choice and number variables.
+
+        Args:
+            name (str): The name of the model.
+            variables (Variables): The variables the fixed columns are taken from.
+        """
+        self.name: str = name
+        self.variables: Variables = variables
+        board = variables.board
+        self.minimum_digit: int = board.digits.minimum
+        self.board_rows: int = board.size.row
+        self.board_columns: int = board.size.column
+        self.columns: list[LpVariable] = []
+        for rows in variables.choices.values():
+            for columns in rows.values():
+                self.columns.extend(columns.values())
+        self.choice_count: int = len(self.columns)
+        for columns in variables.numbers.values():
+            self.columns.extend(columns.values())
+        self.index: dict[str, int] = {variable.name: number for number, variable in enumerate(self.columns)}
+        self.entry_rows: array = array('i')
+        self.entry_columns: array = array('i')
+        self.entry_values: array = array('d')
+        self.row_names: list[str] = []
+        self.senses: list[int] = []
+        self.rhs: array = array('d')
+        self.row_index: dict[str, int] = {}
+        self.objective: dict[int, float] = {}
+
+    @classmethod
+    def from_problem(cls, problem: LpProblem, variables: Variables) -> 'SparseModel':
+        """Build a sparse model holding the same rows as a PuLP problem.
+
+        Args:
+            problem (LpProblem): The problem.
+            variables (Variables): The variables the fixed columns are taken from.
+
+        Returns:
+            SparseModel: The model.
+        """
+        model: SparseModel = cls(problem.name, variables)
+        if problem.objective is not None and len(problem.objective) > 0:
+            model += problem.objective
+        for name, constraint in problem.constraints.items():
+            model.add_constraint(constraint, name)
+        return model
+
+    def choice(self, digit: int, row: int, column: int) -> int:
+        """Return the column id of a choice variable.
+
+        Args:
+            digit (int): The digit.
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            int: The column id.
+        """
+        return ((digit - self.minimum_digit) * self.board_rows + row - 1) * self.board_columns + column - 1
+
+    def number(self, row: int, column: int) -> int:
+        """Return the column id of a number variable.
+
+        Args:
+            row (int): The row of the cell.
+            column (int): The column of the cell.
+
+        Returns:
+            int: The column id.
+        """
+        return self.choice_count + (row - 1) * self.board_columns + column - 1
+
+    def column(self, variable: LpVariable) -> int:
+        """Return the column id of a variable, adding a column if the variable is new.
+
+        Args:
+            variable (LpVariable): The variable.
+
+        Returns:
+            int: The column id.
+        """
+        number: int | None = self.index.get(variable.name)
+        if number is None:
+            number = len(self.columns)
+            self.columns.append(variable)
+            self.index[variable.name] = number
+        return number
+
+    def add_row(self, name: str, columns: Iterable[int], coefficients: Iterable[float], sense: int, rhs: float) -> int:
+        """Add a constraint row.
+
+        Args:
+            name (str): The name of the row.
+            columns (Iterable[int]): The column ids of the row's entries.
+            coefficients (Iterable[float]): The coefficients of the row's entries.
+            sense (int): The PuLP sense of the row.
+            rhs (float): The right hand side.
+
+        Returns:
+            int: The row id.
+
+        Raises:
+            SudokuError: If a row with the same name already exists.
+        """
+        if name in self.row_index:
+            raise SudokuError(f'Duplicate constraint name {name!r}.')
+        row: int = len(self.row_names)
+        before: int = len(self.entry_columns)
+        self.entry_columns.extend(columns)
+        self.entry_values.extend(coefficients)
+        self.entry_rows.extend([row] * (len(self.entry_columns) - before))
+        self.row_names.append(name)
+        self.senses.append(sense)
+        self.rhs.append(rhs)
+        self.row_index[name] = row
+        return row
+
+    def add_constraint(self, constraint: LpConstraint, name: str) -> int:
+        """Add a PuLP constraint as a row.
+
+        Args:
+            constraint (LpConstraint): The constraint.
+            name (str): The name of the row.
+
+        Returns:
+            int: The row id.
+        """
+        columns: list[int] = [self.column(variable) for variable in constraint]
+        return self.add_row(name, columns, constraint.values(), constraint.sense, -constraint.constant)
+
+    def __iadd__(self, other: object) -> Self:
+        """Add a constraint or objective, in the same forms a PuLP problem accepts.
+
+        Args:
+            other (object): A constraint or objective, optionally paired with its name.
+
+        Returns:
+            SparseModel: The model.
+        """
+        name: str | None = None
+        if isinstance(other, tuple):
+            other, name = other
+        if isinstance(other, LpConstraint):
+            self.add_constraint(other, name or other.name or f'_C{len(self.row_names) + 1}')
+        elif isinstance(other, LpAffineExpression):
+            self.objective = {self.column(variable): value for variable, value in other.items()}
+        elif isinstance(other, LpVariable):
+            self.objective = {self.column(other): 1}
+        return self
+
+    @property
+    def row_count(self) -> int:
+        """Return the number of rows.
+
+        Returns:
+            int: The number of constraints.
+        """
+        return len(self.row_names)
+
+    def used(self) -> list[int]:
+        """Return the ids of the columns used by a row or the objective.
+
+        Returns:
+            list[int]: The column ids in ascending order.
+        """
+        return sorted(set(self.entry_columns) | set(self.objective))
+
+    def by_row(self) -> list[list[int]]:
+        """Group the matrix entries by row.
+
+        Returns:
+            list[list[int]]: The entry positions of each row.
+        """
+        entries: list[list[int]] = [[] for _ in self.row_names]
+        for position, row in enumerate(self.entry_rows):
+            entries[row].append(position)
+        return entries
+
+    def by_column(self) -> dict[int, list[int]]:
+        """Group the matrix entries by column.
+
+        Returns:
+            dict[int, list[int]]: The entry positions of each used column.
+        """
+        entries: dict[int, list[int]] = {}
+        for position, column in enumerate(self.entry_columns):
+            entries.setdefault(column, []).append(position)
+        return entries
+
+    def terms(self, columns: list[int], coefficients: list[float]) -> str:
+        """Format a linear expression for an LP file.
+
+        Args:
+            columns (list[int]): The column ids.
+            coefficients (list[float]): The coefficients.
+
+        Returns:
+            str: The expression.
+        """
+        parts: list[str] = []
+        for column, coefficient in zip(columns, coefficients, strict=True):
+            sign: str = '-' if coefficient < 0 else '+'
+            size: float = abs(coefficient)
+            factor: str = '' if size == 1 else f'{number_text(size)} '
+            parts.append(f'{sign} {factor}{self.columns[column].name}')
+        return ' '.join(parts)
+
+    def write_lp(self, stream: TextIO) -> None:
+        """Write the model in CPLEX LP format.
+
+        Args:
+            stream (TextIO): The stream to write to.
+        """
+        stream.write(f'\\* {self.name} *\\\n')
+        self.write_lp_objective(stream)
+        self.write_lp_rows(stream)
+        generals, binaries = self.write_lp_bounds(stream)
+        if generals:
+            stream.write('Generals\n')
+            stream.write(''.join(f'{name}\n' for name in generals))
+        if binaries:
+            stream.write('Binaries\n')
+            stream.write(''.join(f'{name}\n' for name in binaries))
+        stream.write('End\n')
+
+    def write_lp_objective(self, stream: TextIO) -> None:
+        """Write the objective section of an LP file.
+
+        Args:
+            stream (TextIO): The stream to write to.
+        """
+        stream.write('Minimize\n')
+        if self.objective:
+            objective: list[int] = list(self.objective)
+            stream.write(f'OBJ: {self.terms(objective, [self.objective[column] for column in objective])}\n')
+        else:
+            stream.write('OBJ: __dummy\n')
+
+    def write_lp_rows(self, stream: TextIO) -> None:
+        """Write the constraints section of an LP file.
+
+        Args:
+            stream (TextIO): The stream to write to.
+        """
+        stream.write('Subject To\n')
+        for row, positions in enumerate(self.by_row()):
+            columns: list[int] = [self.entry_columns[position] for position in positions]
+            coefficients: list[float] = [self.entry_values[position] for position in positions]
+            expression: str = self.terms(columns, coefficients) or '0 __dummy'
+            sense: str = LP_SENSES[self.senses[row]]
+            stream.write(f'{self.row_names[row]}: {expression} {sense} {number_text(self.rhs[row])}\n')
+
+    def write_lp_bounds(self, stream: TextIO) -> tuple[list[str], list[str]]:
+        """Write the bounds section of an LP file.
+
+        Binary variables have no bounds written, as the Binaries section implies them.
+
+        Args:
+            stream (TextIO): The stream to write to.
+
+        Returns:
+            tuple[list[str], list[str]]: The names of the general integer and of the binary variables.
+        """
+        binaries: list[str] = []
+        generals: list[str] = []
+        stream.write('Bounds\n')
+        if not self.objective:
+            stream.write(' __dummy = 0\n')
+        for column in self.used():
+            variable: LpVariable = self.columns[column]
+            if variable.cat == LpInteger and variable.lowBound == 0 and variable.upBound == 1:
+                binaries.append(variable.name)
+                continue
+            if variable.cat == LpInteger:
+                generals.append(variable.name)
+            stream.write(self.lp_bound(variable))
+        return generals, binaries
+
+    @staticmethod
+    def lp_bound(variable: LpVariable) -> str:
+        """Format the bounds of a variable for an LP file.
+
+        Args:
+            variable (LpVariable): The variable.
+
+        Returns:
+            str: The bounds line, or an empty string for the default bounds of zero and above.
+        """
+        lower, upper = variable.lowBound, variable.upBound
+        if lower is not None and lower == upper:
+            return f' {variable.name} = {number_text(lower)}\n'
+        if lower is None and upper is None:
+            return f' {variable.name} free\n'
+        if upper is None:
+            return f' {variable.name} >= {number_text(lower)}\n' if lower != 0 else ''
+        start: str = '-inf' if lower is None else number_text(lower)
+        return f' {start} <= {variable.name} <= {number_text(upper)}\n'
+
+    def write_mps(self, stream: TextIO) -> None:
+        """Write the model in MPS format.
+
+        Args:
+            stream (TextIO): The stream to write to.
+        """
+        stream.write('*SENSE:Minimize\n')
+        stream.write(f'NAME          {self.name}\n')
+        stream.write('ROWS\n')
+        stream.write(' N  OBJ\n')
+        for row, name in enumerate(self.row_names):
+            stream.write(f' {MPS_SENSES[self.senses[row]]}  {name}\n')
+        self.write_mps_columns(stream)
+        stream.write('RHS\n')
+        for row, name in enumerate(self.row_names):
+            if self.rhs[row] != 0:
+                stream.write(f'    RHS  {name}  {number_text(self.rhs[row])}\n')
+        stream.write('BOUNDS\n')
+        for column in self.used():
+            stream.write(self.mps_bound(self.columns[column]))
+        stream.write('ENDATA\n')
+
+    def write_mps_columns(self, stream: TextIO) -> None:
+        """Write the columns section of an MPS file, with markers around the integer columns.
+
+        Args:
+            stream (TextIO): The stream to write to.
+        """
+        stream.write('COLUMNS\n')
+        entries: dict[int, list[int]] = self.by_column()
+        integer: bool = False
+        for column in self.used():
+            variable: LpVariable = self.columns[column]
+            if (variable.cat == LpInteger) != integer:
+                integer = not integer
+                marker: str = "'INTORG'" if integer else "'INTEND'"
+                stream.write(f"    MARKER                 'MARKER'                 {marker}\n")
+            if column in self.objective:
+                stream.write(f'    {variable.name}  OBJ  {number_text(self.objective[column])}\n')
+            for position in entries.get(column, []):
+                row_name: str = self.row_names[self.entry_rows[position]]
+                stream.write(f'    {variable.name}  {row_name}  {number_text(self.entry_values[position])}\n')
+        if integer:
+            stream.write("    MARKER                 'MARKER'                 'INTEND'\n")
+
+    @staticmethod
+    def mps_bound(variable: LpVariable) -> str:
+        """Format the bounds of a variable for an MPS file.
+
+        Args:
+            variable (LpVariable): The variable.
+
+        Returns:
+            str: The bounds lines, or an empty string for the default bounds of zero and above.
+        """
+        lower, upper = variable.lowBound, variable.upBound
+        if variable.cat == LpInteger and lower == 0 and upper == 1:
+            return f' BV BND  {variable.name}\n'
+        if lower is not None and lower == upper:
+            return f' FX BND  {variable.name}  {number_text(lower)}\n'
+        if lower is None and upper is None:
+            return f' FR BND  {variable.name}\n'
+        lines: str = ''
+        if lower is None:
+            lines += f' MI BND  {variable.name}\n'
+        elif lower != 0:
+            lines += f' LO BND  {variable.name}  {number_text(lower)}\n'
+        if upper is not None:
+            lines += f' UP BND  {variable.name}  {number_text(upper)}\n'
+        elif variable.cat == LpInteger:
+            lines += f' PL BND  {variable.name}\n'
+        return lines
+
+    def to_pulp(self) -> LpProblem:
+        """Build the equivalent PuLP problem, for solvers driven through PuLP.
+
+        Returns:
+            LpProblem: The problem.
+        """
+        problem: LpProblem = LpProblem(self.name, LpMinimize)
+        if self.objective:
+            problem += LpAffineExpression(
+                [(self.columns[column], value) for column, value in self.objective.items()],
+            ), 'Objective'
+        else:
+            problem += 0, 'DummyObjective'
+        for row, positions in enumerate(self.by_row()):
+            expression: LpAffineExpression = LpAffineExpression(
+                [(self.columns[self.entry_columns[position]], self.entry_values[position]) for position in positions],
+            )
+            problem.addConstraint(LpConstraint(expression, self.senses[row], self.row_names[row], self.rhs[row]))
+        return problem
+
+    def __repr__(self) -> str:
+        """Return a string representation of the model.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.name!r})'
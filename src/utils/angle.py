@@ -9,6 +9,8 @@ TOLERANCE = 1e-6  # Tolerance for comparing angles
 class Angle:
     """Represents an angle with properties to manage angle_degree and angle_radian."""
 
+    __slots__ = ('angle',)
+
     def __init__(self, angle: float) -> None:
         """Initialize an Angle instance.
 
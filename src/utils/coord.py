@@ -1,4 +1,5 @@
 """Coordinate."""
+from typing import ClassVar
 
 from src.utils.angle import Angle
 
@@ -12,21 +13,58 @@ class CoordError(Exception):
 class Coord:
     """Class to represent start coordinate on start Sudoku grid.
 
+    Coordinates are never changed once made, so whole number coordinates are shared: asking for the
+    same row and column again returns the same instance. The angle is only worked out when it is first
+    used.
+
     Args:
         row (float): The row number of the coordinate.
         column (float): The column number of the coordinate.
     """
 
-    def __init__(self, row: int, column: int) -> None:
-        """Initialize start Coord instance.
+    __slots__ = ('_angle', 'column', 'row')
+
+    coords: ClassVar[dict[tuple[int, int], 'Coord']] = {}
+
+    def __new__(cls, row: int, column: int) -> 'Coord':
+        """Create a new instance, or return the existing instance for whole number coordinates.
 
         Args:
             row (int): The row number of the coordinate.
             column (int): The column number of the coordinate.
+
+        Returns:
+            Coord: A new or existing instance of the Coord class.
+        """
+        shared: bool = type(row) is int and type(column) is int and cls is Coord
+        instance: Coord | None = cls.coords.get((row, column)) if shared else None
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.row = row
+            instance.column = column
+            instance._angle = None
+            if shared:
+                cls.coords[(row, column)] = instance
+        return instance
+
+    def __getnewargs__(self) -> tuple[int, int]:
+        """Return the arguments used to make the coordinate again when it is copied or unpickled.
+
+        Returns:
+            tuple[int, int]: The row and column.
+        """
+        return self.row, self.column
+
+    @property
+    def angle(self) -> Angle:
+        """Return the angle of the coordinate from the origin, working it out on first use.
+
+        Returns:
+            Angle: The angle.
         """
-        self.row: int = row
-        self.column: int = column
-        self.angle: Angle = Angle.create_from_x_y(self.column, self.row)
+        if self._angle is None:
+            self._angle = Angle.create_from_x_y(self.column, self.row)
+        return self._angle
 
     def __hash__(self) -> int:
         """Compute hash based on row and column attributes.
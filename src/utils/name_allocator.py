@@ -0,0 +1,52 @@
+"""NameAllocator."""
+from collections.abc import Iterator
+from itertools import count
+
+
+class NameAllocator:
+    """Hand out numbers and names that are unique within one owner, such as a board or a solver.
+
+    Each prefix has a counter of its own, starting at 0, so the names depend only on the order of the
+    requests made to this allocator, not on what else has been built in the process. Taking the next
+    number from a counter is atomic, so threads may share an allocator.
+
+    Attributes:
+        counters (dict[str, Iterator[int]]): The counter for each prefix.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the allocator with no counters."""
+        self.counters: dict[str, Iterator[int]] = {}
+
+    def number(self, prefix: str = '') -> int:
+        """Return the next number for a prefix.
+
+        Args:
+            prefix (str): The prefix.
+
+        Returns:
+            int: The number.
+        """
+        counter: Iterator[int] | None = self.counters.get(prefix)
+        if counter is None:
+            counter = self.counters.setdefault(prefix, count())
+        return next(counter)
+
+    def name(self, prefix: str) -> str:
+        """Return the next name for a prefix.
+
+        Args:
+            prefix (str): The prefix.
+
+        Returns:
+            str: The prefix followed by the next number for it.
+        """
+        return f'{prefix}_{self.number(prefix)}'
+
+    def __repr__(self) -> str:
+        """Return a string representation of the allocator.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}()'
@@ -11,6 +11,8 @@ config = Config()
 class Point:
     """Represent points on start canvas or start 2D vector."""
 
+    __slots__ = ('x_coord', 'y_coord')
+
     def __init__(self, x_coord: float, y_coord: float):
         """Construct start point.
 
@@ -9,6 +9,8 @@ class RuleError(Exception):
 class Rule:
     """Rule class. Manage the human-readable rules for start Sudoku."""
 
+    __slots__ = ('name', 'rank', 'text')
+
     def __init__(self, name: str, rank: int, text: str | None = None):
         """Construct start rule.
 
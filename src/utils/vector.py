@@ -9,6 +9,8 @@ class VectorError(Exception):
 class Vector:
     """Represents start vector defined by a start and end coordinate."""
 
+    __slots__ = ('end', 'start')
+
     def __init__(self, start: Coord, end: Coord) -> None:
         """Construct start vector from start and end coordinates.
 
@@ -0,0 +1,60 @@
+"""Violation."""
+
+
+class Violation:
+    """A broken constraint, found by checking a grid of digits against an item.
+
+    Attributes:
+        name (str): The name of the item whose constraint is broken.
+        text (str): What is wrong.
+        cells (list[tuple[int, int]]): The row and column of each cell involved.
+    """
+
+    def __init__(self, name: str, text: str, cells: list[tuple[int, int]]) -> None:
+        """Construct a violation.
+
+        Args:
+            name (str): The name of the item whose constraint is broken.
+            text (str): What is wrong.
+            cells (list[tuple[int, int]]): The row and column of each cell involved.
+        """
+        self.name: str = name
+        self.text: str = text
+        self.cells: list[tuple[int, int]] = cells
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two violations.
+
+        Args:
+            other (object): The other violation.
+
+        Returns:
+            bool: True if the name, text and cells are the same.
+        """
+        if isinstance(other, Violation):
+            return (self.name, self.text, self.cells) == (other.name, other.text, other.cells)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the violation.
+
+        Returns:
+            int: The hash of the name, text and cells.
+        """
+        return hash((self.name, self.text, tuple(self.cells)))
+
+    def __str__(self) -> str:
+        """Return a readable description of the violation.
+
+        Returns:
+            str: The name and the text.
+        """
+        return f'{self.name}: {self.text}'
+
+    def __repr__(self) -> str:
+        """Return a string representation of the violation.
+
+        Returns:
+            str: String representation of the object.
+        """
+        return f'{self.__class__.__name__}({self.name!r}, {self.text!r}, {self.cells!r})'
@@ -8,6 +8,7 @@ from src.board.board import Board
 from src.board.digits import Digits
 from src.utils.coord import Coord
 from src.utils.cyclic import Cyclic
+from src.utils.moves import Moves
 from src.utils.side import Side
 from src.utils.tags import Tags
 
@@ -122,6 +123,11 @@ class TestBoard(unittest.TestCase):
         self.assertFalse(self.board4x4.is_valid_coordinate(Coord(9, 1)))
         self.assertFalse(self.board4x4.is_valid_coordinate(Coord(1, 9)))
 
+    def test_neighbours(self):
+        """Test the cells reached from a cell by a set of moves."""
+        self.assertEqual((Coord(9, 8), Coord(8, 9)), self.board9x9.neighbours(Moves.orthogonals, 9, 9))
+        self.assertEqual(8, len(self.board9x9.neighbours(Moves.knights, 5, 5)))
+
     def test_is_valid_side_index(self):
         """Test the is_valid_side_index method with various coordinates."""
         # Valid cases
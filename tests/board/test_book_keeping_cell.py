@@ -155,6 +155,30 @@ class TestBookKeepingCell(unittest.TestCase):
         book.set_range(500, 600)
         self.assertEqual(len(book), 101)
 
+    def test_bits(self):
+        """Test the bitmask representation of BookKeepingCell."""
+        book = BookKeepingCell(9)
+        self.assertEqual(0b111111111, book.bits)
+        book.set_possible([1, 3, 9])
+        self.assertEqual(0b100000101, book.bits)
+        self.assertEqual([1, 3, 9], book.digits())
+        self.assertEqual([True, False, True, False, False, False, False, False, True], book.possibles)
+        self.assertEqual(BookKeepingCell(9, 0b100000101), book)
+
+    def test_mask(self):
+        """Test that masks ignore digits outside the digit range."""
+        book = BookKeepingCell(4)
+        self.assertEqual(0b1010, book.mask([0, 2, 4, 5]))
+        book.set_impossible([0, 2, 5])
+        self.assertEqual([1, 3, 4], book.digits())
+
+    def test_mismatch(self):
+        """Test combining BookKeepingCell objects with different maximum digits."""
+        with self.assertRaises(SudokuError):
+            _ = BookKeepingCell(9) & BookKeepingCell(4)
+        with self.assertRaises(SudokuError):
+            _ = BookKeepingCell(9) | 1
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,68 @@
+"""TestCandidates."""
+import unittest
+
+from src.board.board import Board
+from src.board.candidates import Candidates
+from src.board.digits import Digits
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestCandidates(unittest.TestCase):
+    """Test suite for the Candidates class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 board."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.candidates = self.board.candidates
+
+    def test_initial(self):
+        """Test that every digit starts possible in every cell."""
+        self.assertIsInstance(self.candidates, Candidates)
+        self.assertEqual(16, len(list(self.candidates)))
+        self.assertEqual(64, len(self.candidates))
+        self.assertEqual([], self.candidates.fixed())
+
+    def test_getitem(self):
+        """Test that cells share the board's bookkeeping."""
+        self.candidates[2, 3].set_possible([4])
+        self.assertEqual([4], self.board.candidates[2, 3].digits())
+        self.assertEqual([(2, 3)], self.candidates.fixed())
+
+    def test_reductions(self):
+        """Test row, column, union and intersection reductions."""
+        for column in self.board.column_range:
+            self.candidates[1, column].set_possible([1, 2])
+        self.candidates[2, 1].set_possible([2, 3])
+        self.assertEqual(0b0011, self.candidates.row(1))
+        self.assertEqual(0b1111, self.candidates.row(2))
+        self.assertEqual(0b1111, self.candidates.column(1))
+        self.assertEqual(0b0111, self.candidates.union([(1, 1), (2, 1)]))
+        self.assertEqual(0b0010, self.candidates.intersection([(1, 1), (2, 1)]))
+
+    def test_box(self):
+        """Test the box reduction, for each box of the board."""
+        for row, column in ((1, 1), (1, 2), (2, 1), (2, 2)):
+            self.candidates[row, column].set_possible([1, 3])
+        self.candidates[3, 4].set_possible([4])
+        self.assertEqual(0b0101, self.candidates.box(1, Coord(2, 2)))
+        self.assertEqual(0b1111, self.candidates.box(2, Coord(2, 2)))
+        self.assertEqual(0b1111, self.candidates.box(4, Coord(2, 2)))
+        self.candidates[4, 3].set_possible([4])
+        self.candidates[4, 4].set_possible([4])
+        self.candidates[3, 3].set_possible([4])
+        self.assertEqual(0b1000, self.candidates.box(4, Coord(2, 2)))
+
+    def test_reset(self):
+        """Test resetting the candidates."""
+        self.candidates[1, 1].set_possible([1])
+        self.candidates.reset()
+        self.assertEqual(64, len(self.candidates))
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual('Candidates(4, 4, 4)', repr(self.candidates))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
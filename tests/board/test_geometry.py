@@ -0,0 +1,73 @@
+"""TestGeometry."""
+import unittest
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.board.geometry import Geometry
+from src.utils.coord import Coord
+from src.utils.cyclic import Cyclic
+from src.utils.moves import Moves
+from src.utils.side import Side
+from src.utils.tags import Tags
+
+
+class TestGeometry(unittest.TestCase):
+    """Test suite for the Geometry class."""
+
+    def setUp(self) -> None:
+        """Set up the geometry of a 9x9 board."""
+        self.geometry = Geometry.shared(Coord(9, 9))
+
+    def test_shared(self):
+        """Test that boards of the same size share one geometry, and its tables."""
+        first = Board(Coord(9, 9), Digits(1, 9), Tags())
+        second = Board(Coord(9, 9), Digits(1, 9), Tags({'Title': 'Other'}))
+        self.assertIs(self.geometry, first.geometry)
+        self.assertIs(first.side_cyclic_map, second.side_cyclic_map)
+        self.assertIsNot(self.geometry, Board(Coord(6, 6), Digits(1, 6), Tags()).geometry)
+
+    def test_tables(self):
+        """Test the ranges, cells and side tables."""
+        self.assertEqual(list(range(1, 10)), self.geometry.row_range)
+        self.assertEqual(81, len(self.geometry.cells))
+        self.assertEqual(Coord(2, 4), self.geometry.cells[self.geometry.index(2, 4)])
+        self.assertEqual(Coord(10, 5), self.geometry.side_coordinates[(Side.bottom, 5)])
+        self.assertEqual(Coord(1, 4), self.geometry.side_cyclic_map[(Side.top, Cyclic.clockwise, 3)])
+
+    def test_boxes(self):
+        """Test the box of each cell, for square and rectangular boxes."""
+        boxes = self.geometry.boxes(Coord(3, 3))
+        self.assertEqual(1, boxes[self.geometry.index(1, 1)])
+        self.assertEqual(5, boxes[self.geometry.index(5, 5)])
+        self.assertEqual(9, boxes[self.geometry.index(9, 9)])
+        self.assertIs(boxes, self.geometry.boxes(Coord(3, 3)))
+        six = Geometry.shared(Coord(6, 6))
+        self.assertEqual(6, six.boxes(Coord(2, 3))[six.index(6, 6)])
+        self.assertEqual(2, six.boxes(Coord(2, 3))[six.index(1, 4)])
+
+    def test_box_cells(self):
+        """Test the cells in each box, and that the table agrees with the box of each cell."""
+        cells = self.geometry.box_cells(Coord(3, 3))
+        self.assertEqual(9, len(cells))
+        self.assertEqual((0, 1, 2, 9, 10, 11, 18, 19, 20), cells[0])
+        boxes = self.geometry.boxes(Coord(3, 3))
+        for box, indices in enumerate(cells, start=1):
+            self.assertTrue(all(boxes[index] == box for index in indices))
+        self.assertIs(cells, self.geometry.box_cells(Coord(3, 3)))
+
+    def test_neighbours(self):
+        """Test that moves off the board are dropped, and the order of the moves is kept."""
+        orthogonals = self.geometry.neighbours(Moves.orthogonals)
+        self.assertEqual((Coord(1, 2), Coord(2, 1)), orthogonals[self.geometry.index(1, 1)])
+        self.assertEqual(4, len(orthogonals[self.geometry.index(5, 5)]))
+        self.assertEqual(8, len(self.geometry.neighbours(Moves.kings)[self.geometry.index(5, 5)]))
+        self.assertEqual(2, len(self.geometry.neighbours(Moves.knights)[self.geometry.index(1, 1)]))
+        self.assertIs(orthogonals, self.geometry.neighbours(Moves.orthogonals))
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual('Geometry(Coord(9, 9))', repr(self.geometry))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,27 @@
+"""TestBookkeepingCommand."""
+import unittest
+
+from src.commands.bookkeeping_command import BookkeepingCommand
+from tests.commands.test_simple_command import TestSimpleCommand
+
+
+class TestBookkeepingCommand(TestSimpleCommand):
+    """Test suite for the BookkeepingCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = BookkeepingCommand()
+        self.representation = "BookkeepingCommand()"
+
+    def test_work(self):
+        """Test that bookkeeping eliminates candidates from the problem's cells."""
+        self.command.execute(self.problem)
+        self.assertIsNotNone(self.problem.propagator)
+        self.assertGreater(self.problem.propagator.passes, 0)
+        self.assertGreater(self.problem.propagator.eliminations, 0)
+        self.assertFalse(self.problem.propagator.contradiction())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,46 @@
+"""TestCheckSolutionCommand."""
+import unittest
+
+from src.commands.check_solution_command import CheckSolutionCommand
+from src.items.solution import Solution
+from src.solvers.answer import Answer
+from tests.commands.test_simple_command import TestSimpleCommand
+
+
+class TestCheckSolutionCommand(TestSimpleCommand):
+    """Test suite for the CheckSolutionCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = CheckSolutionCommand()
+        self.representation = 'CheckSolutionCommand()'
+
+    def test_work(self):
+        """Test that the solution of a problem breaks none of its constraints."""
+        self.command.execute(self.problem)
+        self.assertEqual([], self.problem.violations)
+
+    def test_broken(self):
+        """Test that swapping two digits in the first row breaks two columns, each twice."""
+        self.command.execute(self.problem)
+        rows: list[str] = list(CheckSolutionCommand.solution(self.problem))  # type: ignore
+        rows[0] = rows[0][1] + rows[0][0] + rows[0][2:]
+        violations = self.problem.constraints.check(Answer(self.problem.board, rows))  # type: ignore
+        self.assertEqual(4, sum(violation.name.startswith('Column') for violation in violations))
+        self.assertFalse(any(violation.name.startswith('Row') for violation in violations))
+
+    def test_no_solution(self):
+        """Test that a problem without a solution has nothing to check."""
+        self.command.execute(self.problem)
+        self.problem.config.pop('Solution', None)  # type: ignore
+        self.problem.constraints.components = [  # type: ignore
+            item for item in self.problem.constraints.components if not isinstance(item, Solution)  # type: ignore
+        ]
+        self.assertIsNone(CheckSolutionCommand.solution(self.problem))
+        self.problem.violations = None
+        self.command.work(self.problem)
+        self.assertIsNone(self.problem.violations)
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
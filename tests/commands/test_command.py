@@ -3,6 +3,11 @@ import unittest
 from pathlib import Path
 
 from src.commands.command import Command
+from src.commands.create_board_command import CreateBoardCommand
+from src.commands.create_config_command import CreateConfigCommand
+from src.commands.create_constraints_command import CreateConstraintsCommand
+from src.commands.create_solver_command import CreateSolverCommand
+from src.commands.load_config_file_command import LoadConfigFileCommand
 from src.commands.problem import Problem
 from src.utils.load_modules import load_modules
 
@@ -68,5 +73,43 @@ class TestCommand(unittest.TestCase):
             self.assertIsNotNone(self.command.target)
 
 
+class TestCommandSchedule(unittest.TestCase):
+    """Test suite for the precondition scheduling of the Command class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        load_modules('src.items')
+        self.problem = Problem(Path('problems/easy/problem001.yaml'), Path('output/tests/'))
+
+    def test_precondition_graph(self):
+        """Test that the precondition graph is resolved and cached per class."""
+        graph = CreateBoardCommand.precondition_graph()
+        self.assertEqual((CreateConfigCommand,), graph[CreateBoardCommand])
+        self.assertEqual((LoadConfigFileCommand,), graph[CreateConfigCommand])
+        self.assertEqual((), graph[LoadConfigFileCommand])
+        self.assertIs(graph, CreateBoardCommand.precondition_graph())
+
+    def test_schedule(self):
+        """Test that shared ancestors are scheduled once, in topological order."""
+        schedule = CreateConstraintsCommand().schedule()
+        self.assertEqual([LoadConfigFileCommand, CreateConfigCommand, CreateBoardCommand], schedule)
+
+    def test_execute_once(self):
+        """Test that preconditions already run against a problem are not run again."""
+        CreateConstraintsCommand().execute(self.problem)
+        board = self.problem.board
+        CreateSolverCommand().execute(self.problem)
+        self.assertIs(board, self.problem.board)
+        self.assertIs(board, self.problem.solver.board)
+        self.assertIn('CreateBoardCommand', self.problem.executed)
+
+    def test_is_done(self):
+        """Test that a command whose target is already filled is done."""
+        command = CreateConfigCommand()
+        self.assertFalse(command.is_done(self.problem))
+        self.problem.config = {}
+        self.assertTrue(command.is_done(self.problem))
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
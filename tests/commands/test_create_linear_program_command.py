@@ -1,5 +1,6 @@
 """TestCreateLinearProgramCommand."""
 import unittest
+from pathlib import Path
 
 from src.commands.create_linear_program_command import CreateLinearProgramCommand
 from tests.commands.test_simple_command import TestSimpleCommand
@@ -14,6 +15,15 @@ class TestCreateLinearProgramCommand(TestSimpleCommand):
         self.command = CreateLinearProgramCommand()
         self.representation = 'CreateLinearProgramCommand()'
 
+    def test_work(self):
+        """Test that the LP text is produced in memory, without writing constraints.lp."""
+        existed: bool = Path('constraints.lp').exists()
+        self.command.execute(self.problem)
+        self.assertTrue(self.problem.linear_program.startswith('\\* Problem *\\\n'))
+        self.assertIn('Subject To\n', self.problem.linear_program)
+        self.assertTrue(self.problem.linear_program.endswith('End\n'))
+        self.assertEqual(existed, Path('constraints.lp').exists())
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1 +1,89 @@
 """TestExtractAnswerCommand."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.commands.extract_answer_command import ExtractAnswerCommand
+from src.commands.problem import Problem
+from src.commands.solve_command import SolveCommand
+from src.commands.verify_unique_command import VerifyUniqueCommand
+from src.solvers.solve_cache import SolveCache
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from tests.commands.test_simple_command import TestSimpleCommand
+
+
+class TestExtractAnswerCommand(TestSimpleCommand):
+    """Test suite for the ExtractAnswerCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = ExtractAnswerCommand()
+        self.representation = 'ExtractAnswerCommand()'
+
+    def test_work(self):
+        """Test that the answer is extracted from the solver."""
+        self.command.execute(self.problem)
+        self.assertEqual(SolverStatus.optimal, self.problem.status)
+        self.assertEqual(self.problem.solver.answer.digits, self.problem.answer.digits)
+
+    def test_cache(self):
+        """Test that a puzzle solved before is answered from the cache, without a solver."""
+        with tempfile.TemporaryDirectory() as directory, SolveCache(Path(directory) / 'cache.db') as cache:
+            ExtractAnswerCommand(cache).execute(self.problem)
+            self.assertEqual((0, 1, 1), (cache.hits, cache.misses, len(cache)))
+            problem: Problem = Problem(Path('problems/easy/problem001.yaml'), Path('output/tests/'))
+            ExtractAnswerCommand(cache).execute(problem)
+            self.assertEqual(1, cache.hits)
+            self.assertIsNone(problem.solver)
+            self.assertEqual(SolverStatus.optimal, problem.cached_status)
+            self.assertIsNone(problem.status)
+            self.assertEqual(self.problem.answer.digits, problem.answer.digits)
+
+    def test_cache_then_solve(self):
+        """Test that commands needing a solve still solve after a puzzle is answered from the cache."""
+        with tempfile.TemporaryDirectory() as directory, SolveCache(Path(directory) / 'cache.db') as cache:
+            ExtractAnswerCommand(cache).execute(self.problem)
+            problem: Problem = Problem(Path('problems/easy/problem001.yaml'), Path('output/tests/'))
+            ExtractAnswerCommand(cache).execute(problem)
+            self.assertEqual(1, cache.hits)
+            VerifyUniqueCommand().execute(problem)
+            self.assertEqual(SolverStatus.optimal, problem.status)
+            self.assertGreater(len(problem.solutions), 0)  # type: ignore
+            self.assertEqual(problem.answer.digits, problem.solutions[0].digits)  # type: ignore
+
+    def test_invalid_answer(self):
+        """Test that an answer that breaks a constraint is not stored in the cache."""
+        SolveCommand().execute(self.problem)
+        solver: Solver = self.problem.solver  # type: ignore
+        solver.answer[1, 2], solver.answer[1, 3] = solver.answer[1, 3], solver.answer[1, 2]
+        with tempfile.TemporaryDirectory() as directory, SolveCache(Path(directory) / 'cache.db') as cache:
+            with self.assertLogs(level='WARNING'):
+                ExtractAnswerCommand(cache).execute(self.problem)
+            self.assertEqual(0, len(cache))
+            self.assertEqual(solver.answer.digits, self.problem.answer.digits)
+
+    def test_symmetric_cache(self):
+        """Test that a rotated and relabelled puzzle is answered from the cache, in its own orientation."""
+        with tempfile.TemporaryDirectory() as directory, SolveCache(Path(directory) / 'cache.db') as cache:
+            ExtractAnswerCommand(cache).execute(self.problem)
+            text: str = Path('problems/easy/problem001.yaml').read_text(encoding='utf-8')
+            lines: list[str] = text.split('Known:')[1].split('Solution:')[0].split()[1::2]
+            rotated: list[str] = [''.join(line[column] for line in reversed(lines)) for column in range(9)]
+            relabelled: list[str] = [line.translate(str.maketrans('123456789', '987654321')) for line in rotated]
+            known: str = ''.join(f'      - {line}\n' for line in relabelled)
+            path: Path = Path(directory) / 'rotated.yaml'
+            path.write_text(text.split('Known:')[0] + f'Known:\n{known}', encoding='utf-8')
+            problem: Problem = Problem(path, Path('output/tests/'))
+            ExtractAnswerCommand(cache).execute(problem)
+            self.assertEqual(1, cache.hits)
+            self.assertIsNone(problem.solver)
+            digits: list[list[int]] = self.problem.answer.digits
+            for row in range(9):
+                for column in range(9):
+                    self.assertEqual(10 - digits[8 - column][row], problem.answer.digits[row][column])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,52 @@
+"""TestParallelComposedCommand."""
+import unittest
+
+from src.commands.create_board_command import CreateBoardCommand
+from src.commands.create_meta_command import CreateMetaCommand
+from src.commands.create_rules_command import CreateRulesCommand
+from src.commands.create_solver_command import CreateSolverCommand
+from src.commands.null_command import NullCommand
+from src.commands.parallel_composed_command import ParallelComposedCommand
+from tests.commands.test_command import TestCommand
+
+
+class TestParallelComposedCommand(TestCommand):
+    """Test suite for the ParallelComposedCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = ParallelComposedCommand([NullCommand(), NullCommand()]) | NullCommand()
+        self.representation = "ParallelComposedCommand([NullCommand(), NullCommand(), NullCommand()])"
+
+    def test_target(self):
+        """Test that a composed command has no target."""
+        self.assertIsNone(self.command.target)
+
+    def test_or(self):
+        """Test that combining keeps the parallel class."""
+        self.assertIsInstance(self.command, ParallelComposedCommand)
+        self.assertEqual(3, len(self.command))
+
+    def test_graph(self):
+        """Test that shared preconditions appear once in the combined graph."""
+        command = ParallelComposedCommand([CreateRulesCommand(), CreateSolverCommand(), CreateBoardCommand()])
+        graph, supplied = command.graph()
+        self.assertIn(CreateBoardCommand, supplied)
+        self.assertEqual(1, list(graph).count(CreateBoardCommand))
+
+    def test_independent_branches(self):
+        """Test that independent branches all complete against a shared board."""
+        command = ParallelComposedCommand(
+            [CreateRulesCommand(), CreateSolverCommand(), CreateMetaCommand()],
+            max_workers=3,
+        )
+        command.execute(self.problem)
+        self.assertIsNotNone(self.problem.rules)
+        self.assertIsNotNone(self.problem.meta)
+        self.assertIs(self.problem.board, self.problem.solver.board)
+        self.assertIs(self.problem.board, self.problem.constraints.board)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,27 @@
+"""TestPresolveCommand."""
+import unittest
+
+from src.commands.presolve_command import PresolveCommand
+from tests.commands.test_simple_command import TestSimpleCommand
+
+
+class TestPresolveCommand(TestSimpleCommand):
+    """Test suite for the PresolveCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = PresolveCommand()
+        self.representation = "PresolveCommand()"
+
+    def test_work(self):
+        """Test that the presolve shrinks the problem's model."""
+        self.command.execute(self.problem)
+        self.assertIsNotNone(self.problem.presolve)
+        self.assertIs(self.problem.solver.model, self.problem.model)
+        self.assertLess(len(self.problem.model.constraints), self.problem.presolve.rows)
+        self.assertLess(len(self.problem.model.variables()), self.problem.presolve.columns)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
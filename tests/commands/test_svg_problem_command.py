@@ -1,9 +1,15 @@
 """TestSVGProblemCommand."""
+import tracemalloc
 import unittest
+from pathlib import Path
 
+from src.commands.problem import Problem
 from src.commands.svg_problem_command import SVGProblemCommand
 from tests.commands.test_svg_command import TestSVGCommand
 
+# Peak traced memory, in bytes, allowed for building and rendering one of the easy problems. About 2 MiB is used.
+PEAK_LIMIT: int = 4 * 1024 * 1024
+
 
 class TestSVGProblemCommand(TestSVGCommand):
     """Test suite for SVGProblemCommand class."""
@@ -14,6 +20,20 @@ class TestSVGProblemCommand(TestSVGCommand):
         self.command = SVGProblemCommand()
         self.representation = 'SVGProblemCommand()'
 
+    def test_memory(self):
+        """Test that building and rendering each easy problem stays under the peak memory limit."""
+        for path in sorted(Path('problems/easy').glob('*.yaml')):
+            with self.subTest(path.name):
+                problem: Problem = Problem(path, Path('output/tests/'))
+                tracemalloc.start()
+                try:
+                    SVGProblemCommand().execute(problem)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                self.assertIsNotNone(problem.svg_problem)
+                self.assertLess(peak, PEAK_LIMIT)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
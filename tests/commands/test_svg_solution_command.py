@@ -1,10 +1,13 @@
 """TestSVGSolutionCommand."""
 import unittest
 
+from src.board.board import Board
+from src.board.digits import Digits
 from src.commands.svg_solution_command import SVGSolutionCommand
 from src.items.battenburg import Battenburg
 from src.items.solution import Solution
 from src.utils.coord import Coord
+from src.utils.tags import Tags
 from tests.commands.test_svg_command import TestSVGCommand
 
 
@@ -28,7 +31,7 @@ class TestSVGSolutionCommand(TestSVGCommand):
             Item: An constraint to be selected, or `None`.
         """
         return Solution(
-            self.problem.board,
+            Board(Coord(9, 9), Digits(1, 9), Tags({})),
             [
                 '123456789',
                 '123456789',
@@ -0,0 +1,119 @@
+"""TestVerifyUniqueCommand."""
+import unittest
+from pathlib import Path
+
+from pulp import LpConstraintLE
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.commands.create_constraints_command import CreateConstraintsCommand
+from src.commands.problem import Problem
+from src.commands.verify_unique_command import VerifyUniqueCommand
+from src.items.fortress_greater_than_cell import FortressGreaterThanCell
+from src.items.odd_cell import OddCell
+from src.solvers.answer import Answer
+from src.solvers.dlx_backend import DLXBackend
+from src.solvers.pulp_backend import PulpBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+from tests.commands.test_simple_command import TestSimpleCommand
+
+LATIN: tuple[str, ...] = ('1234', '3412', '2143', '4321')
+
+
+class TestVerifyUniqueCommand(TestSimpleCommand):
+    """Test suite for the VerifyUniqueCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = VerifyUniqueCommand()
+        self.representation = 'VerifyUniqueCommand()'
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+
+    def create_solver(self, givens: int) -> Solver:
+        """Create and solve a model of a 4x4 Latin square with the first cells of LATIN given.
+
+        Args:
+            givens (int): The number of cells given, in reading order.
+
+        Returns:
+            Solver: The solved solver.
+        """
+        solver: Solver = Solver(self.board, 'Test', backends=[DLXBackend(), PulpBackend()])
+        choices = solver.variables.choices
+        for row in self.board.row_range:
+            for column in self.board.column_range:
+                solver.add_cell_constraint(row, column)
+        for digit in range(1, 5):
+            for line in range(1, 5):
+                row_choices: list[tuple[int, int, int]] = [(digit, line, column) for column in range(1, 5)]
+                solver.add_choice_constraint(f'Row_{line}_{digit}', row_choices, LpConstraintLE, 1)
+                column_choices: list[tuple[int, int, int]] = [(digit, row, line) for row in range(1, 5)]
+                solver.add_choice_constraint(f'Column_{line}_{digit}', column_choices, LpConstraintLE, 1)
+        for index in range(givens):
+            row, column = divmod(index, 4)
+            choices[int(LATIN[row][column])][row + 1][column + 1].lowBound = 1  # type: ignore
+        solver.solve()
+        return solver
+
+    def test_limit(self):
+        """Test that the configured limit is used by default."""
+        self.assertEqual(2, VerifyUniqueCommand().limit)
+        self.assertEqual(5, VerifyUniqueCommand(5).limit)
+
+    def test_work(self):
+        """Test counting the answers of a puzzle made of regions and givens."""
+        self.command.execute(self.problem)
+        self.assertIsNotNone(self.problem.solutions)
+        self.assertLessEqual(len(self.problem.solutions), 2)
+        self.assertEqual(len(self.problem.solve_times), 1)
+
+    def test_many(self):
+        """Test that re-solving with no-good cuts stops at the limit with distinct answers."""
+        solver: Solver = self.create_solver(1)
+        first: list[list[int]] = [list(row) for row in solver.answer.digits]
+        self.problem.solver = solver
+        VerifyUniqueCommand(3).work(self.problem)
+        answers: list[Answer] = self.problem.solutions  # type: ignore
+        self.assertEqual(3, len(answers))
+        self.assertEqual(3, len({str(answer.digits) for answer in answers}))
+        self.assertTrue(all(answer[1, 1] == 1 for answer in answers))
+        self.assertEqual(2, len(self.problem.solve_times))  # type: ignore
+        self.assertEqual(first, solver.answer.digits)
+        self.assertEqual(SolverStatus.optimal, solver.status)
+        self.assertIn('NoGood_2', solver.model.constraints)  # type: ignore
+
+    def test_items(self):
+        """Test that the answers found with cuts on a puzzle with other items are distinct and valid."""
+        problem: Problem = Problem(Path('problems/easy/problem001.yaml'), Path('output/tests/'))
+        CreateConstraintsCommand().execute(problem)
+        board: Board = problem.board  # type: ignore
+        problem.constraints.add_components([OddCell(board, 1, 2), FortressGreaterThanCell(board, 3, 5)])  # type: ignore
+        VerifyUniqueCommand(3).execute(problem)
+        answers: list[Answer] = problem.solutions  # type: ignore
+        self.assertEqual(len(answers), len({str(answer.digits) for answer in answers}))
+        for answer in answers:
+            self.assertEqual([], problem.constraints.check(answer))  # type: ignore
+        self.assertIn('NoGood_1', problem.solver.model.constraints)  # type: ignore
+
+    def test_unique(self):
+        """Test that a puzzle with one answer stops when the re-solve is infeasible."""
+        solver: Solver = self.create_solver(12)
+        self.problem.solver = solver
+        VerifyUniqueCommand(3).work(self.problem)
+        self.assertEqual([Answer(self.board, list(LATIN)).digits], [answer.digits for answer in self.problem.solutions])
+        self.assertEqual(1, len(self.problem.solve_times))  # type: ignore
+
+    def test_no_answer(self):
+        """Test that a solver without an answer has no answers to count."""
+        self.problem.solver = Solver(self.board, 'Test')
+        self.command.work(self.problem)
+        self.assertEqual([], self.problem.solutions)
+        self.assertEqual([], self.problem.solve_times)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,64 @@
+"""TestWarmStartCommand."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.commands.problem import Problem
+from src.commands.solve_command import SolveCommand
+from src.commands.warm_start_command import WarmStartCommand
+from src.solvers.answer import Answer
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from tests.commands.test_simple_command import TestSimpleCommand
+
+
+class TestWarmStartCommand(TestSimpleCommand):
+    """Test suite for the WarmStartCommand class."""
+
+    def setUp(self) -> None:
+        """Set up the test environment."""
+        super().setUp()
+        self.command = WarmStartCommand()
+        self.representation = 'WarmStartCommand()'
+
+    def test_work(self):
+        """Test that the model is solved from the solution, and the first answer is kept."""
+        self.command.execute(self.problem)
+        solver = self.problem.solver
+        self.assertIsNotNone(self.problem.nodes_saved)
+        self.assertTrue(solver.start_accepted)
+        self.assertIsNone(solver.start)
+        self.assertEqual(SolverStatus.optimal, solver.status)
+
+    def test_start(self):
+        """Test that the solution is preferred to the answer already found."""
+        self.command.execute(self.problem)
+        start = WarmStartCommand.start(self.problem, self.problem.solver)
+        self.assertEqual(str(self.problem.config['Solution'][0]), ''.join(str(digit) for digit in start.digits[0]))
+
+
+    def test_start_from_answer(self):
+        """Test that without a solution the start is the answer already found, which passes every check."""
+        text: str = Path('problems/easy/problem001.yaml').read_text(encoding='utf-8')
+        with tempfile.TemporaryDirectory() as directory:
+            path: Path = Path(directory) / 'unsolved.yaml'
+            path.write_text(text.split('Solution:')[0], encoding='utf-8')
+            problem: Problem = Problem(path, Path('output/tests/'))
+            self.command.execute(problem)
+        start: Answer | None = WarmStartCommand.start(problem, problem.solver)  # type: ignore
+        self.assertIsNotNone(start)
+        self.assertEqual([], problem.constraints.check(start))  # type: ignore
+        self.assertEqual(problem.solver.answer.digits, start.digits)  # type: ignore
+        self.assertTrue(problem.solver.start_accepted)  # type: ignore
+
+    def test_invalid_answer(self):
+        """Test that an answer that breaks a constraint is not used as the start."""
+        SolveCommand().execute(self.problem)
+        solver: Solver = self.problem.solver  # type: ignore
+        solver.answer[1, 2], solver.answer[1, 3] = solver.answer[1, 3], solver.answer[1, 2]
+        self.problem.config.pop('Solution')
+        self.assertIsNone(WarmStartCommand.start(self.problem, solver))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -135,6 +135,10 @@ class TestGlyph(unittest.TestCase):
         """
         self.assertFalse(self.glyph < self.glyph)
 
+    def test_slots(self) -> None:
+        """Test that the glyph keeps its attributes in slots, without a per-instance dictionary."""
+        self.assertFalse(hasattr(self.glyph, '__dict__'))
+
     def test_repr(self):
         """Test the string representation of the Glyph instance.
 
@@ -3,7 +3,9 @@ import unittest
 
 from src.items.battenburg import Battenburg
 from src.items.item import Item
+from src.solvers.answer import Answer
 from src.utils.coord import Coord
+from tests.items.test_item import GRID
 from tests.items.test_item import TestItem
 
 
@@ -63,6 +65,14 @@ class TestBattenburg(TestItem):
         """
         return {Item, Battenburg}
 
+    def test_check(self):
+        """Test that the square reports parities that do not alternate."""
+        self.assertEqual([], self.item.check(Answer(self.board, GRID)))
+        corner: Battenburg = Battenburg(self.board, Coord(1, 1))
+        violations = corner.check(Answer(self.board, ['213456789'] + GRID[1:]))
+        self.assertEqual([(1, 1), (1, 2), (2, 1), (2, 2)], sorted(violations[0].cells))
+        self.assertEqual([], Battenburg(self.board, Coord(9, 9)).check(Answer(self.board, GRID)))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
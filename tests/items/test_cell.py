@@ -6,6 +6,7 @@ from src.board.board import Board
 from src.board.digits import Digits
 from src.items.cell import Cell, CellError
 from src.items.item import Item
+from src.solvers.solver import Solver
 from src.utils.coord import Coord
 from src.utils.tags import Tags
 from tests.items.test_item import TestItem
@@ -15,9 +16,8 @@ class TestCell(TestItem):
     """Test case for Cell class."""
 
     def setUp(self) -> None:
-        """Set up the test case by clearing cache and initializing start_location Board and Cell constraint."""
+        """Set up the test case by initializing start_location Board and Cell constraint."""
         super().setUp()
-        Cell.clear()
         self.item = Cell.make(self.board, 1, 2)
 
     @property
@@ -78,10 +78,35 @@ class TestCell(TestItem):
         bad = Cell.make(Board(Coord(9, 9), Digits(1, 9), Tags({})), -1, -1)
         self.assertFalse(bad.valid)
 
+    def test_arena(self):
+        """Test that each board has its own cells, found by row and column."""
+        self.assertIs(self.item, Cell.make(self.board, 1, 2))
+        self.assertIs(self.item, self.board.cells[1])
+        self.assertEqual(81, len(Cell.cells(self.board)))
+        small: Board = Board(Coord(6, 6), Digits(1, 6), Tags({}))
+        other: Cell = Cell.make(small, 1, 2)
+        self.assertIsNot(self.item, other)
+        self.assertIs(small, other.board)
+        self.assertEqual(36, len(small.cells))
+        Cell.clear(small)
+        self.assertIsNot(other, Cell.make(small, 1, 2))
+
     def test_letter(self):
         """Test the letter representation of the Cell."""
         self.assertEqual(".", self.item.letter())
 
+    def test_add_bookkeeping_constraint(self):
+        """Test that bookkeeping becomes variable bounds rather than rows."""
+        solver = Solver(self.board, 'Test')
+        rows = len(solver.model.constraints)
+        self.item.book.set_possible([4])
+        self.item.add_bookkeeping_constraint(solver)
+        self.assertEqual(rows, len(solver.model.constraints))
+        self.assertEqual(0, solver.variables.choices[1][1][2].upBound)
+        self.assertEqual(1, solver.variables.choices[4][1][2].lowBound)
+        self.assertEqual(4, solver.variables.numbers[1][2].lowBound)
+        self.assertEqual(4, solver.variables.numbers[1][2].upBound)
+
     def test_regions(self):
         """Test the regions method of the Cell's top-level region."""
         self.assertIsNotNone(self.item.top.regions())
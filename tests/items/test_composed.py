@@ -68,6 +68,22 @@ class TestComposed(TestItem):
             expected.extend(item.flatten())
         self.assertListEqual(expected, self.item.flatten())
 
+    def test_views(self) -> None:
+        """Test that views are kept until a component is added below, in this item or one of its children."""
+        outer = ComposedItem(self.board, [self.item])
+        walked = list(outer.walk())
+        kept = outer.views['walk']
+        self.assertEqual(walked, list(outer.walk()))
+        self.assertIs(kept, outer.views['walk'])
+        version = outer.version
+        child = ComposedItem(self.board, [])
+        self.item.add(child)
+        self.assertEqual(version + 1, outer.version)
+        self.assertNotIn('walk', outer.views)
+        self.assertEqual([*walked, child], list(outer.walk()))
+        self.item.remove(child.name)
+        self.assertEqual(walked, list(outer.walk()))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
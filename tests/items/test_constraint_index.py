@@ -0,0 +1,74 @@
+"""TestConstraintIndex."""
+import unittest
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.box import Box
+from src.items.boxes import Boxes
+from src.items.cell import Cell
+from src.items.column import Column
+from src.items.columns import Columns
+from src.items.constraint_index import ConstraintIndex
+from src.items.constraints import Constraints
+from src.items.known_cell import KnownCell
+from src.items.region import Region
+from src.items.row import Row
+from src.items.rows import Rows
+from src.items.standard_region import StandardRegion
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestConstraintIndex(unittest.TestCase):
+    """Test suite for the ConstraintIndex class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 puzzle of rows, columns, boxes and one given."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.constraints = Constraints(self.board)
+        self.constraints.add(Rows(self.board))
+        self.constraints.add(Columns(self.board))
+        self.constraints.add(Boxes(self.board, Coord(2, 2)))
+        self.known = KnownCell(self.board, 2, 3, 4)
+        self.constraints.add(self.known)
+        self.index = ConstraintIndex(self.constraints)
+        self.cell = Cell.make(self.board, 2, 3)
+
+    def test_items(self):
+        """Test that each item is indexed once, even though cells are shared by regions."""
+        self.assertEqual(len({id(item) for item in self.constraints.walk()}), len(self.index.items))
+        self.assertEqual(16, len(self.index.classes[Cell]))
+
+    def test_regions(self):
+        """Test finding the regions that contain a cell."""
+        regions = self.index.regions(self.cell)
+        self.assertEqual({Row, Column, Box}, {type(region) for region in regions})
+        self.assertTrue(all(self.cell in region.cells for region in regions))
+        self.assertEqual(regions, self.index.regions(self.cell, StandardRegion))
+        self.assertEqual({Box}, {type(region) for region in self.index.regions(self.cell, Box)})
+        self.assertEqual([], self.index.regions(Cell(self.board, 5, 5)))
+
+    def test_cells(self):
+        """Test the cells of a region."""
+        row = self.index.instances(Row)[1]
+        self.assertEqual(tuple(Cell.make(self.board, 2, column) for column in range(1, 5)), self.index.cells(row))
+
+    def test_references(self):
+        """Test finding the items that hold or refer to a cell."""
+        references = self.index.references(self.cell)
+        self.assertIn(self.known, references)
+        self.assertEqual(self.index.regions(self.cell), [item for item in references if isinstance(item, Region)])
+
+    def test_instances(self):
+        """Test that instances include subclasses and are kept once asked for."""
+        self.assertEqual(12, len(self.index.instances(Region)))
+        self.assertEqual([self.known], self.index.instances(KnownCell))
+        self.assertIs(self.index.instances(Region), self.index.instances(Region))
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual(f'ConstraintIndex({self.constraints!r})', repr(self.index))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
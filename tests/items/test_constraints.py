@@ -40,6 +40,22 @@ class TestConstraints(TestComposed):
         """Test the construction of the Constraints instance."""
         self.assertEqual(self.size, len(self.item.components))
 
+    def test_index(self):
+        """Test that adding or removing a top level constraint drops the index, and that it is built again."""
+        index = self.item.index
+        self.assertIs(index, self.item.index)
+        self.assertEqual(3, len(index.instances(Row)) // 3)
+        self.item.remove(self.item.components[0].name)
+        self.assertIsNone(self.item.constraint_index)
+        self.assertEqual([], self.item.index.instances(Column))
+        self.item.add(Columns(self.board))
+        self.assertIsNone(self.item.constraint_index)
+        self.assertEqual(9, len(self.item.index.instances(Column)))
+
+    def test_create_index(self):
+        """Test that the index is built when the constraints are created."""
+        self.assertIsNotNone(Constraints.create(self.board, {'Constraints': [{'Rows': None}]}).constraint_index)
+
     def test_iteration(self):
         """Test iteration over the vectors in Constraints."""
         count = 0
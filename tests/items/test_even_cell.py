@@ -8,6 +8,8 @@ from src.items.cell_reference import CellReference
 from src.items.even_cell import EvenCell
 from src.items.item import Item
 from src.items.simple_cell_reference import SimpleCellReference
+from src.solvers.answer import Answer
+from tests.items.test_item import GRID
 from tests.items.test_parity_cell import TestParityCell
 
 
@@ -57,6 +59,12 @@ class TestEvenCell(TestParityCell):
         """Return the expected classes that the EvenCell should belong to."""
         return {Cell, CellReference, SimpleCellReference, Item, ParityCell, EvenCell}
 
+    def test_check(self):
+        """Test that the cell reports an odd digit."""
+        self.assertEqual([], self.item.check(Answer(self.board, GRID)))
+        violations = self.item.check(Answer(self.board, ['132456789'] + GRID[1:]))
+        self.assertEqual(['Digit 3 is not allowed'], [violation.text for violation in violations])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -7,7 +7,9 @@ from src.items.fortress_cell import FortressCell
 from src.items.fortress_greater_than_cell import FortressGreaterThanCell
 from src.items.item import Item
 from src.items.simple_cell_reference import SimpleCellReference
+from src.solvers.answer import Answer
 from tests.items.test_fortress_cell import TestFortressCell
+from tests.items.test_item import GRID
 
 
 class TestFortressGreaterThanCell(TestFortressCell):
@@ -52,6 +54,13 @@ class TestFortressGreaterThanCell(TestFortressCell):
         """Return the expected classes that the FortressCell should belong to."""
         return {Cell, CellReference, SimpleCellReference, Item, FortressCell, FortressGreaterThanCell}
 
+    def test_check(self):
+        """Test that the cell reports each orthogonal neighbour that is not smaller."""
+        violations = self.item.check(Answer(self.board, GRID))
+        self.assertEqual(['Digit 2 against neighbour 3', 'Digit 2 against neighbour 5'],
+                         sorted(violation.text for violation in violations))
+        self.assertEqual([], self.item.check(Answer(self.board, ['192345678'] + GRID[1:])))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -7,11 +7,14 @@ import oyaml as yaml
 from src.board.board import Board
 from src.board.digits import Digits
 from src.items.item import Item
+from src.solvers.answer import Answer
 from src.solvers.solver import Solver
 from src.utils.coord import Coord
 from src.utils.sudoku_exception import SudokuError
 from src.utils.tags import Tags
 
+GRID: list[str] = [''.join(str((row * 3 + row // 3 + column) % 9 + 1) for column in range(9)) for row in range(9)]
+
 
 class TestItem(unittest.TestCase):
     """Test suite for the Item class."""
@@ -25,6 +28,10 @@ class TestItem(unittest.TestCase):
         self.good_yaml = []
         self.bad_yaml = []
 
+    def test_check_grid(self):
+        """Test that checking a valid grid returns a list of violations."""
+        self.assertIsInstance(self.item.check(Answer(self.board, GRID)), list)
+
     def test_get_info(self):
         """Test that get_info returns a string."""
         info: dict[str, Any] = self.item.get_info()
@@ -5,7 +5,9 @@ from src.items.cell import Cell
 from src.items.cell_reference import CellReference
 from src.items.item import Item
 from src.items.known_cell import KnownCell
+from src.solvers.answer import Answer
 from tests.items.test_cell_reference import TestCellReference
+from tests.items.test_item import GRID
 
 
 class TestKnownCell(TestCellReference):
@@ -46,6 +48,11 @@ class TestKnownCell(TestCellReference):
         """Return the expected classes that the KnownCell instance should belong to."""
         return {Cell, CellReference, Item, KnownCell}
 
+    def test_check(self):
+        """Test that the cell reports any digit but the known one."""
+        self.assertEqual([(1, 2)], self.item.check(Answer(self.board, GRID))[0].cells)
+        self.assertEqual([], self.item.check(Answer(self.board, ['193456782'] + GRID[1:])))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
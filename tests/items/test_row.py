@@ -8,6 +8,9 @@ from src.items.item import Item
 from src.items.region import Region
 from src.items.row import Row
 from src.items.standard_region import StandardRegion
+from src.solvers.answer import Answer
+from src.utils.violation import Violation
+from tests.items.test_item import GRID
 from tests.items.test_standard_region import TestStandardRegion
 
 
@@ -50,6 +53,13 @@ class TestRow(TestStandardRegion):
         self.assertIn(Cell.make(self.board, 1, 1), self.item)
         self.assertNotIn(Cell.make(self.board, 9, 9), self.item)
 
+    def test_check(self):
+        """Test that the row reports a repeated digit and the wrong total."""
+        self.assertEqual([], self.item.check(Answer(self.board, GRID)))
+        violations: list[Violation] = self.item.check(Answer(self.board, ['113456789'] + GRID[1:]))
+        self.assertEqual(['Total is 44, not 45', 'Digit 1 repeats'], [violation.text for violation in violations])
+        self.assertEqual([(1, 1), (1, 2)], violations[1].cells)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -74,6 +74,14 @@ class TestAnswer(unittest.TestCase):
         self.assertEqual(8, self.item[1, 1])
         self.assertEqual(8, self.item[9, 9])
 
+    def test_copy(self):
+        """Test that a copy has the same digits, and changing it leaves the original alone."""
+        copy = self.item.copy()
+        self.assertEqual(self.item.digits, copy.digits)
+        self.assertIs(self.item.board, copy.board)
+        copy[1, 1] = 9
+        self.assertEqual(1, self.item[1, 1])
+
     def test_equality(self):
         """Test equality and inequality comparisons for Answer objects."""
         self.assertEqual(self.item, self.item)
@@ -0,0 +1,71 @@
+"""TestBookkeepingPropagator."""
+import unittest
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.cell import Cell
+from src.items.columns import Columns
+from src.items.constraints import Constraints
+from src.items.known import Known
+from src.items.rows import Rows
+from src.solvers.bookkeeping_propagator import BookkeepingPropagator
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestBookkeepingPropagator(unittest.TestCase):
+    """Test the BookkeepingPropagator class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 latin square that bookkeeping alone can solve."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.constraints = Constraints(self.board)
+        self.constraints.add_components(
+            [Rows(self.board), Columns(self.board), Known(self.board, ['1234', '2.4.', '3...', '4..1'])],
+        )
+        self.propagator = BookkeepingPropagator(self.constraints)
+
+    def test_items(self):
+        """Test that only items with their own bookkeeping are run."""
+        names = {item.__class__.__name__ for item in self.propagator.items}
+        self.assertEqual({'Row', 'Column', 'KnownCell'}, names)
+        self.assertEqual(16, len(self.propagator.watchers))
+
+    def test_run(self):
+        """Test running the bookkeeping to a fixpoint."""
+        changed = self.propagator.run()
+        self.assertTrue(self.propagator.solved())
+        self.assertFalse(self.propagator.contradiction())
+        self.assertEqual(16, len(changed))
+        self.assertEqual(48, self.propagator.eliminations)
+        self.assertGreater(self.propagator.passes, len(self.propagator.items))
+        self.assertEqual([1], Cell.make(self.board, 2, 2).book.digits())
+        self.assertEqual([2], Cell.make(self.board, 4, 3).book.digits())
+
+    def test_run_again(self):
+        """Test that a second run finds nothing more to do."""
+        self.propagator.run()
+        self.assertEqual(set(), self.propagator.run())
+        self.assertEqual(0, self.propagator.eliminations)
+        self.assertEqual(len(self.propagator.items), self.propagator.passes)
+
+    def test_reset(self):
+        """Test resetting the watched cells."""
+        self.propagator.run()
+        self.propagator.reset()
+        self.assertEqual(64, self.propagator.candidates())
+
+    def test_contradiction(self):
+        """Test that clashing givens are detected."""
+        self.constraints.add(Known(self.board, ['....', '.2..', '....', '....']))
+        propagator = BookkeepingPropagator(self.constraints)
+        propagator.run()
+        self.assertTrue(propagator.contradiction())
+
+    def test_repr(self):
+        """Test the string representation of the propagator."""
+        self.assertEqual(f'BookkeepingPropagator({self.constraints!r})', repr(self.propagator))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,121 @@
+"""TestCanonicalForm."""
+import unittest
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.boxes import Boxes
+from src.items.columns import Columns
+from src.items.constraints import Constraints
+from src.items.even_cell import EvenCell
+from src.items.known import Known
+from src.items.known_cell import KnownCell
+from src.items.rows import Rows
+from src.solvers.canonical_form import CanonicalForm
+from src.utils.coord import Coord
+from src.utils.matrix import ROTATE000
+from src.utils.tags import Tags
+
+
+class TestCanonicalForm(unittest.TestCase):
+    """Test the CanonicalForm class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 board."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+
+    def constraints(self, known: list[str], *items: type) -> Constraints:
+        """Create a constraint tree with rows, columns, boxes and givens.
+
+        Args:
+            known (list[str]): The rows of the givens.
+            items (type): Classes of further cell constraints to add in the top left cell.
+
+        Returns:
+            Constraints: The constraint tree.
+        """
+        constraints: Constraints = Constraints(self.board)
+        constraints.add(Rows(self.board))
+        constraints.add(Columns(self.board))
+        constraints.add(Boxes(self.board, Coord(2, 2)))
+        constraints.add(Known(self.board, known))
+        for item in items:
+            constraints.add(item(self.board, 1, 1))
+        return constraints
+
+    def test_symmetry(self):
+        """Test that rotations, reflections and relabellings of a puzzle share the canonical text."""
+        form: CanonicalForm = CanonicalForm.create(self.board, self.constraints(['1...', '..2.', '....', '...3']))
+        rotated: CanonicalForm = CanonicalForm.create(self.board, self.constraints(['...2', '....', '..4.', '3...']))
+        reflected: CanonicalForm = CanonicalForm.create(self.board, self.constraints(['...1', '.2..', '....', '3...']))
+        self.assertEqual(form.text, rotated.text)
+        self.assertEqual(form.key, reflected.key)
+        other: CanonicalForm = CanonicalForm.create(self.board, self.constraints(['1...', '.2..', '....', '...3']))
+        self.assertNotEqual(form.key, other.key)
+
+    def test_known_cell(self):
+        """Test that single givens are moved and relabelled with the grid."""
+        constraints: Constraints = self.constraints(['....', '....', '....', '....'])
+        constraints.add(KnownCell(self.board, 1, 4, 3))
+        form: CanonicalForm = CanonicalForm.create(self.board, constraints)
+        self.assertIn('"{\\"KnownCell\\": \\"1,1=1\\"}"', form.text)
+        self.assertEqual(1, form.relabel[3])
+
+    def test_known_cell_large(self):
+        """Test that single givens in different cells of a large board keep different forms."""
+        board: Board = Board(Coord(12, 12), Digits(1, 12), Tags())
+        texts: list[str] = []
+        for row, column in ((1, 12), (11, 2)):
+            constraints: Constraints = Constraints(board)
+            constraints.add(Rows(board))
+            constraints.add(KnownCell(board, row, column, 1))
+            texts.append(CanonicalForm.create(board, constraints).text)
+            self.assertRegex(texts[-1], r'KnownCell\\": \\"\d+,\d+=1\\"')
+        self.assertNotEqual(texts[0], texts[1])
+
+    def test_boxes(self):
+        """Test that a transform swapping rows and columns also swaps the shape of the boxes."""
+        board: Board = Board(Coord(6, 6), Digits(1, 6), Tags())
+        tall: Constraints = Constraints(board)
+        tall.add(Boxes(board, Coord(3, 2)))
+        tall.add(Rows(board))
+        wide: Constraints = Constraints(board)
+        wide.add(Boxes(board, Coord(2, 3)))
+        wide.add(Columns(board))
+        self.assertEqual(CanonicalForm.create(board, tall).text, CanonicalForm.create(board, wide).text)
+
+    def test_unsupported(self):
+        """Test that a puzzle with other constraints keeps its orientation and digits."""
+        constraints: Constraints = self.constraints(['...1', '....', '....', '....'], EvenCell)
+        form: CanonicalForm = CanonicalForm.create(self.board, constraints)
+        self.assertEqual(ROTATE000, form.matrix)
+        self.assertEqual({1: 1, 2: 2, 3: 3, 4: 4}, form.relabel)
+        self.assertIn('...1', form.text)
+
+    def test_transforms(self):
+        """Test that a square board has eight symmetries and other boards four."""
+        self.assertEqual(8, len(CanonicalForm.transforms(self.board)))
+        self.assertEqual(4, len(CanonicalForm.transforms(Board(Coord(4, 6), Digits(1, 6), Tags()))))
+
+    def test_round_trip(self):
+        """Test that a grid moved to the canonical form and back is unchanged."""
+        form: CanonicalForm = CanonicalForm.create(self.board, self.constraints(['...2', '..4.', '....', '3...']))
+        grid: list[list[int]] = [[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+        canonical: list[list[int]] = form.to_canonical(grid)
+        self.assertNotEqual(grid, canonical)
+        self.assertEqual(grid, form.to_original(canonical))
+
+    def test_move(self):
+        """Test that every cell moves to a cell of the board."""
+        for form in (CanonicalForm(self.board, '', matrix, {}) for matrix in CanonicalForm.transforms(self.board)):
+            moved = {form.move(row, column) for row in self.board.row_range for column in self.board.column_range}
+            self.assertEqual(16, len(moved))
+            self.assertTrue(all(self.board.is_valid(row, column) for row, column in moved))
+
+    def test_repr(self):
+        """Test the string representation."""
+        form: CanonicalForm = CanonicalForm(self.board, 'text', ROTATE000, {})
+        self.assertEqual(f"CanonicalForm({self.board!r}, 'text', {ROTATE000!r}, {{}})", repr(form))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -17,7 +17,6 @@ class TestConstraintUtilities(unittest.TestCase):
         """Set up the test environment."""
         self.board: Board = Board(Coord(9, 9), Digits(1, 9), tags=Tags())
         self.solver = Solver(self.board, "TestConstraintUtilities")
-        ConstraintUtilities.variables.clear()
 
     def test_logical_log10_cell(self) -> None:
         """Test the log10_cell method of the ConstraintUtilities class."""
@@ -34,6 +33,14 @@ class TestConstraintUtilities(unittest.TestCase):
         rule2 = ConstraintUtilities.log10_cell(self.solver, c1)
         self.assertIs(rule, rule2)
 
+    def test_solvers_do_not_share_variables(self) -> None:
+        """Test that each solver keeps its own auxiliary variables."""
+        cell = Cell.make(self.board, 1, 1)
+        other: Solver = Solver(self.board, "Other")
+        rule = ConstraintUtilities.log10_cell(self.solver, cell)
+        self.assertIsNot(rule, ConstraintUtilities.log10_cell(other, cell))
+        self.assertIn('log10_1_1', other.model.constraints)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
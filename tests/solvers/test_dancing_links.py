@@ -0,0 +1,59 @@
+"""TestDancingLinks."""
+import unittest
+
+from src.solvers.dancing_links import DancingLinks
+
+
+class TestDancingLinks(unittest.TestCase):
+    """Test the DancingLinks class."""
+
+    def setUp(self) -> None:
+        """Set up Knuth's example matrix, which has the single cover A, D, E."""
+        self.links = DancingLinks(7)
+        self.links.add_row('A', [0, 3, 6])
+        self.links.add_row('B', [0, 3])
+        self.links.add_row('C', [3, 4, 6])
+        self.links.add_row('D', [2, 4, 5])
+        self.links.add_row('E', [1, 2, 5, 6])
+        self.links.add_row('F', [1, 6])
+
+    def test_first(self):
+        """Test finding the first cover."""
+        self.assertEqual(['B', 'D', 'F'], sorted(self.links.first()))
+        self.assertGreater(self.links.nodes, 0)
+
+    def test_count(self):
+        """Test counting covers, and that the matrix is restored between searches."""
+        self.assertEqual(1, self.links.count())
+        self.assertEqual(1, self.links.count())
+        self.assertEqual(0, self.links.count(0))
+
+    def test_select(self):
+        """Test forcing rows into the solution."""
+        self.assertTrue(self.links.select('D'))
+        self.assertTrue(self.links.select('D'))
+        self.assertFalse(self.links.select('E'))
+        self.assertEqual(['B', 'D', 'F'], sorted(self.links.first()))
+
+    def test_select_no_cover(self):
+        """Test that selecting a row outside every cover leaves no solution."""
+        self.assertTrue(self.links.select('A'))
+        self.assertIsNone(self.links.first())
+
+    def test_secondary(self):
+        """Test that secondary columns are covered at most once."""
+        links = DancingLinks(2, 1)
+        links.add_row('x', [0, 2])
+        links.add_row('y', [1, 2])
+        links.add_row('z', [1])
+        links.add_row('w', [0])
+        self.assertEqual([['w', 'y'], ['w', 'z'], ['x', 'z']], sorted(sorted(rows) for rows in links.solutions()))
+        self.assertEqual(2, len(list(links.solutions(2))))
+
+    def test_repr(self):
+        """Test the string representation of the matrix."""
+        self.assertEqual('DancingLinks(7, 0)', repr(self.links))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,77 @@
+"""TestDLXBackend."""
+import unittest
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.cell import Cell
+from src.items.columns import Columns
+from src.items.constraints import Constraints
+from src.items.known import Known
+from src.items.rows import Rows
+from src.items.unique_region import UniqueRegion
+from src.solvers.answer import Answer
+from src.solvers.dlx_backend import DLXBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestDLXBackend(unittest.TestCase):
+    """Test the DLXBackend class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 latin square."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.constraints = Constraints(self.board)
+        self.constraints.add_components([Rows(self.board), Columns(self.board)])
+        self.backend = DLXBackend()
+        self.solver = Solver(self.board, 'Test', backends=[self.backend])
+
+    def test_count(self):
+        """Test counting the 4x4 latin squares."""
+        self.solver.add_constraints(self.constraints)
+        self.assertEqual(576, self.backend.count(self.solver))
+        self.assertEqual(10, self.backend.count(self.solver, 10))
+
+    def test_count_with_givens(self):
+        """Test that givens and smaller unique regions reduce the count."""
+        self.constraints.add(Known(self.board, ['12..', '....', '....', '....']))
+        self.solver.add_constraints(self.constraints)
+        given = self.backend.count(self.solver)
+        self.assertEqual(576 // 12, given)
+        self.constraints.add(UniqueRegion(self.board, [Cell.make(self.board, 2, 1), Cell.make(self.board, 3, 2)]))
+        self.assertLess(self.backend.count(self.solver), given)
+
+    def test_answers(self):
+        """Test that every enumerated answer is a latin square."""
+        self.solver.add_constraints(self.constraints)
+        answers = list(self.backend.answers(self.solver, 3))
+        self.assertEqual(3, len(answers))
+        for answer in answers:
+            self.assertIsInstance(answer, Answer)
+            for index in self.board.row_range:
+                self.assertEqual({1, 2, 3, 4}, {answer[index, column] for column in self.board.column_range})
+                self.assertEqual({1, 2, 3, 4}, {answer[row, index] for row in self.board.row_range})
+
+    def test_solve(self):
+        """Test solving through the solver."""
+        self.constraints.add(Known(self.board, ['1...', '.2..', '..3.', '...4']))
+        self.solver.add_constraints(self.constraints)
+        self.solver.solve()
+        self.assertEqual(SolverStatus.optimal, self.solver.status)
+        for index in self.board.row_range:
+            self.assertEqual(index, self.solver.answer[index, index])
+
+    def test_infeasible(self):
+        """Test that clashing givens are infeasible."""
+        self.constraints.add(Known(self.board, ['11..', '....', '....', '....']))
+        self.solver.add_constraints(self.constraints)
+        self.solver.solve()
+        self.assertEqual(SolverStatus.infeasible, self.solver.status)
+        self.assertEqual(0, self.backend.count(self.solver))
+        self.assertEqual([], list(self.backend.answers(self.solver)))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
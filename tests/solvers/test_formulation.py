@@ -7,6 +7,7 @@ from typing import ClassVar
 from pulp import getSolver, LpContinuous, LpInteger, LpMinimize, LpProblem, LpSolver, LpVariable
 
 from src.solvers.formulations import Formulations
+from src.utils.name_allocator import NameAllocator
 
 
 class TestFormulation(unittest.TestCase):
@@ -23,6 +24,7 @@ class TestFormulation(unittest.TestCase):
         self.lp_path = self.base / Path("lp")
         self.log_path.mkdir(exist_ok=True, parents=True)
         self.lp_path.mkdir(exist_ok=True, parents=True)
+        self.names = NameAllocator()
 
     def get_application(self, name: str) -> LpSolver:
         """Retrieve an LpSolver instance based on the solver name.
@@ -74,7 +76,7 @@ class TestFormulation(unittest.TestCase):
 
         model += x1 == v1
         model += x2 == v2
-        model += x == Formulations.abs(model, x1, x2, 9)
+        model += x == Formulations.abs(model, self.names, x1, x2, 9)
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, x.varValue)
@@ -107,7 +109,7 @@ class TestFormulation(unittest.TestCase):
 
         model += x1 == v1
         model += x2 == v2
-        model += x == Formulations.abs(model, x1, x2, 9)
+        model += x == Formulations.abs(model, self.names, x1, x2, 9)
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, x.varValue)
@@ -141,7 +143,7 @@ class TestFormulation(unittest.TestCase):
             model += x == value
             variables.append(x)
 
-        mini = Formulations.minimum(model, variables, 1, 9)
+        mini = Formulations.minimum(model, self.names, variables, 1, 9)
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, mini.varValue)
@@ -173,7 +175,7 @@ class TestFormulation(unittest.TestCase):
             model += x == value
             variables.append(x)
 
-        maxi = Formulations.maximum(model, variables, 1, 9)
+        maxi = Formulations.maximum(model, self.names, variables, 1, 9)
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, maxi.varValue)
@@ -201,7 +203,7 @@ class TestFormulation(unittest.TestCase):
         model = LpProblem("logical_not", LpMinimize)
         x = LpVariable("row", 0, 1, LpInteger)
         model += x == value
-        y = Formulations.logical_not(model, x)
+        y = Formulations.logical_not(model, self.names, x)
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, y.varValue)
@@ -231,7 +233,7 @@ class TestFormulation(unittest.TestCase):
         x2 = LpVariable("value2", 0, 1, LpInteger)
         model += x1 == value1
         model += x2 == value2
-        y = Formulations.logical_or(model, [x1, x2])
+        y = Formulations.logical_or(model, self.names, [x1, x2])
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, y.varValue)
@@ -265,7 +267,7 @@ class TestFormulation(unittest.TestCase):
         x2 = LpVariable("value2", 0, 1, LpInteger)
         model += x1 == value1
         model += x2 == value2
-        y = Formulations.logical_and(model, [x1, x2])
+        y = Formulations.logical_and(model, self.names, [x1, x2])
         model.writeLP(str(self.get_lp_filename(inspect.currentframe().f_code.co_name)))
         model.solve(self.get_application(inspect.currentframe().f_code.co_name))
         self.assertEqual(expected, y.varValue)
@@ -0,0 +1,74 @@
+"""TestPresolve."""
+import unittest
+
+from pulp import lpSum
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.solvers.presolve import Presolve
+from src.solvers.solver import Solver
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestPresolve(unittest.TestCase):
+    """Test the Presolve class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 solver with one digit per cell and each digit once per row."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.solver = Solver(self.board, 'Test')
+        choices = self.solver.variables.choices
+        for row in self.board.row_range:
+            for column in self.board.column_range:
+                cell = lpSum(choices[digit][row][column] for digit in range(1, 5))  # type: ignore
+                self.solver.model += cell == 1, f'Cell_{row}_{column}'
+            for digit in range(1, 5):
+                line = lpSum(choices[digit][row][column] for column in range(1, 5))  # type: ignore
+                self.solver.model += line <= 1, f'Row_{row}_{digit}'
+        self.presolve = Presolve(self.solver)
+
+    def test_nothing_fixed(self):
+        """Test that a model with no fixed variables keeps every row."""
+        self.presolve.run()
+        self.assertEqual(32, self.presolve.rows)
+        self.assertEqual(32, len(self.solver.model.constraints))
+
+    def test_fixed_cell(self):
+        """Test that fixing a cell drops its rows and the digit from the rest of the row."""
+        choices = self.solver.variables.choices
+        for digit in (2, 3, 4):
+            choices[digit][1][1].upBound = 0
+        self.presolve.run()
+        self.assertEqual(1, choices[1][1][1].lowBound)
+        for column in (2, 3, 4):
+            self.assertEqual(0, choices[1][1][column].upBound)
+        model = self.solver.model
+        self.assertNotIn('Cell_1_1', model.constraints)
+        self.assertNotIn('Row_1_1', model.constraints)
+        self.assertEqual(3, len(model.constraints['Cell_1_2']))
+        self.assertLess(len(model.variables()), self.presolve.columns)
+
+    def test_infeasible_row_kept(self):
+        """Test that a violated row is kept so that the solver reports it."""
+        choices = self.solver.variables.choices
+        for digit in range(1, 5):
+            choices[digit][1][1].upBound = 0
+        self.presolve.run()
+        self.assertIn('Cell_1_1', self.solver.model.constraints)
+
+    def test_fix(self):
+        """Test that fixing respects bounds and integrality."""
+        variable = self.solver.variables.choices[1][1][1]
+        self.assertFalse(Presolve.fix(variable, 2))
+        self.assertFalse(Presolve.fix(variable, 0.5))
+        self.assertTrue(Presolve.fix(variable, 1))
+        self.assertTrue(Presolve.is_fixed(variable))
+
+    def test_repr(self):
+        """Test the string representation of the presolve."""
+        self.assertEqual("Presolve('Test')", repr(self.presolve))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,70 @@
+"""TestPropagationBackend."""
+import unittest
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.columns import Columns
+from src.items.constraints import Constraints
+from src.items.even_cell import EvenCell
+from src.items.known import Known
+from src.items.rows import Rows
+from src.solvers.backend import Backend
+from src.solvers.propagation_backend import PropagationBackend
+from src.solvers.pulp_backend import PulpBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestPropagationBackend(unittest.TestCase):
+    """Test the PropagationBackend class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 latin square with some givens."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.constraints = Constraints(self.board)
+        self.constraints.add_components(
+            [Rows(self.board), Columns(self.board), Known(self.board, ['1...', '.2..', '..3.', '...4'])],
+        )
+        self.backend = PropagationBackend()
+        self.solver = Solver(self.board, 'Test', backends=[self.backend, PulpBackend()])
+
+    def test_registered(self):
+        """Test that the backend is registered."""
+        self.assertIn('PropagationBackend', Backend.classes)
+        self.assertEqual('Propagation', self.backend.name)
+
+    def test_supports(self):
+        """Test that only trees of distinct regions and givens are supported."""
+        self.assertFalse(self.backend.supports(self.solver))
+        self.solver.constraints = self.constraints
+        self.assertTrue(self.backend.supports(self.solver))
+        self.constraints.add(EvenCell(self.board, 1, 2))
+        self.assertFalse(self.backend.supports(self.solver))
+
+    def test_solve(self):
+        """Test that the solver picks the backend and finds a valid answer."""
+        self.solver.add_constraints(self.constraints)
+        self.solver.solve()
+        self.assertIs(self.backend, self.solver.backend)
+        self.assertEqual(SolverStatus.optimal, self.solver.status)
+        for index in self.board.row_range:
+            self.assertEqual(index, self.solver.answer[index, index])
+            self.assertEqual({1, 2, 3, 4}, {self.solver.answer[index, column] for column in self.board.column_range})
+            self.assertEqual({1, 2, 3, 4}, {self.solver.answer[row, index] for row in self.board.row_range})
+
+    def test_infeasible(self):
+        """Test that contradictory givens are reported as infeasible."""
+        self.constraints.add(Known(self.board, ['11..', '....', '....', '....']))
+        self.solver.add_constraints(self.constraints)
+        self.solver.solve()
+        self.assertEqual(SolverStatus.infeasible, self.solver.status)
+
+    def test_repr(self):
+        """Test the string representation of the backend."""
+        self.assertEqual('PropagationBackend()', repr(self.backend))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
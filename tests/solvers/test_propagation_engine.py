@@ -0,0 +1,99 @@
+"""TestPropagationEngine."""
+import unittest
+
+from src.solvers.propagation_engine import PropagationEngine
+
+
+def sudoku_regions(size: int, box_rows: int, box_columns: int) -> list[list[int]]:
+    """Return the rows, columns and boxes of a sudoku grid as cell indexes.
+
+    Args:
+        size (int): The number of rows and columns.
+        box_rows (int): The number of rows in a box.
+        box_columns (int): The number of columns in a box.
+
+    Returns:
+        list[list[int]]: The cells of each region.
+    """
+    rows = [[row * size + column for column in range(size)] for row in range(size)]
+    columns = [[row * size + column for row in range(size)] for column in range(size)]
+    boxes = [
+        [
+            (top + row) * size + left + column
+            for row in range(box_rows)
+            for column in range(box_columns)
+        ]
+        for top in range(0, size, box_rows)
+        for left in range(0, size, box_columns)
+    ]
+    return rows + columns + boxes
+
+
+class TestPropagationEngine(unittest.TestCase):
+    """Test the PropagationEngine class."""
+
+    def setUp(self) -> None:
+        """Set up a 9x9 engine and a puzzle."""
+        self.regions = sudoku_regions(9, 3, 3)
+        self.engine = PropagationEngine(9, 81, self.regions)
+        self.puzzle = (
+            '53..7....'
+            '6..195...'
+            '.98....6.'
+            '8...6...3'
+            '4..8.3..1'
+            '7...2...6'
+            '.6....28.'
+            '...419..5'
+            '....8..79'
+        )
+
+    def givens(self, puzzle: str) -> list[int]:
+        """Return the starting candidates for a puzzle string.
+
+        Args:
+            puzzle (str): The digits of the puzzle, with '.' for an empty cell.
+
+        Returns:
+            list[int]: The candidates of each cell.
+        """
+        candidates = self.engine.start()
+        for index, code in enumerate(puzzle):
+            if code != '.':
+                candidates[index] = 1 << (int(code) - 1)
+        return candidates
+
+    def test_solve(self):
+        """Test that the solution keeps the givens and fills every region with distinct digits."""
+        solution = self.engine.solve(self.givens(self.puzzle))
+        self.assertIsNotNone(solution)
+        for index, code in enumerate(self.puzzle):
+            if code != '.':
+                self.assertEqual(int(code) - 1, solution[index])
+        for region in self.regions:
+            self.assertEqual(set(range(9)), {solution[cell] for cell in region})
+        self.assertGreater(self.engine.nodes, 0)
+        self.assertGreater(self.engine.eliminations, 0)
+
+    def test_unique(self):
+        """Test that a proper puzzle has exactly one solution."""
+        self.assertEqual(1, len(self.engine.solutions(self.givens(self.puzzle), 2)))
+
+    def test_infeasible(self):
+        """Test that contradictory givens have no solution."""
+        self.assertIsNone(self.engine.solve(self.givens('55' + '.' * 79)))
+
+    def test_count(self):
+        """Test the number of completed 4x4 grids."""
+        engine = PropagationEngine(4, 16, sudoku_regions(4, 2, 2))
+        self.assertEqual(288, len(engine.solutions(engine.start())))
+        self.assertEqual(5, len(engine.solutions(engine.start(), 5)))
+
+    def test_repr(self):
+        """Test the string representation of the engine."""
+        engine = PropagationEngine(2, 2, [[0, 1]])
+        self.assertEqual('PropagationEngine(2, 2, [(0, 1)])', repr(engine))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,182 @@
+"""TestPulpBackend."""
+import asyncio
+import unittest
+from pathlib import Path
+
+from pulp import LpConstraintLE
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.commands.create_constraints_command import CreateConstraintsCommand
+from src.commands.problem import Problem
+from src.commands.solve_command import SolveCommand
+from src.items.battenburg import Battenburg
+from src.items.even_cell import EvenCell
+from src.items.fortress_greater_than_cell import FortressGreaterThanCell
+from src.items.item import Item
+from src.items.odd_cell import OddCell
+from src.solvers.answer import Answer
+from src.solvers.pulp_backend import PulpBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestPulpBackend(unittest.IsolatedAsyncioTestCase):
+    """Test the PulpBackend class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 board and the backend."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.backend = PulpBackend()
+
+    def create_solver(self, given: int = 1) -> Solver:
+        """Create a solver for a 4x4 Latin square with one given digit.
+
+        Args:
+            given (int): The digit given in the top left cell.
+
+        Returns:
+            Solver: The solver.
+        """
+        solver: Solver = Solver(self.board, 'Test', backends=[self.backend])
+        choices = solver.variables.choices
+        for row in self.board.row_range:
+            for column in self.board.column_range:
+                solver.add_cell_constraint(row, column)
+        for digit in range(1, 5):
+            for line in range(1, 5):
+                row_choices: list[tuple[int, int, int]] = [(digit, line, column) for column in range(1, 5)]
+                solver.add_choice_constraint(f'Row_{line}_{digit}', row_choices, LpConstraintLE, 1)
+                column_choices: list[tuple[int, int, int]] = [(digit, row, line) for row in range(1, 5)]
+                solver.add_choice_constraint(f'Column_{line}_{digit}', column_choices, LpConstraintLE, 1)
+        choices[given][1][1].lowBound = 1  # type: ignore
+        return solver
+
+    def assert_latin(self, solver: Solver, given: int = 1) -> None:
+        """Assert that the solver found a Latin square with the given digit.
+
+        Args:
+            solver (Solver): The solver.
+            given (int): The digit given in the top left cell.
+        """
+        self.assertEqual(SolverStatus.optimal, solver.status)
+        self.assertEqual(given, solver.answer[1, 1])
+        for line in self.board.row_range:
+            self.assertEqual({1, 2, 3, 4}, {solver.answer[line, column] for column in self.board.column_range})
+            self.assertEqual({1, 2, 3, 4}, {solver.answer[row, line] for row in self.board.row_range})
+
+    def test_solve(self):
+        """Test that the synchronous solve captures the log without redirecting stdout."""
+        solver: Solver = self.create_solver()
+        solver.solve()
+        self.assert_latin(solver)
+        self.assertIn('Optimal', solver.log)
+
+    def test_solve_items(self):
+        """Test that items on the number variables are solved to an answer that passes every check."""
+        problem: Problem = Problem(Path('problems/easy/problem001.yaml'), Path('output/tests/'))
+        CreateConstraintsCommand().execute(problem)
+        board: Board = problem.board  # type: ignore
+        items: list[Item] = [
+            EvenCell(board, 1, 5),
+            OddCell(board, 1, 2),
+            FortressGreaterThanCell(board, 3, 5),
+            Battenburg(board, Coord(3, 3)),
+        ]
+        problem.constraints.add_components(items)  # type: ignore
+        SolveCommand().execute(problem)
+        self.assertEqual(SolverStatus.optimal, problem.status)
+        answer: Answer = problem.solver.answer  # type: ignore
+        self.assertEqual([], problem.constraints.check(answer))  # type: ignore
+        self.assertEqual(9, answer[3, 5])
+
+    def test_warm_start(self):
+        """Test that a start fitting the model is accepted, and one breaking the given digit is rejected."""
+        solver: Solver = self.create_solver()
+        solver.solve()
+        self.assertIsNone(solver.start_accepted)
+        self.assertIsNotNone(solver.nodes)
+        solver.warm_start(Answer(self.board, ['1234', '3412', '2143', '4321']))
+        solver.solve()
+        self.assert_latin(solver)
+        self.assertTrue(solver.start_accepted)
+        self.assertEqual([[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]], solver.answer.digits)
+        solver.warm_start(Answer(self.board, ['2143', '1234', '4321', '3412']))
+        solver.solve()
+        self.assert_latin(solver)
+        self.assertFalse(solver.start_accepted)
+
+    def test_read_log(self):
+        """Test reading the MIP start and the nodes searched from a CBC log."""
+        solver: Solver = self.create_solver()
+        solver.log = 'Cbc0045I MIPStart provided solution with cost 0\nEnumerated nodes:               12\n'
+        PulpBackend.read_log(solver)
+        self.assertEqual((True, 12), (solver.start_accepted, solver.nodes))
+        solver.log = 'Cbc0045I Warning: mipstart values could not be used to build a solution.\n'
+        PulpBackend.read_log(solver)
+        self.assertEqual((False, None), (solver.start_accepted, solver.nodes))
+
+    def test_read_solution(self):
+        """Test reading a CBC solution file."""
+        text: str = (
+            'Optimal - objective value 0.00000000\n'
+            '      0 choices_1_1_1            1                       0\n'
+            '**    1 numbers_1_1              3                       0\n'
+        )
+        status, values = PulpBackend.read_solution(text)
+        self.assertEqual(SolverStatus.optimal, status)
+        self.assertEqual({'choices_1_1_1': 1.0, 'numbers_1_1': 3.0}, values)
+        self.assertEqual(SolverStatus.infeasible, PulpBackend.read_solution('Integer infeasible - objective')[0])
+        self.assertEqual(SolverStatus.not_solved, PulpBackend.read_solution('Stopped on time - objective')[0])
+        self.assertEqual(SolverStatus.not_solved, PulpBackend.read_solution('')[0])
+
+    async def test_solve_async(self):
+        """Test solving with a CBC child process."""
+        solver: Solver = self.create_solver()
+        await solver.solve_async(time_limit=60)
+        self.assert_latin(solver)
+        self.assertIn('Optimal', solver.log)
+
+    async def test_solve_async_infeasible(self):
+        """Test that an infeasible model is reported."""
+        solver: Solver = self.create_solver()
+        solver.variables.choices[2][1][1].lowBound = 1  # type: ignore
+        await solver.solve_async()
+        self.assertEqual(SolverStatus.infeasible, solver.status)
+
+    async def test_time_limit(self):
+        """Test that reaching the time limit leaves the puzzle unsolved."""
+        solver: Solver = self.create_solver()
+        await solver.solve_async(time_limit=1e-6)
+        self.assertEqual(SolverStatus.not_solved, solver.status)
+        self.assertIn('Time limit', solver.log)
+
+    async def test_cancel(self):
+        """Test that cancelling the solve raises CancelledError in the caller."""
+        solver: Solver = self.create_solver()
+        task: asyncio.Task = asyncio.create_task(solver.solve_async())
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(SolverStatus.not_solved, solver.status)
+
+    async def test_solve_all(self):
+        """Test solving several puzzles concurrently."""
+        solvers: list[Solver] = [self.create_solver(given) for given in range(1, 5)]
+        await Solver.solve_all(solvers, concurrency=2, time_limit=60)
+        for given, solver in enumerate(solvers, start=1):
+            self.assert_latin(solver, given)
+
+    async def test_other_application(self):
+        """Test that an application other than CBC is run in a worker thread."""
+        solver: Solver = self.create_solver()
+        solver.application_name = 'Other'
+        await solver.solve_async(time_limit=60)
+        self.assert_latin(solver)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,105 @@
+"""TestSolveCache."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.constraints import Constraints
+from src.items.known_cell import KnownCell
+from src.solvers.answer import Answer
+from src.solvers.solve_cache import SolveCache
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.tags import Tags
+
+
+class TestSolveCache(unittest.TestCase):
+    """Test the SolveCache class."""
+
+    def setUp(self) -> None:
+        """Open a cache with room for two entries in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SolveCache(Path(self.directory.name) / 'cache.db', 2)
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+
+    def tearDown(self) -> None:
+        """Close the cache and remove the directory."""
+        self.cache.close()
+        self.directory.cleanup()
+
+    def constraints(self, *givens: tuple[int, int, int]) -> Constraints:
+        """Create a constraint tree of given digits.
+
+        Args:
+            givens (tuple[int, int, int]): The row, column and digit of each given.
+
+        Returns:
+            Constraints: The constraint tree.
+        """
+        constraints: Constraints = Constraints(self.board)
+        for row, column, digit in givens:
+            constraints.add(KnownCell(self.board, row, column, digit))
+        return constraints
+
+    def test_key(self):
+        """Test that the key depends on the content of the puzzle, but not on its order, orientation or digits."""
+        key: str = SolveCache.key(self.board, self.constraints((1, 1, 1), (2, 2, 2)))
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, SolveCache.key(self.board, self.constraints((2, 2, 2), (1, 1, 1))))
+        self.assertEqual(key, SolveCache.key(self.board, self.constraints((4, 4, 3), (3, 3, 2))))
+        self.assertNotEqual(key, SolveCache.key(self.board, self.constraints((1, 1, 1), (2, 3, 2))))
+        other: Board = Board(Coord(4, 4), Digits(1, 4), Tags({'Title': 'Other'}))
+        self.assertEqual(key, SolveCache.key(other, self.constraints((1, 1, 1), (2, 2, 2))))
+
+    def test_get_put(self):
+        """Test storing and finding an entry."""
+        answer: Answer = Answer(self.board, ['1234', '3412', '2143', '4321'])
+        self.assertIsNone(self.cache.get('puzzle'))
+        self.cache.put('puzzle', SolverStatus.optimal, answer, {'Nodes': '0'})
+        status, digits, statistics = self.cache.get('puzzle')  # type: ignore
+        self.assertEqual(SolverStatus.optimal, status)
+        self.assertEqual(answer.digits, digits)
+        self.assertEqual({'Nodes': '0'}, statistics)
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    def test_no_answer(self):
+        """Test storing a status without an answer."""
+        self.cache.put('puzzle', SolverStatus.infeasible, None, {})
+        self.assertEqual((SolverStatus.infeasible, None, {}), self.cache.get('puzzle'))
+
+    def test_eviction(self):
+        """Test that the least recently used entry is evicted when the cache is full."""
+        self.cache.put('first', SolverStatus.infeasible, None, {})
+        self.cache.put('second', SolverStatus.infeasible, None, {})
+        self.cache.get('first')
+        self.cache.put('third', SolverStatus.infeasible, None, {})
+        self.assertEqual(2, len(self.cache))
+        self.assertIsNotNone(self.cache.get('first'))
+        self.assertIsNone(self.cache.get('second'))
+        self.assertIsNotNone(self.cache.get('third'))
+
+    def test_clear(self):
+        """Test removing every entry."""
+        self.cache.put('puzzle', SolverStatus.infeasible, None, {})
+        self.cache.clear()
+        self.assertEqual(0, len(self.cache))
+
+    def test_statistics(self):
+        """Test extracting the statistics from a CBC log."""
+        log: str = (
+            'Result - Optimal solution found\n\n'
+            'Enumerated nodes:               3\n'
+            'Total iterations:               7\n'
+        )
+        self.assertEqual({'Result': 'Optimal', 'Nodes': '3', 'Iterations': '7'}, SolveCache.statistics(log))
+        self.assertEqual({}, SolveCache.statistics(None))
+
+    def test_repr(self):
+        """Test the string representation."""
+        path: str = str(Path(self.directory.name) / 'cache.db')
+        self.assertEqual(f'SolveCache({path!r}, 2)', repr(self.cache))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
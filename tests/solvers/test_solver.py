@@ -0,0 +1,136 @@
+"""TestSolver."""
+import io
+import unittest
+from types import SimpleNamespace
+
+from pulp import LpInteger
+from pulp import LpVariable
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.items.boxes import Boxes
+from src.items.columns import Columns
+from src.items.constraints import Constraints
+from src.items.known_cell import KnownCell
+from src.items.rows import Rows
+from src.solvers.presolve import Presolve
+from src.solvers.pulp_backend import PulpBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.sudoku_exception import SudokuError
+from src.utils.tags import Tags
+
+
+class TestSolver(unittest.TestCase):
+    """Test editing the model of a Solver one item at a time."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 puzzle of rows, columns and boxes, with its model built."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.constraints = Constraints(self.board)
+        self.rows = Rows(self.board)
+        self.boxes = Boxes(self.board, Coord(2, 2))
+        self.constraints.add_components([self.rows, Columns(self.board), self.boxes])
+        self.solver = Solver(self.board, 'Test', backends=[PulpBackend()])
+        self.solver.add_constraints(self.constraints)
+
+    def test_add_constraints(self):
+        """Test that the rows of each top level item are recorded, after the two rows of each cell."""
+        self.assertEqual([item.name for item in self.constraints.components], list(self.solver.item_rows))
+        recorded: int = sum(len(rows) for rows in self.solver.item_rows.values())
+        self.assertEqual(len(self.solver.model.constraints), 2 * 16 + recorded)  # type: ignore
+        self.assertIn('Unique_digit_4_4', self.solver.model.constraints)  # type: ignore
+        self.assertIn('Number_4_4', self.solver.model.constraints)  # type: ignore
+        for name in self.solver.item_rows[self.rows.name]:
+            self.assertIn(name, self.solver.model.constraints)  # type: ignore
+
+    def test_add_item(self):
+        """Test that an added item's rows are appended and the puzzle is solved with them."""
+        rows: int = len(self.solver.model.constraints)  # type: ignore
+        boxes: Boxes = Boxes(self.board, Coord(2, 2))
+        self.solver.add_item(boxes)
+        self.assertIn(boxes, self.constraints.components)
+        added: list[str] = self.solver.item_rows[boxes.name]
+        self.assertEqual(rows + len(added), len(self.solver.model.constraints))  # type: ignore
+        self.assertEqual(added, list(self.solver.model.constraints)[rows:])  # type: ignore
+        self.solver.solve()
+        self.assertEqual(SolverStatus.optimal, self.solver.status)
+        with self.assertRaises(SudokuError):
+            self.solver.add_item(boxes)
+
+    def test_remove_item(self):
+        """Test that a removed item's rows are deleted, and the item can be added back."""
+        rows: list[str] = self.solver.item_rows[self.boxes.name]
+        self.solver.remove_item(self.boxes.name)
+        self.assertNotIn(self.boxes, self.constraints.components)
+        self.assertTrue(all(name not in self.solver.model.constraints for name in rows))  # type: ignore
+        self.solver.add_item(self.boxes)
+        self.solver.solve()
+        self.assertEqual(SolverStatus.optimal, self.solver.status)
+        with self.assertRaises(SudokuError):
+            self.solver.remove_item('Missing_0')
+
+    def test_remove_item_after_presolve(self):
+        """Test that an item can be removed once presolve has dropped some of its rows."""
+        self.solver.variables.choices[1][1][1].lowBound = 1  # type: ignore
+        Presolve(self.solver).run()
+        rows: list[str] = self.solver.item_rows[self.boxes.name]
+        self.assertFalse(all(name in self.solver.model.constraints for name in rows))  # type: ignore
+        self.solver.remove_item(self.boxes.name)
+        self.assertNotIn(self.boxes.name, self.solver.item_rows)
+        self.assertTrue(all(name not in self.solver.model.constraints for name in rows))  # type: ignore
+        self.solver.solve()
+        self.assertEqual(SolverStatus.optimal, self.solver.status)
+        self.assertEqual(1, self.solver.answer[1, 1])
+
+    def test_remove_item_variables(self):
+        """Test that the variables only a removed item used leave the model, and shared ones stay."""
+        spare: LpVariable = LpVariable('Spare', 0, 1, LpInteger)
+        choice: LpVariable = self.solver.variables.choices[1][1][1]  # type: ignore
+        item = SimpleNamespace(
+            name='Spare_0',
+            add_constraint=lambda solver: solver.model.addConstraint(spare <= choice, 'Spare'),
+        )
+        self.solver.record(item)
+        self.assertEqual(['Spare'], [variable.name for variable in self.solver.item_variables['Spare_0']])
+        self.assertIn('Spare', {variable.name for variable in self.solver.model.variables()})  # type: ignore
+        self.solver.remove_item('Spare_0')
+        names: set[str] = {variable.name for variable in self.solver.model.variables()}  # type: ignore
+        self.assertNotIn('Spare', names)
+        self.assertIn(choice.name, names)
+        self.assertNotIn('Spare', self.solver.used_variables)
+
+    def lp_text(self) -> str:
+        """Build the 4x4 puzzle on a fresh board and write its model.
+
+        Returns:
+            str: The model in LP format.
+        """
+        board: Board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        constraints: Constraints = Constraints(board)
+        constraints.add_components([Rows(board), Columns(board), Boxes(board, Coord(2, 2))])
+        solver: Solver = Solver(board, 'Test')
+        solver.add_constraints(constraints)
+        stream: io.StringIO = io.StringIO()
+        solver.write_lp(stream)
+        return stream.getvalue()
+
+    def test_repeatable(self):
+        """Test that the same puzzle gives the same LP file, whatever was built before it."""
+        first: str = self.lp_text()
+        Boxes(self.board, Coord(2, 2))
+        self.assertEqual(first, self.lp_text())
+        self.assertIn('Box_0_Unique_1', first)
+
+    def test_sparse(self):
+        """Test that items cannot be added to a sparse model."""
+        solver: Solver = Solver(self.board, 'Test', sparse=True)
+        solver.add_constraints(self.constraints)
+        self.assertEqual({}, solver.item_rows)
+        with self.assertRaises(SudokuError):
+            solver.add_item(KnownCell(self.board, 1, 1, 3))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,184 @@
+"""TestSolverPool."""
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from pulp import LpConstraintEQ
+from pulp import LpConstraintLE
+from pulp import lpSum
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.solvers.pool_backend import PoolBackend
+from src.solvers.solver import Solver
+from src.solvers.solver_pool import CbcProcess
+from src.solvers.solver_pool import PoolWorker
+from src.solvers.solver_pool import SolverPool
+from src.solvers.solver_status import SolverStatus
+from src.utils.coord import Coord
+from src.utils.sudoku_exception import SudokuError
+from src.utils.tags import Tags
+
+
+class TestSolverPool(unittest.TestCase):
+    """Test the SolverPool class."""
+
+    pool: SolverPool
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Start a pool of two workers."""
+        cls.pool = SolverPool(2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Stop the pool."""
+        cls.pool.close()
+
+    def setUp(self) -> None:
+        """Set up a 4x4 board."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+
+    def create_solver(self, given: int = 1) -> Solver:
+        """Create a solver for a 4x4 Latin square with one given digit.
+
+        Args:
+            given (int): The digit given in the top left cell.
+
+        Returns:
+            Solver: The solver.
+        """
+        solver: Solver = Solver(self.board, 'Test', backends=[PoolBackend(self.pool)])
+        choices = solver.variables.choices
+        numbers = solver.variables.numbers
+        for row in self.board.row_range:
+            for column in self.board.column_range:
+                cell: list[tuple[int, int, int]] = [(digit, row, column) for digit in range(1, 5)]
+                solver.add_choice_constraint(f'Cell_{row}_{column}', cell, LpConstraintEQ, 1)
+                total = lpSum(digit * choices[digit][row][column] for digit in range(1, 5))  # type: ignore
+                solver.model += numbers[row][column] == total, f'Number_{row}_{column}'  # type: ignore
+        for digit in range(1, 5):
+            for line in range(1, 5):
+                row_choices: list[tuple[int, int, int]] = [(digit, line, column) for column in range(1, 5)]
+                solver.add_choice_constraint(f'Row_{line}_{digit}', row_choices, LpConstraintLE, 1)
+                column_choices: list[tuple[int, int, int]] = [(digit, row, line) for row in range(1, 5)]
+                solver.add_choice_constraint(f'Column_{line}_{digit}', column_choices, LpConstraintLE, 1)
+        choices[given][1][1].lowBound = 1  # type: ignore
+        return solver
+
+    def assert_latin(self, solver: Solver, given: int = 1) -> None:
+        """Assert that the solver found a Latin square with the given digit.
+
+        Args:
+            solver (Solver): The solver.
+            given (int): The digit given in the top left cell.
+        """
+        self.assertEqual(SolverStatus.optimal, solver.status)
+        self.assertEqual(given, solver.answer[1, 1])
+        for line in self.board.row_range:
+            self.assertEqual({1, 2, 3, 4}, {solver.answer[line, column] for column in self.board.column_range})
+            self.assertEqual({1, 2, 3, 4}, {solver.answer[row, line] for row in self.board.row_range})
+
+    def test_solve(self):
+        """Test solving through the pool backend."""
+        solver: Solver = self.create_solver()
+        solver.solve()
+        self.assert_latin(solver)
+        self.assertIn('Optimal', solver.log)
+
+    def test_infeasible(self):
+        """Test that an infeasible model is reported."""
+        solver: Solver = self.create_solver()
+        solver.variables.choices[2][1][1].lowBound = 1  # type: ignore
+        self.pool.solve(solver)
+        self.assertEqual(SolverStatus.infeasible, solver.status)
+
+    def test_solve_all(self):
+        """Test solving several models across the workers."""
+        solvers: list[Solver] = [self.create_solver(given) for given in range(1, 5)]
+        self.pool.solve_all(solvers)
+        for given, solver in enumerate(solvers, start=1):
+            self.assert_latin(solver, given)
+
+    def test_solve_in_turn(self):
+        """Test that each worker solves model after model without keeping anything from the model before."""
+        for given in (1, 2, 3, 4, 2, 1):
+            solver: Solver = self.create_solver(given)
+            self.pool.solve(solver)
+            self.assert_latin(solver, given)
+
+    def test_time_limit(self):
+        """Test that a time limit is passed to CBC."""
+        solver: Solver = self.create_solver()
+        self.pool.solve(solver, 30)
+        self.assert_latin(solver)
+        self.assertIn('seconds was changed', solver.log)
+
+    def test_cbc_process(self):
+        """Test solving with a CBC process directly, and that a model CBC cannot read is refused."""
+        stream: StringIO = StringIO()
+        self.create_solver(3).write_mps(stream)
+        with tempfile.TemporaryDirectory() as directory:
+            model_path: Path = Path(directory) / 'model.mps'
+            model_path.write_text(stream.getvalue(), encoding='utf-8')
+            cbc: CbcProcess = CbcProcess(self.pool.path)
+            with self.assertRaises(SudokuError):
+                cbc.command()
+            cbc.start()
+            try:
+                status, values, _ = cbc.solve(model_path, None)
+                self.assertEqual(SolverStatus.optimal, status)
+                self.assertEqual(1.0, values['choices_3_1_1'])
+                with self.assertRaises(SudokuError):
+                    cbc.solve(Path(directory) / 'missing.mps', None)
+            finally:
+                cbc.stop()
+            self.assertFalse(cbc.is_alive())
+            self.assertEqual(f'CbcProcess({self.pool.path!r})', repr(cbc))
+
+    def test_check(self):
+        """Test that the health check restarts a dead worker."""
+        self.assertEqual(0, self.pool.check())
+        self.pool.workers[0].process.kill()  # type: ignore
+        self.pool.workers[0].process.join()  # type: ignore
+        self.assertEqual(1, self.pool.check())
+        self.assertTrue(all(worker.is_alive() for worker in self.pool.workers))
+
+    def test_stop_removes_directory(self):
+        """Test that stopping a worker removes its model directory."""
+        worker: PoolWorker = PoolWorker(self.pool.path)
+        worker.start()
+        directory: Path = worker.directory  # type: ignore
+        self.assertTrue(directory.is_dir())
+        worker.stop()
+        self.assertFalse(directory.exists())
+        self.assertIsNone(worker.directory)
+
+    def test_restart_on_failure(self):
+        """Test that a model sent to a dead worker is retried on a new one."""
+        for worker in self.pool.workers:
+            worker.process.kill()  # type: ignore
+            worker.process.join()  # type: ignore
+        restarts: int = self.pool.restarts
+        solver: Solver = self.create_solver()
+        self.pool.solve(solver)
+        self.assert_latin(solver)
+        self.assertEqual(restarts + 1, self.pool.restarts)
+
+    def test_worker_not_running(self):
+        """Test that a worker that is not started refuses requests."""
+        worker: PoolWorker = PoolWorker(self.pool.path)
+        with self.assertRaises(SudokuError):
+            worker.request(('ping',))
+        worker.stop()
+
+    def test_repr(self):
+        """Test the string representations."""
+        self.assertEqual('SolverPool(2)', repr(self.pool))
+        self.assertEqual('PoolBackend(SolverPool(2))', repr(PoolBackend(self.pool)))
+        self.assertEqual(f'PoolWorker({self.pool.path!r})', repr(self.pool.workers[0]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
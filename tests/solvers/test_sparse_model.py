@@ -0,0 +1,130 @@
+"""TestSparseModel."""
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from pulp import getSolver
+from pulp import LpConstraintEQ
+from pulp import LpConstraintLE
+from pulp import LpProblem
+from pulp import LpStatusOptimal
+from pulp import lpSum
+
+from src.board.board import Board
+from src.board.digits import Digits
+from src.solvers.solver import Solver
+from src.solvers.sparse_model import SparseModel
+from src.utils.coord import Coord
+from src.utils.sudoku_exception import SudokuError
+from src.utils.tags import Tags
+
+
+class TestSparseModel(unittest.TestCase):
+    """Test the SparseModel class."""
+
+    def setUp(self) -> None:
+        """Set up a 4x4 sparse solver with one digit per cell and each digit once per row and column."""
+        self.board = Board(Coord(4, 4), Digits(1, 4), Tags())
+        self.solver = Solver(self.board, 'Test', sparse=True)
+        self.model: SparseModel = self.solver.model  # type: ignore
+        for row in self.board.row_range:
+            for column in self.board.column_range:
+                self.solver.add_choice_constraint(
+                    f'Cell_{row}_{column}',
+                    [(digit, row, column) for digit in range(1, 5)],
+                    LpConstraintEQ,
+                    1,
+                )
+        for digit in range(1, 5):
+            for line in range(1, 5):
+                self.solver.add_choice_constraint(
+                    f'Row_{line}_{digit}', [(digit, line, column) for column in range(1, 5)], LpConstraintLE, 1,
+                )
+                self.solver.add_choice_constraint(
+                    f'Column_{line}_{digit}', [(digit, row, line) for row in range(1, 5)], LpConstraintLE, 1,
+                )
+
+    def test_column_ids(self):
+        """Test that the column ids of the choice and number variables match the variables."""
+        choices = self.solver.variables.choices
+        numbers = self.solver.variables.numbers
+        self.assertIs(choices[3][2][4], self.model.columns[self.model.choice(3, 2, 4)])  # type: ignore
+        self.assertIs(numbers[4][1], self.model.columns[self.model.number(4, 1)])  # type: ignore
+
+    def test_rows(self):
+        """Test that each constraint is a row of the matrix."""
+        self.assertEqual(16 + 32, self.model.row_count)
+        self.assertEqual(48 * 4, len(self.model.entry_columns))
+        self.assertEqual(len(self.model.entry_columns), len(self.model.entry_rows))
+        self.assertEqual(64, len(self.model.used()))
+
+    def test_duplicate(self):
+        """Test that a repeated constraint name raises an error."""
+        with self.assertRaises(SudokuError):
+            self.solver.add_choice_constraint('Cell_1_1', [(1, 1, 1)], LpConstraintEQ, 1)
+
+    def test_pulp_constraint(self):
+        """Test that a PuLP constraint is added as a row, with a new column for a new variable."""
+        numbers = self.solver.variables.numbers
+        extra = self.solver.variables.add('extra', 'Integer')
+        self.model += numbers[1][1] + 2 * extra >= 3, 'Extra'  # type: ignore
+        row: int = self.model.row_index['Extra']
+        self.assertEqual(3, self.model.rhs[row])
+        self.assertIn(self.model.column(extra), self.model.entry_columns)
+        self.assertEqual(len(self.model.columns) - 1, self.model.column(extra))
+
+    def test_write_lp(self):
+        """Test the LP text."""
+        stream: StringIO = StringIO()
+        self.model.write_lp(stream)
+        text: str = stream.getvalue()
+        self.assertIn('Row_1_1: + choices_1_1_1 + choices_1_1_2 + choices_1_1_3 + choices_1_1_4 <= 1\n', text)
+        self.assertIn('Binaries\nchoices_1_1_1\n', text)
+        self.assertTrue(text.endswith('End\n'))
+
+    def test_write_mps(self):
+        """Test that the MPS text reads back into PuLP and solves to a Latin square."""
+        self.solver.variables.choices[1][1][1].lowBound = 1  # type: ignore
+        with tempfile.TemporaryDirectory() as directory:
+            path: Path = Path(directory) / 'model.mps'
+            with path.open('w', encoding='utf-8') as file:
+                self.model.write_mps(file)
+            _, problem = LpProblem.fromMPS(str(path))
+        self.assertEqual(48, len(problem.constraints))
+        problem.solve(getSolver('PULP_CBC_CMD', msg=False))
+        self.assertEqual(LpStatusOptimal, problem.status)
+        values = {
+            variable.name: variable.varValue for variable in problem.variables() if variable.name.startswith('choices')
+        }
+        self.assertEqual(1, values['choices_1_1_1'])
+        self.assertEqual(16, sum(values.values()))
+
+    def test_to_pulp(self):
+        """Test that the PuLP problem matches the one built with expressions."""
+        problem: LpProblem = self.solver.lp_problem()
+        self.assertEqual(48, len(problem.constraints))
+        choices = self.solver.variables.choices
+        expected = lpSum(choices[digit][2][3] for digit in range(1, 5)) == 1  # type: ignore
+        constraint = problem.constraints['Cell_2_3']
+        self.assertEqual(dict(expected), dict(constraint))
+        self.assertEqual((expected.sense, expected.constant), (constraint.sense, constraint.constant))
+
+    def test_from_problem(self):
+        """Test that a PuLP problem streams the same LP text as the sparse model it matches."""
+        solver: Solver = Solver(self.board, 'Test')
+        for name, constraint in self.solver.lp_problem().constraints.items():
+            solver.model += constraint, name
+        expected: StringIO = StringIO()
+        self.solver.write_lp(expected)
+        actual: StringIO = StringIO()
+        solver.write_lp(actual)
+        self.assertEqual(expected.getvalue(), actual.getvalue())
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual("SparseModel('Test')", repr(self.model))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,4 +1,6 @@
 """TestCoord."""
+import copy
+import pickle
 import unittest
 
 from src.utils.coord import Coord, CoordError
@@ -22,6 +24,33 @@ class TestCoord(unittest.TestCase):
         # Assert that the hash values for different coordinates are not the same
         self.assertNotEqual(hash(coord1), hash(coord3), "Hashes should be different for different coordinates")
 
+    def test_slots(self):
+        """Test that coordinates, and the angles they hold, have no per-instance dictionary."""
+        coord = Coord(1, 2)
+        self.assertFalse(hasattr(coord, '__dict__'))
+        self.assertFalse(hasattr(coord.angle, '__dict__'))
+
+    def test_shared(self):
+        """Test that whole number coordinates are shared, and that others are not."""
+        self.assertIs(Coord(1, 2), Coord(1, 2))
+        self.assertIs(Coord(1, 2), Coord(0, 1) + Coord(1, 1))
+        self.assertIsNot(Coord(0.5, 2), Coord(0.5, 2))
+        self.assertEqual('Coord(1.0, 2.0)', repr(Coord(1.0, 2.0)))
+
+    def test_angle(self):
+        """Test that the angle is kept once worked out."""
+        coord = Coord(0.5, -7)
+        angle = coord.angle
+        self.assertIs(angle, coord.angle)
+        self.assertTrue(Coord(1, 1).parallel(Coord(2, 2)))
+
+    def test_pickle(self):
+        """Test that copying or unpickling a whole number coordinate returns the shared instance."""
+        coord = Coord(3, 4)
+        self.assertIs(coord, pickle.loads(pickle.dumps(coord)))  # noqa: S301
+        self.assertIs(coord, copy.deepcopy(coord))
+        self.assertEqual(Coord(0.5, 1), pickle.loads(pickle.dumps(Coord(0.5, 1))))  # noqa: S301
+
     def test_addition(self):
         """Test the addition of two Coord objects."""
         coord_a = Coord(2, 3)
@@ -0,0 +1,37 @@
+"""TestNameAllocator."""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utils.name_allocator import NameAllocator
+
+
+class TestNameAllocator(unittest.TestCase):
+    """Test the NameAllocator class."""
+
+    def setUp(self) -> None:
+        """Set up an allocator."""
+        self.names = NameAllocator()
+
+    def test_number(self):
+        """Test that each prefix counts from zero on its own."""
+        self.assertEqual([0, 1], [self.names.number('A'), self.names.number('A')])
+        self.assertEqual(0, self.names.number('B'))
+        self.assertEqual(0, NameAllocator().number('A'))
+
+    def test_name(self):
+        """Test that names join the prefix and the number."""
+        self.assertEqual(['Abs_0', 'Abs_1'], [self.names.name('Abs'), self.names.name('Abs')])
+
+    def test_threads(self):
+        """Test that numbers taken from several threads are all different."""
+        with ThreadPoolExecutor(4) as executor:
+            numbers: list[int] = list(executor.map(lambda _: self.names.number('A'), range(1000)))
+        self.assertEqual(set(range(1000)), set(numbers))
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual('NameAllocator()', repr(self.names))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
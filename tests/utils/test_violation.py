@@ -0,0 +1,31 @@
+"""TestViolation."""
+import unittest
+
+from src.utils.violation import Violation
+
+
+class TestViolation(unittest.TestCase):
+    """Test the Violation class."""
+
+    def setUp(self) -> None:
+        """Set up a violation."""
+        self.violation = Violation('Row_1', 'Digit 3 repeats', [(1, 2), (1, 5)])
+
+    def test_equality(self):
+        """Test that violations with the same name, text and cells are equal."""
+        self.assertEqual(Violation('Row_1', 'Digit 3 repeats', [(1, 2), (1, 5)]), self.violation)
+        self.assertNotEqual(Violation('Row_2', 'Digit 3 repeats', [(1, 2), (1, 5)]), self.violation)
+        self.assertNotEqual('Row_1', self.violation)
+        self.assertEqual(1, len({self.violation, Violation('Row_1', 'Digit 3 repeats', [(1, 2), (1, 5)])}))
+
+    def test_str(self):
+        """Test the readable description."""
+        self.assertEqual('Row_1: Digit 3 repeats', str(self.violation))
+
+    def test_repr(self):
+        """Test the string representation."""
+        self.assertEqual("Violation('Row_1', 'Digit 3 repeats', [(1, 2), (1, 5)])", repr(self.violation))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()